@@ -0,0 +1,77 @@
+"""
+Synthetic problem families of growing size.
+
+Every generator takes a size and returns a Plane together with the object
+to solve for (None for construction-only families).
+"""
+from __future__ import annotations
+import typing
+
+import sympy
+
+from geometry_solver.core.core import BaseDefinition, BaseObject
+from geometry_solver.models import polygons
+from geometry_solver.plane import Plane
+
+Generator = typing.Callable[[int], tuple[Plane, typing.Optional[BaseObject]]]
+
+
+def regular_ngon(size: int) -> tuple[Plane, BaseObject]:
+    """
+    Polygon with `size` vertices whose sides are defined one through
+    another, the first side is known.
+    """
+    plane = Plane()
+    vertices = [plane.point(plane.point_names.new_name()) for _ in range(size)]
+    polygon = polygons.Polygon(plane, vertices)
+    for prev, edge in zip(polygon.edges, polygon.edges[1:]):
+        edge.add_definition(BaseDefinition(edge, prev))
+    polygon.edges[0].set_value(sympy.Integer(1))
+    return plane, polygon.edges[-1]
+
+
+def definition_chain(size: int) -> tuple[Plane, BaseObject]:
+    """
+    `size` nested definitions x(i+1) = 2*x(i) + 1, x0 is known.
+    """
+    plane = Plane()
+    chain = [BaseObject(f"x{i}", plane) for i in range(size + 1)]
+    for prev, cur in zip(chain, chain[1:]):
+        cur.add_definition(BaseDefinition(cur, 2 * prev + 1))
+    chain[0].set_value(sympy.Integer(1))
+    return plane, chain[-1]
+
+
+def triangle_fan(size: int) -> tuple[Plane, BaseObject]:
+    """
+    `size` regular triangles sharing a common vertex and a side with their
+    neighbours, each with a circumcircle. The first circumradius is known,
+    the last one is the target.
+    """
+    plane = Plane()
+    center = plane.point("o")
+    rim = [plane.point(plane.point_names.new_name()) for _ in range(size + 1)]
+    circles = []
+    for p1, p2 in zip(rim, rim[1:]):
+        tri = polygons.RegularTriangle(plane, [center, p1, p2])
+        tri.build_circumcircle()
+        # sides of a regular triangle are equal
+        tri.edges[2].add_definition(BaseDefinition(tri.edges[2], tri.edges[0]))
+        circles.append(tri.inscribed_in)
+    circles[0].set_value(sympy.Integer(8))
+    return plane, circles[-1]
+
+
+def many_points(size: int) -> tuple[Plane, None]:
+    plane = Plane()
+    for _ in range(size):
+        plane.point(plane.point_names.new_name())
+    return plane, None
+
+
+GENERATORS: dict[str, Generator] = {
+    "regular_ngon": regular_ngon,
+    "definition_chain": definition_chain,
+    "triangle_fan": triangle_fan,
+    "many_points": many_points,
+}
@@ -0,0 +1,209 @@
+"""
+Benchmark suite over the synthetic problem families in `generators`.
+
+    PYTHONPATH=src python -m benchmarks.run -o new.json
+    PYTHONPATH=src python -m benchmarks.run --compare old.json new.json
+
+For every family and size it measures construction time, latency and
+amount of `sympy.solve` calls of the engines (`define`, `propagate` and
+`search`) and peak memory, and writes the results as JSON.
+"""
+from __future__ import annotations
+import argparse
+import contextlib
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+import typing
+
+import sympy
+
+from benchmarks import generators
+from geometry_solver.core import cache, search
+
+DEFAULT_SIZES = {
+    "regular_ngon": [10, 50, 200],
+    "definition_chain": [10, 100, 1000],
+    "triangle_fan": [5, 20, 50],
+    "many_points": [1000, 10000, 100000],
+}
+
+ENGINES = ("define", "propagate", "search")
+
+
+class SolveCounter:
+
+    def __init__(self):
+        self.calls = 0
+
+    @contextlib.contextmanager
+    def counting(self):
+        original = sympy.solve
+
+        def solve(*args, **kwargs):
+            self.calls += 1
+            return original(*args, **kwargs)
+
+        sympy.solve = solve
+        try:
+            yield self
+        finally:
+            sympy.solve = original
+
+
+def run_engine(target, engine: str) -> None:
+    if engine == "define":
+        target.define()
+    elif engine == "search":
+        search.solve(target)
+    else:
+        target.plane.propagate()
+
+
+def measure(
+        generator: generators.Generator,
+        size: int,
+        engine: str | None
+) -> dict[str, typing.Any]:
+    cache.solve_cache.clear()
+    result: dict[str, typing.Any] = {"error": None}
+    counter = SolveCounter()
+    with counter.counting():
+        start = time.perf_counter()
+        plane, target = generator(size)
+        result["construct_s"] = time.perf_counter() - start
+        result["objects"] = len(plane.objects)
+        result["construct_solves"] = counter.calls
+        if target is not None and engine is not None:
+            counter.calls = 0
+            start = time.perf_counter()
+            try:
+                run_engine(target, engine)
+            except RecursionError as error:
+                result["error"] = f"RecursionError: {error}"
+            result["solve_s"] = time.perf_counter() - start
+            result["solves"] = counter.calls
+            result["solved"] = target.is_defined()
+    return result
+
+
+def peak_memory(generator: generators.Generator, size: int) -> int:
+    cache.solve_cache.clear()
+    tracemalloc.start()
+    try:
+        generator(size)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(
+        cases: typing.Iterable[str],
+        sizes: dict[str, list[int]]
+) -> dict[str, typing.Any]:
+    results = []
+    for case in cases:
+        generator = generators.GENERATORS[case]
+        for size in sizes[case]:
+            engines: tuple[str | None, ...] = ENGINES
+            if case == "many_points":
+                engines = (None,)
+            for engine in engines:
+                entry = {"case": case, "size": size, "engine": engine}
+                entry.update(measure(generator, size, engine))
+                results.append(entry)
+                print(json.dumps(entry), file=sys.stderr)
+            memory = peak_memory(generator, size)
+            for entry in results[-len(engines):]:
+                entry["peak_memory_bytes"] = memory
+    return {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "sympy": sympy.__version__,
+        "results": results,
+    }
+
+
+def compare(old: dict[str, typing.Any], new: dict[str, typing.Any]) -> str:
+    def key(entry):
+        return entry["case"], entry["size"], entry["engine"]
+
+    old_entries = {key(entry): entry for entry in old["results"]}
+    lines = [
+        f"{'case':<18}{'size':>8}{'engine':>11}"
+        f"{'construct':>11}{'solve':>11}{'solves':>14}{'memory':>11}"
+    ]
+    for entry in new["results"]:
+        before = old_entries.get(key(entry))
+        if before is None:
+            continue
+
+        def ratio(field):
+            if before.get(field) in (None, 0) or entry.get(field) is None:
+                return "-"
+            return f"x{entry[field] / before[field]:.2f}"
+
+        solves = "-"
+        if entry.get("solves") is not None:
+            solves = f"{before.get('solves')}->{entry['solves']}"
+        lines.append(
+            f"{entry['case']:<18}{entry['size']:>8}{str(entry['engine']):>11}"
+            f"{ratio('construct_s'):>11}{ratio('solve_s'):>11}"
+            f"{solves:>14}{ratio('peak_memory_bytes'):>11}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "-o", "--output", help="file to write JSON results to (default: stdout)"
+    )
+    parser.add_argument(
+        "--case", action="append", choices=sorted(generators.GENERATORS),
+        help="family to run, can be repeated (default: all)"
+    )
+    parser.add_argument(
+        "--sizes", help="comma separated sizes overriding the defaults"
+    )
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("OLD", "NEW"),
+        help="print ratios between two result files instead of running"
+    )
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        old, new = (json.load(open(path)) for path in args.compare)
+        print(compare(old, new))
+        return 0
+
+    cases = args.case or list(generators.GENERATORS)
+    sizes = dict(DEFAULT_SIZES)
+    if args.sizes:
+        override = [int(size) for size in args.sizes.split(",")]
+        sizes = {case: override for case in cases}
+    report = run(cases, sizes)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+Cold start times of short-lived solver processes.
+
+    PYTHONPATH=src python -m benchmarks.startup -o startup.json
+
+Every stage runs in fresh interpreters and is timed from inside the
+process, so interpreter startup itself is not counted. The heavy
+dependencies each stage ended up importing are reported too.
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import typing
+
+STAGES = {
+    "import": "import geometry_solver",
+    "plane": "import geometry_solver\ngeometry_solver.Plane()",
+    "first_object": (
+        "import geometry_solver\n"
+        "geometry_solver.Plane().point('a')"
+    ),
+    "mvp": (
+        "import geometry_solver\n"
+        "plane = geometry_solver.Plane()\n"
+        "tri = geometry_solver.RegularTriangle(\n"
+        "    plane, [plane.point(name) for name in 'abc'])\n"
+        "tri.build_circumcircle(radius=8)\n"
+        "tri.get_side().define()"
+    ),
+}
+
+HEAVY_MODULES = ("sympy", "numpy", "sqlite3", "asyncio", "multiprocessing")
+
+_TEMPLATE = """
+import sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(elapsed, *[name for name in {heavy!r} if name in sys.modules])
+"""
+
+
+def measure(code: str, runs: int) -> dict[str, typing.Any]:
+    script = _TEMPLATE.format(code=code, heavy=HEAVY_MODULES)
+    times = []
+    loaded: list[str] = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True, text=True, check=True, env=dict(os.environ)
+        ).stdout.split()
+        times.append(float(output[0]) * 1000)
+        loaded = output[1:]
+    return {
+        "min_ms": min(times),
+        "median_ms": statistics.median(times),
+        "imports": loaded,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "-o", "--output", help="file to write JSON results to (default: stdout)"
+    )
+    parser.add_argument(
+        "-n", "--runs", type=int, default=10,
+        help="fresh processes per stage (default: 10)"
+    )
+    parser.add_argument(
+        "--stage", action="append", choices=sorted(STAGES),
+        help="stage to run, can be repeated (default: all)"
+    )
+    args = parser.parse_args(argv)
+
+    report = {}
+    for stage in args.stage or list(STAGES):
+        report[stage] = measure(STAGES[stage], args.runs)
+        print(stage, json.dumps(report[stage]), file=sys.stderr)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
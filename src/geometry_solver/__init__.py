@@ -0,0 +1,53 @@
+"""
+Solver of geometry problems.
+
+    from geometry_solver import Plane, RegularTriangle
+
+    plane = Plane()
+    tri = RegularTriangle(plane, [plane.point(name) for name in "abc"])
+
+Names are imported on first access, so `import geometry_solver` and
+building a Plane stay cheap: sympy is loaded with the first geometric
+object, numpy only by the numeric parts.
+"""
+from __future__ import annotations
+import importlib
+import typing
+
+# public name -> module defining it
+_API = {
+    "Plane": "geometry_solver.plane",
+    "Point": "geometry_solver.models.basic_objects",
+    "LineSegment": "geometry_solver.models.basic_objects",
+    "Angle": "geometry_solver.models.basic_objects",
+    "Circle": "geometry_solver.models.circle",
+    "Polygon": "geometry_solver.models.polygons",
+    "Triangle": "geometry_solver.models.polygons",
+    "RegularTriangle": "geometry_solver.models.polygons",
+    "Problem": "geometry_solver.problems",
+    "solve_spec": "geometry_solver.problems",
+    "FormulaCache": "geometry_solver.formulas",
+}
+
+__all__ = sorted(_API)
+
+if typing.TYPE_CHECKING:
+    from geometry_solver.formulas import FormulaCache
+    from geometry_solver.models.basic_objects import Angle, LineSegment, Point
+    from geometry_solver.models.circle import Circle
+    from geometry_solver.models.polygons import Polygon, RegularTriangle, Triangle
+    from geometry_solver.plane import Plane
+    from geometry_solver.problems import Problem, solve_spec
+
+
+def __getattr__(name: str) -> typing.Any:
+    module = _API.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
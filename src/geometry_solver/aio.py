@@ -0,0 +1,173 @@
+"""
+asyncio API for solving with deadlines.
+
+    result = await aio.solve_async(plane, tri.get_side(), timeout=2)
+    if result.timed_out:
+        print("determined so far:", result.determined)
+
+The solve runs in a forked worker process, so a runaway `sympy.solve` can
+be stopped for real: the worker is killed on timeout or cancellation.
+Values the worker determines are streamed back as they appear and set on
+the objects of the caller's Plane, so a timed out solve still returns
+everything found until the deadline. Requires the `fork` start method
+(Linux, macOS).
+"""
+from __future__ import annotations
+import asyncio
+import multiprocessing
+import time
+import typing
+
+import sympy
+
+from geometry_solver.core import core, search
+if typing.TYPE_CHECKING:
+    from geometry_solver.plane import Plane
+
+Engine = typing.Callable[["Plane", "core.BaseObject"], typing.Any]
+
+ENGINES: dict[str, Engine] = {
+    "define": lambda plane, target: target.define(),
+    "propagate": lambda plane, target: plane.propagate(),
+    "solve_all": lambda plane, target: plane.solve_all(),
+    "search": lambda plane, target: search.solve(target),
+}
+
+# (object index, definition index) within `plane.objects`
+DefinitionRef = typing.Optional[tuple[int, int]]
+
+
+class SolveResult:
+    """
+    Attributes:
+        target (core.BaseObject): The object that was solved for.
+        determined (dict[core.BaseObject, sympy.Expr]): Values determined by
+        the worker, whether or not the deadline was met.
+        timed_out (bool): Whether the worker was stopped by the deadline.
+        error (str | None): Exception raised in the worker, if any.
+        elapsed (float): Wall time in seconds.
+    """
+
+    def __init__(self, target: "core.BaseObject"):
+        self.target = target
+        self.determined: dict[core.BaseObject, sympy.Expr] = {}
+        self.timed_out = False
+        self.error: str | None = None
+        self.elapsed = 0.0
+
+    @property
+    def value(self) -> sympy.Expr | None:
+        return self.target.value
+
+    @property
+    def solved(self) -> bool:
+        return self.target.is_defined()
+
+    def __str__(self):
+        status = "timed out" if self.timed_out else "done"
+        return f"SolveResult({self.target}, {status}, {len(self.determined)} determined)"
+
+
+def _worker(
+        plane: "Plane",
+        target_index: int,
+        engine: Engine,
+        connection
+):
+    index = {obj: i for i, obj in enumerate(plane.objects)}
+
+    def definition_ref(obj: core.BaseObject) -> DefinitionRef:
+        derivation = obj.derivation
+        if derivation is None or derivation.target not in index:
+            return None
+        definitions = derivation.target.definitions
+        if derivation not in definitions:
+            return None
+        return index[derivation.target], definitions.index(derivation)
+
+    def send_value(obj: core.BaseObject):
+        # objects created by the worker can't be matched in the caller
+        if obj in index and obj.value is not None:
+            connection.send(("value", index[obj], obj.value, definition_ref(obj)))
+
+    plane.value_listeners.append(send_value)
+    try:
+        engine(plane, plane.objects[target_index])
+        connection.send(("done",))
+    except BaseException as error:
+        connection.send(("error", f"{type(error).__name__}: {error}"))
+    finally:
+        connection.close()
+
+
+async def solve_async(
+        plane: "Plane",
+        target: "core.BaseObject",
+        timeout: float | None = None,
+        engine: str | Engine = "define"
+) -> SolveResult:
+    """
+    Solve for `target` in an isolated worker process.
+
+    Args:
+        timeout (float | None): Hard deadline in seconds.
+        engine (str | Engine): "define", "propagate", "solve_all", "search"
+        or a callable taking the plane and the target.
+
+    Returns:
+        SolveResult: Determined values are also set on the plane's objects.
+    """
+    run = ENGINES[engine] if isinstance(engine, str) else engine
+    result = SolveResult(target)
+    loop = asyncio.get_running_loop()
+    start = time.perf_counter()
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_worker,
+        args=(plane, plane.objects.index(target), run, sender),
+        daemon=True
+    )
+    messages: asyncio.Queue[tuple] = asyncio.Queue()
+
+    def on_readable():
+        try:
+            while receiver.poll():
+                messages.put_nowait(receiver.recv())
+        except (EOFError, OSError):
+            loop.remove_reader(receiver.fileno())
+            messages.put_nowait(("error", "worker exited unexpectedly"))
+
+    process.start()
+    sender.close()
+    loop.add_reader(receiver.fileno(), on_readable)
+    deadline = None if timeout is None else loop.time() + timeout
+    try:
+        while True:
+            remaining = None if deadline is None else deadline - loop.time()
+            try:
+                message = await asyncio.wait_for(messages.get(), remaining)
+            except asyncio.TimeoutError:
+                result.timed_out = True
+                break
+            if message[0] == "value":
+                _, obj_index, value, ref = message
+                obj = plane.objects[obj_index]
+                derivation = None
+                if ref is not None:
+                    derivation = plane.objects[ref[0]].definitions[ref[1]]
+                if obj.value != value:
+                    obj.set_value(value, derivation=derivation)
+                result.determined[obj] = value
+                continue
+            if message[0] == "error":
+                result.error = message[1]
+            break
+    finally:
+        loop.remove_reader(receiver.fileno())
+        if process.is_alive():
+            process.kill()
+        process.join()
+        receiver.close()
+        result.elapsed = time.perf_counter() - start
+    return result
@@ -0,0 +1,123 @@
+"""
+Command line entry point: solve a JSONL stream of problem specs.
+
+    geometry_solver problems.jsonl -j 8 > results.jsonl
+
+Each input line is a spec as described in `geometry_solver.problems`,
+each output line is the result for the input line with the same number.
+"""
+from __future__ import annotations
+import argparse
+import collections
+import concurrent.futures
+import json
+import os
+import sys
+import typing
+
+from geometry_solver import problems
+from geometry_solver.formulas import FormulaCache
+
+# one cache (and sqlite connection) per process and path
+_formula_caches: dict[str, FormulaCache] = {}
+
+
+def solve_line(
+        line: str,
+        engine: str = "define",
+        formula_cache: str | None = None
+) -> dict[str, typing.Any]:
+    try:
+        spec = json.loads(line)
+    except json.JSONDecodeError as error:
+        return {
+            "id": None, "value": None, "numeric": None,
+            "error": f"JSONDecodeError: {error}", "elapsed_ms": 0.0
+        }
+    formulas = None
+    if formula_cache is not None:
+        formulas = _formula_caches.get(formula_cache)
+        if formulas is None:
+            formulas = _formula_caches[formula_cache] = FormulaCache(formula_cache)
+    return problems.solve_spec(spec, engine, formulas)
+
+
+def solve_lines(
+        lines: typing.Iterable[str],
+        jobs: int = 1,
+        engine: str = "define",
+        window: int | None = None,
+        formula_cache: str | None = None
+) -> typing.Iterator[dict[str, typing.Any]]:
+    """
+    Solve specs in a pool of `jobs` processes, yielding results in input order.
+
+    At most `window` problems are in flight at once, so arbitrarily long
+    streams are handled in constant memory. With `formula_cache`, a path
+    to a sqlite file, formulas are shared between the processes and runs.
+    """
+    lines = (line for line in lines if line.strip())
+    if jobs <= 1:
+        for line in lines:
+            yield solve_line(line, engine, formula_cache)
+        return
+    window = window or jobs * 4
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        in_flight: collections.deque[concurrent.futures.Future] = collections.deque()
+        for line in lines:
+            in_flight.append(executor.submit(solve_line, line, engine, formula_cache))
+            if len(in_flight) >= window:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="geometry_solver",
+        description="Solve geometry problems given as JSON lines."
+    )
+    parser.add_argument(
+        "input", nargs="?", default="-",
+        help="JSONL file with problem specs, '-' for stdin (default)"
+    )
+    parser.add_argument(
+        "-o", "--output", default="-",
+        help="file to write JSONL results to, '-' for stdout (default)"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count() or 1,
+        help="number of worker processes (default: number of CPUs)"
+    )
+    parser.add_argument(
+        "--engine", choices=problems.ENGINES, default="define",
+        help="define: recursive search from the target, "
+             "propagate: forward propagation over the whole Plane, "
+             "search: cheapest derivation chain first"
+    )
+    parser.add_argument(
+        "--formula-cache", metavar="PATH",
+        help="sqlite file to reuse formulas of problems with the same "
+             "structure from, across runs (default: no cache)"
+    )
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input)
+    sink = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        for result in solve_lines(
+            source, jobs=args.jobs, engine=args.engine,
+            formula_cache=args.formula_cache
+        ):
+            sink.write(json.dumps(result) + "\n")
+            sink.flush()
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+from __future__ import annotations
+import collections
+import os
+import time
+import typing
+
+import sympy
+
+
+class SolveCache:
+    """
+    LRU cache for `sympy.solve` results.
+
+    Equations are keyed by their structure: every free symbol is replaced
+    by a positional placeholder before hashing, so two definitions that only
+    differ in which objects they talk about (e.g. `R = a/sqrt(3)` of two
+    different regular triangles) share one entry.
+
+    Attributes:
+        maxsize (int): Maximum amount of stored entries.
+        enabled (bool): If False, every call goes straight to `sympy.solve`.
+        hits (int): Amount of lookups answered from the cache.
+        misses (int): Amount of lookups that had to call `sympy.solve`.
+    """
+
+    def __init__(self, maxsize: int = 1024, enabled: bool = True):
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._entries: collections.OrderedDict[str, list[sympy.Expr]] = (
+            collections.OrderedDict()
+        )
+        # seconds `sympy.solve` took for the stored entries
+        self._costs: dict[str, float] = {}
+
+    def solve(self, equation: sympy.Expr, target: sympy.Symbol) -> list[sympy.Expr]:
+        if not self.enabled:
+            return sympy.solve(equation, target)
+        equation = as_expression(equation)
+        key, placeholders = canonicalize(equation, target)
+        solutions = self._entries.get(key)
+        if solutions is None:
+            self.misses += 1
+            abstract_equation = equation.xreplace(placeholders)
+            start = time.perf_counter()
+            solutions = sympy.solve(abstract_equation, placeholders[target])
+            self._entries[key] = solutions
+            self._costs[key] = time.perf_counter() - start
+            if len(self._entries) > self.maxsize:
+                evicted, _ = self._entries.popitem(last=False)
+                del self._costs[evicted]
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        inverse = {placeholder: obj for obj, placeholder in placeholders.items()}
+        return [solution.xreplace(inverse) for solution in solutions]
+
+    def cost(self, equation: sympy.Expr, target: sympy.Symbol) -> float | None:
+        """
+        Seconds solving the equation took when it was cached, None if it
+        isn't cached (then solving it would call `sympy.solve`).
+        """
+        if not self.enabled:
+            return None
+        return self._costs.get(canonicalize(as_expression(equation), target)[0])
+
+    def mean_cost(self) -> float | None:
+        """
+        Average seconds of the `sympy.solve` calls behind stored entries,
+        None if there are none.
+        """
+        if not self._costs:
+            return None
+        return sum(self._costs.values()) / len(self._costs)
+
+    def clear(self):
+        self._entries.clear()
+        self._costs.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def as_expression(equation: sympy.Expr) -> sympy.Expr:
+    """
+    `lhs = rhs` as `lhs - rhs`, so both forms of an equation share a key.
+    """
+    if isinstance(equation, sympy.Equality):
+        return equation.lhs - equation.rhs
+    return equation
+
+
+def canonicalize(
+        equation: sympy.Expr,
+        target: sympy.Symbol
+) -> tuple[str, dict[sympy.Symbol, sympy.Symbol]]:
+    """
+    Replace the target with `_t` and other symbols with `_v0`, `_v1`, ...
+    in order of their first appearance. Placeholders keep the assumptions
+    of the symbols, which are part of the key and let `sympy.solve` drop
+    roots outside their domain.
+
+    Returns:
+        tuple[str, dict]: Structural key and mapping from the original
+        symbols to their placeholders.
+    """
+    placeholders: dict[sympy.Symbol, sympy.Symbol] = {
+        target: sympy.Symbol("_t", **target._assumptions_orig)
+    }
+    for node in sympy.preorder_traversal(equation):
+        if isinstance(node, sympy.Symbol) and node not in placeholders:
+            placeholders[node] = sympy.Symbol(
+                f"_v{len(placeholders) - 1}", **node._assumptions_orig
+            )
+    key = sympy.srepr(equation.xreplace(placeholders))
+    return key, placeholders
+
+
+solve_cache = SolveCache(
+    enabled=not os.environ.get("GEOMETRY_SOLVER_DISABLE_SOLVE_CACHE")
+)
+
+
+def cached_solve(equation: sympy.Expr, target: sympy.Symbol) -> list[typing.Any]:
+    return solve_cache.solve(equation, target)
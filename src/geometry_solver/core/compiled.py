@@ -0,0 +1,103 @@
+from __future__ import annotations
+import typing
+
+import sympy
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+
+    from geometry_solver.core import core
+
+
+class CompiledDerivation:
+    """
+    A solved derivation turned into a NumPy function of its inputs.
+
+    Call it with arrays (or scalars) for the inputs, either positionally in
+    the order of `inputs` or by object name, e.g.
+    `tri.get_side().compile()(oabc=np.linspace(1, 10, 10**6))`.
+
+    Attributes:
+        inputs (list[core.BaseObject]): Given objects the result depends on.
+        expression (sympy.Expr): Closed form of the result over `inputs`.
+    """
+
+    def __init__(
+            self,
+            expression: sympy.Expr,
+            inputs: typing.Sequence["core.BaseObject"]
+    ):
+        self.expression = expression
+        self.inputs = list(inputs)
+        self._function = sympy.lambdify(
+            self.inputs, expression, modules="numpy", dummify=True
+        )
+
+    def __call__(self, *args, **kwargs) -> np.ndarray:
+        import numpy as np
+
+        if kwargs:
+            by_name = {obj.name: obj for obj in self.inputs}
+            unknown = set(kwargs) - set(by_name)
+            if unknown:
+                raise TypeError(f"Unknown inputs: {sorted(unknown)}")
+            args = args + tuple(
+                kwargs[obj.name] for obj in self.inputs[len(args):]
+            )
+        if len(args) != len(self.inputs):
+            raise TypeError(
+                f"Expected {len(self.inputs)} inputs, got {len(args)}"
+            )
+        arrays = [np.asarray(arg, dtype=float) for arg in args]
+        result = np.asarray(self._function(*arrays), dtype=float)
+        # inputs that cancelled out still define the shape of the result
+        return np.broadcast_arrays(result, *arrays)[0]
+
+    def __str__(self):
+        names = ", ".join(obj.name for obj in self.inputs)
+        return f"CompiledDerivation(({names}) -> {self.expression})"
+
+
+def closed_form(
+        expression: sympy.Expr,
+        objects: typing.Iterable["core.BaseObject"]
+) -> sympy.Expr:
+    """
+    Replace every derived object in `expression` with the expression it was
+    derived from, recursively, until only given objects remain.
+    """
+    forms: dict[core.BaseObject, sympy.Expr] = {}
+    # iterative post-order walk, derivation chains can be long
+    stack = [(obj, False) for obj in objects]
+    while stack:
+        obj, expanded = stack.pop()
+        if obj in forms:
+            continue
+        derivation = obj.derivation
+        if derivation is None:
+            forms[obj] = obj
+        elif expanded:
+            forms[obj] = derivation.solved_expression().xreplace(
+                {var: forms[var] for var in derivation.depends_on}
+            )
+        else:
+            stack.append((obj, True))
+            stack.extend(
+                (var, False) for var in derivation.depends_on
+                if var not in forms
+            )
+    return expression.xreplace(forms)
+
+
+def compile_expression(
+        expression: sympy.Expr,
+        inputs: typing.Sequence["core.BaseObject"] | None = None
+) -> CompiledDerivation:
+    from geometry_solver.core import core
+
+    if inputs is None:
+        inputs = sorted(
+            core.get_objects_from_expression(expression),
+            key=lambda obj: obj.name
+        )
+    return CompiledDerivation(expression, inputs)
@@ -1,49 +1,104 @@
 from __future__ import annotations
+import functools
+import itertools
 import typing
-import uuid
 if typing.TYPE_CHECKING:
     from geometry_solver import plane
 
 import sympy
 import sympy.core
 
+from geometry_solver.core import cache, compiled, relations, tracing, values as exact_values
+
+# at most this many combinations of the inputs' candidate values are tried
+MAX_COMBINATIONS = 64
+
+# identities and relations of objects that don't belong to any plane
+_planeless_ids = itertools.count()
+_planeless_relations = relations.RelationGraph()
+
+
+@functools.cache
+def _symbol_assumptions(cls: type[BaseObject]) -> tuple[typing.Any, dict, tuple]:
+    # what sympy derives from the assumptions of a class, once per class
+    template = sympy.Symbol.__xnew__(sympy.Symbol, "", **cls.assumptions)
+    return template._assumptions, template._assumptions_orig, template._assumptions0
+
+
+def relation_graph(obj: BaseObject) -> relations.RelationGraph:
+    return obj.plane.relations if obj.plane is not None else _planeless_relations
+
+
 class RelationSetter:
+    __slots__ = ("obj",)
 
     def __init__(self, obj: BaseObject):
 
         self.obj = obj
     def __eq__(self, other: BaseObject): # type: ignore[override] # why only here though?
-        self.obj.relations.update(other.relations)
-        other.relations = self.obj.relations
-        self.obj.value = other.value
-        self.obj.relations["eq"].append(other)
+        graph = relation_graph(self.obj)
+        graph.union(self.obj, other)
+        known = self.obj if self.obj.is_defined() else other
+        if known.is_defined():
+            for member in graph.members(known):
+                if not member.is_defined():
+                    member.set_value(known.value, candidates=known.candidates)
 
     def __lt__(self, other: BaseObject):
-        self.obj.relations["lt"].append(other)
+        relation_graph(self.obj).add_order(self.obj, other, strict=True)
 
     def __le__(self, other: BaseObject):
-        self.obj.relations["lt"].append(other)
+        relation_graph(self.obj).add_order(self.obj, other, strict=False)
 
     def __gt__(self, other: BaseObject):
-        self.obj.relations["lt"].append(other)
+        relation_graph(self.obj).add_order(other, self.obj, strict=True)
 
     def __ge__(self, other: BaseObject):
-        self.obj.relations["lt"].append(other)
+        relation_graph(self.obj).add_order(other, self.obj, strict=False)
 
     def __contains__(self, other: BaseObject):
-        return self.obj.relations["contains"].append(other)
+        return self.append("contains", other)
+
+    def append(self, kind: str, other: BaseObject):
+        plane = self.obj.plane
+        if plane is not None and self.obj._relations is None:
+            plane.journal_attribute(self.obj, "_relations")
+        objects = self.obj.relations[kind]
+        objects.append(other)
+        if plane is not None:
+            plane.journal(list.pop, objects)
 
 class BaseObject(sympy.Symbol):
     """
     Base class that offers basic operations like greater/less comparison. 
     This object imitates a variable, whose value can be unknown.
+
+    Objects are compared and hashed by `uid`, a pair of the plane's serial
+    and a counter allocated by that plane, so `name` is only used for
+    printing. Relations and definitions are created on first use.
+
+    Subclasses describe their domain with `assumptions`, sympy assumptions
+    of the symbol (e.g. lengths are positive), and `upper_bound`, an
+    exclusive bound sympy can't express. Solutions outside the domain are
+    dropped, and when several values remain all of them are kept in
+    `candidates`.
     """
-    # XXX: this initialization is NOT fine. how to make it properly?
+    __slots__ = (
+        "plane", "value", "derivation", "root", "candidates", "uid",
+        "_relations", "_definitions"
+    )
+    assumptions: typing.ClassVar[dict[str, bool]] = {}
+    upper_bound: typing.ClassVar[int | None] = None
+
     def __new__(
             cls, 
             *args, **kwargs
         ):
-        return super().__new__(cls, str(uuid.uuid1()))
+        # bypass sympy's symbol cache: every object is a new variable
+        obj = sympy.Expr.__new__(cls)
+        obj.name = ""
+        obj._assumptions, obj._assumptions_orig, obj._assumptions0 = _symbol_assumptions(cls)
+        return obj
     
     def __init__(
             self, 
@@ -54,53 +109,90 @@ class BaseObject(sympy.Symbol):
         ):
         self.name = name
         self.plane = plane
-        self.relations: dict[str, list[BaseObject]] = {
-            "gt": [], "ge": [], "lt": [], "le": [], "eq": [], "contains": []
-        }
-        self.value: sympy.Expr | sympy.Float | None = (
-            sympy.Float(value) if value is not None else None
-        )
-        if definitions:
-            self.definitions = definitions
+        if plane is not None:
+            self.uid = plane.allocate_uid()
+            plane.add_object(self)
         else:
-            self.definitions = []
-        
-        self.as_new_relation = RelationSetter(self)
+            self.uid = (0, next(_planeless_ids))
+        self._relations: dict[str, list[BaseObject]] | None = None
+        self._definitions: list[BaseDefinition] | None = None
+        self.value: sympy.Expr | exact_values.Radical | None = (
+            exact_values.exact(value) if value is not None else None
+        )
+        # definition the value was derived from, None for given values
+        self.derivation: BaseDefinition | None = None
+        # solution of the derivation the value was computed from
+        self.root: sympy.Expr | None = None
+        # every admissible value when there are several, `value` first
+        self.candidates: tuple[sympy.Expr, ...] | None = None
+        for definition in definitions or []:
+            self.add_definition(definition, reverse_definitions=False)
+
+    def _hashable_content(self):
+        return (self.uid,) + self._assumptions0
+
+    @property
+    def relations(self) -> dict[str, list[BaseObject]]:
+        if self._relations is None:
+            # equality and order live in the plane's relation graph
+            self._relations = {"contains": []}
+        return self._relations
+
+    @relations.setter
+    def relations(self, relations: dict[str, list[BaseObject]]):
+        self._relations = relations
+
+    @property
+    def definitions(self) -> list[BaseDefinition]:
+        if self._definitions is None:
+            self._definitions = []
+        return self._definitions
+
+    @property
+    def as_new_relation(self) -> RelationSetter:
+        return RelationSetter(self)
 
     
+    def _compare(self, other: BaseObject) -> str | None:
+        return relation_graph(self).compare(self, other)
+
     def __lt__(self, other) -> bool | None:
         if not isinstance(other, BaseObject):
             return super().__lt__(other)
-        if other.value in self.relations["lt"]:
+        known = self._compare(other)
+        if known == relations.LT:
             return True
-        elif other.value in self.relations["ge"]:
+        elif known in (relations.EQ, relations.GE, relations.GT):
             return False
         return None
 
     def __le__(self, other) -> bool | None:
         if not isinstance(other, BaseObject):
-            return super().__lt__(other)
-        if other.value in self.relations["le"]:
+            return super().__le__(other)
+        known = self._compare(other)
+        if known in (relations.LT, relations.LE, relations.EQ):
             return True
-        elif other.value in self.relations["gt"]:
+        elif known == relations.GT:
             return False
         return None
 
     def __gt__(self, other) -> bool | None:
         if not isinstance(other, BaseObject):
-            return super().__lt__(other)
-        if other.value in self.relations["gt"]:
+            return super().__gt__(other)
+        known = self._compare(other)
+        if known == relations.GT:
             return True
-        elif other.value in self.relations["le"]:
+        elif known in (relations.EQ, relations.LE, relations.LT):
             return False
         return None
 
     def __ge__(self, other) -> bool | None:
         if not isinstance(other, BaseObject):
-            return super().__lt__(other)
-        if other.value in self.relations["ge"]:
+            return super().__ge__(other)
+        known = self._compare(other)
+        if known in (relations.GT, relations.GE, relations.EQ):
             return True
-        elif other.value in self.relations["lt"]:
+        elif known == relations.LT:
             return False
         return None
     
@@ -108,28 +200,103 @@ class BaseObject(sympy.Symbol):
         return other in self.relations["contains"]
     
 
-    def set_value(self, value: sympy.Expr):
+    def set_value(
+            self,
+            value: sympy.Expr,
+            derivation: "BaseDefinition | None" = None,
+            candidates: typing.Sequence[sympy.Expr] | None = None,
+            root: sympy.Expr | None = None
+        ):
+        if self.plane is not None and self.plane.trail is not None:
+            self.plane.journal_attribute(self, "value")
+            self.plane.journal_attribute(self, "derivation")
+            self.plane.journal_attribute(self, "root")
+            self.plane.journal_attribute(self, "candidates")
+        if not isinstance(value, (sympy.Basic, exact_values.Radical)):
+            value = exact_values.exact(value)
         self.value = value
+        self.derivation = derivation
+        self.root = root
+        self.candidates = (
+            tuple(candidates) if candidates is not None and len(candidates) > 1
+            else None
+        )
+        if self.plane is not None:
+            self.plane.value_changed(self)
     
 
     # basically, the idea of the project
+    @tracing.traced("BaseObject.define", lambda obj: (obj, None, obj))
     def define(self):
-        for definition in self.definitions:
+        if not self._definitions:
+            return None
+        for definition in self._definitions:
             result = definition.define()
-            if result is not None and is_expression_constant(result):
-                self.set_value(expression_as_constant(result))
-
+            # no admissible root for these inputs, try the next one
+            if result is not None and definition.assign():
                 return result
             
     def add_definition(self, definition: "BaseDefinition", reverse_definitions: bool = True):
+        if self.plane is not None:
+            if self._definitions is None:
+                self.plane.journal_attribute(self, "_definitions")
+            else:
+                self.plane.journal(list.pop, self._definitions)
         self.definitions.append(definition)
+        if self.plane is not None:
+            self.plane.index_definition(definition)
         if reverse_definitions:
             assign_reexpressed_definitions(
                 right_expression=definition.expression,
-                target=self
+                target=self,
+                source=definition
             )
     def is_defined(self):
         return self.value is not None
+
+    def possible_values(self) -> tuple[sympy.Expr, ...]:
+        if self.candidates is not None:
+            return self.candidates
+        return (self.value,)
+
+    def admissible(self, value: sympy.Expr) -> bool:
+        """
+        False if `value` is known to be outside the domain of this object,
+        True if it is inside or can't be decided.
+        """
+        if isinstance(value, exact_values.Radical):
+            sign = value.sign()
+            return (
+                (not self.is_positive or sign > 0)
+                and (self.upper_bound is None or value < self.upper_bound)
+            )
+        value = sympy.sympify(value)
+        if self.is_real and value.is_extended_real is False:
+            return False
+        if self.is_positive and value.is_positive is False:
+            return False
+        if self.upper_bound is not None and (value - self.upper_bound).is_negative is False:
+            return False
+        return True
+
+    def closed_form(self) -> sympy.Expr:
+        """
+        Expression of this object over the given (not derived) objects
+        its value was derived from.
+        """
+        return compiled.closed_form(self, (self,))
+
+    def compile(
+            self,
+            inputs: typing.Sequence[BaseObject] | None = None
+        ) -> "compiled.CompiledDerivation":
+        """
+        Turn the derivation of this object into a NumPy function of its
+        inputs, defining the object first if needed.
+        """
+        if self.derivation is None and not self.is_defined():
+            self.define()
+        return compiled.compile_expression(self.closed_form(), inputs)
     
     def __str__(self):
         ret = self.name
@@ -139,43 +306,162 @@ class BaseObject(sympy.Symbol):
 
 # TODO: allow reverse definitions and simplifications like back in sympy
 class BaseDefinition:
+    """
+    Defines `target` as `expression`.
+
+    Attributes:
+        objects (frozenset[BaseObject]): Objects the expression is built of,
+        collected once on creation.
+        depends_on (frozenset[BaseObject]): `objects` without the target.
+        dirty (bool): Whether any of `depends_on` changed its value since
+        the last `define` attempt.
+        source (BaseDefinition | None): For reverse definitions, the
+        definition they were re-expressed from.
+    """
 
     def __init__(
             self, 
             target: BaseObject,
             expression: sympy.Expr,
+            source: BaseDefinition | None = None
         ):       
 
         self.target = target
         self.expression = expression
+        self.source = source
+        self.objects = frozenset(get_objects_from_expression(expression))
+        self.depends_on = self.objects - {target}
+        self.dirty = True
         self._is_tried = False
-        self.build_equation()
+        self._equation: sympy.Eq | None = None
 
-    # TODO: deal with sets that contain more than one element,
-    # e.g. when colving quadratic eqs
+    @tracing.traced(
+        "BaseDefinition.define",
+        lambda definition: (definition.target, definition.equation, definition)
+    )
     def define(self) -> typing.Any | None:
         # avoid circular definition attempts
         if self.tried:
             return None
         self.tried = True
-        result = sympy.solve(self.equation, self.target)[0]
-        if is_expression_constant(result): 
-            return result
-        depends_on = set(get_objects_from_expression(self.expression))
-        depends_on -= set((self.target,))
-        for dependent in depends_on:
-            dependent.define()
-
-        # attempt again, if anything was defined
-        self.build_equation()
-        result = sympy.solve(self.equation, self.target)[0]
-        self.tried = False
-        if is_expression_constant(result):
-            return result
-        return None
+        try:
+            self.set_dirty(False)
+            solutions = self.solutions()
+            if not solutions:
+                return None
+            result = solutions[0]
+            if self.is_constant(): 
+                return result
+            for dependent in self.depends_on:
+                dependent.define()
+
+            # attempt again, if the inputs got defined
+            if self.is_constant():
+                return result
+            return None
+        finally:
+            # only guards the recursion, so a rolled back plane can retry
+            self.tried = False
+
+    def set_dirty(self, dirty: bool):
+        plane = self.target.plane
+        if plane is not None and self.dirty != dirty:
+            plane.journal_attribute(self, "dirty")
+        self.dirty = dirty
+
+    def is_constant(self) -> bool:
+        return all(var.is_defined() for var in self.depends_on)
+
+    def needs_solve(self) -> bool:
+        """
+        Whether the expression of the target has to be found with
+        `sympy.solve`.
+        """
+        return self.target in self.objects
+
+    def solutions(self) -> list[sympy.Expr]:
+        """
+        Expressions of the target over `depends_on` that are admissible,
+        the whole expression if the target isn't part of it.
+        """
+        if self.target not in self.objects:
+            return [self.expression]
+        return [
+            solution for solution in cache.cached_solve(self.equation, self.target)
+            if self.target.admissible(solution)
+        ]
+
+    def solved_expression(self) -> sympy.Expr | None:
+        """
+        The solution the target's value was computed from, if it was by
+        this definition, else the first admissible one, None if there is
+        none.
+        """
+        if self.target.derivation is self and self.target.root is not None:
+            return self.target.root
+        solutions = self.solutions()
+        return solutions[0] if solutions else None
+
+    def evaluate(self) -> list[tuple[sympy.Expr, sympy.Expr]]:
+        """
+        Admissible values of the target for every combination of the
+        candidate values of `depends_on`, the one from their values first,
+        each with the solution it was computed from.
+        """
+        inputs = sorted(self.depends_on, key=lambda obj: obj.uid)
+        if not all(var.is_defined() for var in inputs):
+            return []
+        combinations = itertools.islice(
+            itertools.product(*(var.possible_values() for var in inputs)),
+            MAX_COMBINATIONS
+        )
+        values: list[tuple[sympy.Expr, sympy.Expr]] = []
+        solutions = self.solutions()
+        for combination in combinations:
+            substitution = dict(zip(inputs, combination))
+            for solution in solutions:
+                value = expression_as_constant(solution, inputs, substitution)
+                if all(value != known for known, _ in values) \
+                and self.target.admissible(value):
+                    values.append((value, solution))
+        return values
+
+    def assign(self) -> bool:
+        """
+        Set the target to its admissible values, see `evaluate`.
+
+        Returns:
+            bool: False if there are none.
+        """
+        values = self.evaluate()
+        if not values:
+            return False
+        self.target.set_value(
+            values[0][0], derivation=self,
+            candidates=[value for value, _ in values], root=values[0][1]
+        )
+        return True
+
+    def closed_form(self) -> sympy.Expr:
+        expression = self.solved_expression()
+        if expression is None:
+            raise ValueError(f"{self} has no admissible solution")
+        return compiled.closed_form(expression, self.depends_on)
+
+    def compile(
+            self,
+            inputs: typing.Sequence[BaseObject] | None = None
+        ) -> "compiled.CompiledDerivation":
+        return compiled.compile_expression(self.closed_form(), inputs)
+
+    @property
+    def equation(self) -> sympy.Eq:
+        if self._equation is None:
+            self.build_equation()
+        return self._equation
 
     def build_equation(self):
-        self.equation = sympy.Eq(
+        self._equation = sympy.Eq(
             self.target,
             self.expression
         )
@@ -188,39 +474,93 @@ class BaseDefinition:
     def tried(self, value: bool):
         self._is_tried = value
     
+    def describe(self) -> str:
+        """
+        The stated equation, without solving anything.
+        """
+        return f"{self.target.name} = {self.expression}"
+
     def __str__(self):
         return f"Definition({self.expression})"
-    
 
+
+class ReverseDefinition(BaseDefinition):
+    """
+    Defines `target` by solving the equation of `source` for it. Nothing
+    is solved until the expression is needed, then the admissible roots
+    are kept on the definition.
+
+    `objects` are the ones of the equation other than the target, known
+    without solving; a root may not use all of them.
+    """
+
+    def __init__(self, target: BaseObject, source: BaseDefinition):
+        self.target = target
+        self.source = source
+        self.objects = (source.objects | {source.target}) - {target}
+        self.depends_on = self.objects
+        self.dirty = True
+        self._is_tried = False
+        self._equation: sympy.Eq | None = None
+        self._solutions: list[sympy.Expr] | None = None
+
+    @property
+    def expression(self) -> sympy.Expr | None:  # type: ignore[override]
+        return self.solved_expression()
+
+    def build_equation(self):
+        self._equation = sympy.Eq(self.source.target, self.source.expression)
+
+    def needs_solve(self) -> bool:
+        return True
+
+    def solutions(self) -> list[sympy.Expr]:
+        if self._solutions is None:
+            self._solutions = [
+                solution
+                for solution in cache.cached_solve(
+                    self.source.target - self.source.expression, self.target
+                )
+                if self.target.admissible(solution)
+            ]
+        return self._solutions
+
+    def describe(self) -> str:
+        return f"{self.target.name} = solve({self.source.describe()})"
+
+    def __str__(self):
+        return f"Definition({self.describe()})"
+
+
+@tracing.traced(
+    "get_reexpressed_definitions",
+    lambda right_expression, target, source=None: (target, right_expression, source)
+)
 def get_reexpressed_definitions(
         right_expression: sympy.Expr,  
         target: BaseObject,
+        source: BaseDefinition | None = None
 ):  
-    reexpressed_definitions: dict[BaseObject, BaseDefinition] = {}
-    variables = get_objects_from_expression(right_expression)
-    expr = (target - right_expression)
-    for newtarget in variables:
-        expr = (target - right_expression)
-        newexpr = sympy.solve(
-            expr,
-            newtarget
-        )
-        # TODO: handle multiple solutions
-        newexpr = newexpr[0]
-        newdef = BaseDefinition(
-            target=newtarget,
-            expression=newexpr
-            )
-        reexpressed_definitions[newtarget] = newdef
-    return reexpressed_definitions
+    """
+    Definitions of every object of `right_expression` by `target =
+    right_expression`, solved for it on first use.
+    """
+    if source is None:
+        source = BaseDefinition(target, right_expression)
+    return {
+        newtarget: ReverseDefinition(target=newtarget, source=source)
+        for newtarget in get_objects_from_expression(right_expression)
+    }
 
 def assign_reexpressed_definitions(
         right_expression: sympy.Expr,
-        target: BaseObject
+        target: BaseObject,
+        source: BaseDefinition | None = None
         ):
     reexpressed_definitions = get_reexpressed_definitions(
         right_expression=right_expression,
-        target=target
+        target=target,
+        source=source
     )
     for target, definition in reexpressed_definitions.items():
         target.add_definition(definition, reverse_definitions=False)
@@ -233,10 +573,33 @@ def is_expression_constant(expr) -> bool:
         var.is_defined() for var in get_objects_from_expression(expr)
     )
 
-def expression_as_constant(expr: sympy.Expr) -> None | sympy.Expr:
-    if not is_expression_constant(expr):
-        return None
-    variables = get_objects_from_expression(expr)
+@tracing.traced(
+    "expression_as_constant",
+    lambda expr, variables=None, values=None: (None, expr, None)
+)
+def expression_as_constant(
+        expr: sympy.Expr,
+        variables: typing.Iterable[BaseObject] | None = None,
+        values: typing.Mapping[BaseObject, sympy.Expr] | None = None
+) -> None | sympy.Expr:
+    """
+    Substitute the values of `variables` into `expr`, or the ones given in
+    `values` instead, all at once. Exact values are computed without sympy
+    when possible.
+    """
+    if variables is None:
+        variables = get_objects_from_expression(expr)
+    substitution = {}
     for var in variables:
-        expr = expr.subs(var, var.value) 
-    return expr
\ No newline at end of file
+        if values is not None and var in values:
+            substitution[var] = values[var]
+        elif var.is_defined():
+            substitution[var] = var.value
+        else:
+            return None
+    result = exact_values.evaluate(expr, substitution)
+    if result is not None:
+        return result
+    return expr.xreplace({
+        var: sympy.sympify(value) for var, value in substitution.items()
+    })
\ No newline at end of file
@@ -0,0 +1,274 @@
+"""
+Equality classes and order relations between objects.
+
+Objects related with `==` are kept in union-find classes, `<` and `<=`
+facts are edges of a graph between them. Comparing two objects looks their
+classes up in the cached transitive closures of the graph (upwards and
+downwards from the first object), which are extended in place when a new
+fact arrives instead of being recomputed.
+"""
+from __future__ import annotations
+import typing
+if typing.TYPE_CHECKING:
+    from geometry_solver.core import core
+    from geometry_solver.plane import Plane
+
+# results of `RelationGraph.compare`
+LT, LE, EQ, GE, GT = "lt", "le", "eq", "ge", "gt"
+
+# object -> {neighbour: strict}
+Edges = dict["core.BaseObject", dict["core.BaseObject", bool]]
+
+
+class _Reachability:
+    """
+    Cached transitive closure of the order graph in one direction.
+    """
+    __slots__ = ("graph", "edges", "cache")
+
+    def __init__(self, graph: RelationGraph):
+        self.graph = graph
+        self.edges: Edges = {}
+        # class root -> {root of every reachable class: strict}
+        self.cache: dict[core.BaseObject, dict[core.BaseObject, bool]] = {}
+
+    def closure(self, root: "core.BaseObject") -> dict["core.BaseObject", bool]:
+        reachable = self.cache.get(root)
+        if reachable is None:
+            reachable = self.cache[root] = self.search(root)
+        return reachable
+
+    def search(self, root: "core.BaseObject") -> dict["core.BaseObject", bool]:
+        steps = self.steps(root)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as done:
+                return done.value
+
+    def steps(
+            self,
+            root: "core.BaseObject"
+    ) -> typing.Generator[None, None, dict["core.BaseObject", bool]]:
+        """
+        The search for classes reachable from `root`, pausing after every
+        class it expands.
+        """
+        find, members, edges = self.graph.find, self.graph.members, self.edges
+        reachable: dict[core.BaseObject, bool] = {}
+        # a class is expanded again when it becomes strictly reachable
+        stack = [(root, False)]
+        while stack:
+            current, strict = stack.pop()
+            for member in members(current):
+                for neighbour, edge_strict in edges.get(member, {}).items():
+                    neighbour = find(neighbour)
+                    path_strict = strict or edge_strict
+                    if neighbour is root or reachable.get(neighbour) in (True, path_strict):
+                        continue
+                    reachable[neighbour] = path_strict
+                    stack.append((neighbour, path_strict))
+            yield
+        return reachable
+
+    def extend(self, start: "core.BaseObject", end: "core.BaseObject", strict: bool):
+        """
+        Add the edge between classes `start` -> `end` to cached closures.
+        """
+        beyond: dict[core.BaseObject, bool] | None = None
+        for source, reachable in self.cache.items():
+            if source is start:
+                base = strict
+            elif start in reachable:
+                base = reachable[start] or strict
+            else:
+                continue
+            if beyond is None:
+                beyond = self.cache.get(end)
+                if beyond is None:
+                    beyond = self.search(end)
+            for target, target_strict in ((end, False), *beyond.items()):
+                if target is not source and not reachable.get(target, False):
+                    reachable[target] = base or target_strict
+
+
+class RelationGraph:
+    """
+    Attributes:
+        plane (Plane | None): Plane whose snapshots journal the changes.
+    """
+
+    def __init__(self, plane: "Plane | None" = None):
+        self.plane = plane
+        # union by size without path compression, so a union is undone by
+        # dropping one parent link
+        self._parent: dict[core.BaseObject, core.BaseObject] = {}
+        self._members: dict[core.BaseObject, list[core.BaseObject]] = {}
+        # `a < b` / `a <= b` facts: a -> {b: strict} up, b -> {a: strict} down
+        self._up = _Reachability(self)
+        self._down = _Reachability(self)
+
+    def _journal(self, undo: typing.Callable, *args):
+        if self.plane is not None:
+            self.plane.journal(undo, *args)
+
+    def _order(self, first: "core.BaseObject", second: "core.BaseObject") -> bool | None:
+        """
+        Whether the class `first` is below `second` (strictly or not), None
+        if it isn't known to be. Uses a cached closure if there is one, or
+        searches up from `first` and down from `second` in lockstep until
+        the smaller side is exhausted.
+        """
+        if first in self._up.cache:
+            return self._up.cache[first].get(second)
+        if second in self._down.cache:
+            return self._down.cache[second].get(first)
+        up, down = self._up.steps(first), self._down.steps(second)
+        while True:
+            try:
+                next(up)
+            except StopIteration as done:
+                return done.value.get(second)
+            try:
+                next(down)
+            except StopIteration as done:
+                return done.value.get(first)
+
+    def _clear_closures(self):
+        self._up.cache.clear()
+        self._down.cache.clear()
+
+    def find(self, obj: "core.BaseObject") -> "core.BaseObject":
+        parent = self._parent
+        while obj in parent:
+            obj = parent[obj]
+        return obj
+
+    def members(self, obj: "core.BaseObject") -> list["core.BaseObject"]:
+        """
+        Objects equal to `obj`, itself included.
+        """
+        root = self.find(obj)
+        return self._members.get(root) or [root]
+
+    def classes(self) -> typing.Iterator[list["core.BaseObject"]]:
+        """
+        Every equality class with more than one object.
+        """
+        return iter(self._members.values())
+
+    def union(self, first: "core.BaseObject", second: "core.BaseObject") -> "core.BaseObject":
+        """
+        Merge the classes of `first` and `second`.
+
+        Returns:
+            core.BaseObject: Root of the merged class.
+
+        Raises:
+            ValueError: If one of them is known to be less than the other.
+        """
+        first, second = self.find(first), self.find(second)
+        if first is second:
+            return first
+        if self._order(first, second) or self._order(second, first):
+            raise ValueError(f"{first} and {second} are known to differ")
+        first_members, second_members = self.members(first), self.members(second)
+        if len(first_members) < len(second_members):
+            first, second = second, first
+            first_members, second_members = second_members, first_members
+        had_members = first in self._members
+        second_members_before = self._members.pop(second, None)
+        self._parent[second] = first
+        self._members[first] = first_members + second_members
+        self._clear_closures()
+        self._journal(
+            self._undo_union, first, second, first_members, had_members,
+            second_members_before
+        )
+        return first
+
+    def _undo_union(
+            self,
+            first: "core.BaseObject",
+            second: "core.BaseObject",
+            first_members: list["core.BaseObject"],
+            had_members: bool,
+            second_members: list["core.BaseObject"] | None
+    ):
+        del self._parent[second]
+        if had_members:
+            self._members[first] = first_members
+        else:
+            del self._members[first]
+        if second_members is not None:
+            self._members[second] = second_members
+        self._clear_closures()
+
+    def add_order(
+            self,
+            less: "core.BaseObject",
+            greater: "core.BaseObject",
+            strict: bool
+    ):
+        """
+        Record `less < greater` (`strict`) or `less <= greater`.
+
+        Raises:
+            ValueError: If it contradicts what is known.
+        """
+        low, high = self.find(less), self.find(greater)
+        if low is high:
+            if strict:
+                raise ValueError(f"{less} < {greater} contradicts {less} == {greater}")
+            return
+        previous = self._up.edges.get(less, {}).get(greater)
+        if previous is True or previous is strict:
+            return
+        reverse = self._order(high, low)
+        if reverse is not None and (strict or reverse):
+            raise ValueError(f"{less} < {greater} contradicts the known order")
+        self._up.edges.setdefault(less, {})[greater] = strict
+        self._down.edges.setdefault(greater, {})[less] = strict
+        self._journal(self._undo_order, less, greater, previous)
+        self._up.extend(low, high, strict)
+        self._down.extend(high, low, strict)
+
+    def _undo_order(
+            self,
+            less: "core.BaseObject",
+            greater: "core.BaseObject",
+            previous: bool | None
+    ):
+        if previous is None:
+            del self._up.edges[less][greater]
+            del self._down.edges[greater][less]
+        else:
+            self._up.edges[less][greater] = previous
+            self._down.edges[greater][less] = previous
+        self._clear_closures()
+
+    def compare(
+            self,
+            first: "core.BaseObject",
+            second: "core.BaseObject"
+    ) -> str | None:
+        """
+        Returns:
+            str | None: One of LT, LE, EQ, GE, GT for what is known of
+            `first` compared to `second`, None if nothing is.
+        """
+        first, second = self.find(first), self.find(second)
+        if first is second:
+            return EQ
+        # both closures start at `first`, so repeated questions about one
+        # object are answered from two cached dicts
+        greater = self._up.closure(first).get(second)
+        less = self._down.closure(first).get(second)
+        if greater is not None and less is not None:
+            # `<=` both ways
+            return EQ
+        if greater is not None:
+            return LT if greater else LE
+        if less is not None:
+            return GT if less else GE
+        return None
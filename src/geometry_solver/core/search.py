@@ -0,0 +1,232 @@
+"""
+Goal-directed search for the cheapest way to derive an object.
+
+`BaseObject.define` tries definitions in the order they were added and
+recurses into the first one's dependencies, so it can solve a long chain
+of unrelated objects before reaching a cheap path. `derive` instead looks
+at the definitions that can matter for the target only and determines
+objects in order of increasing cost, starting from the given ones
+(Knuth's generalization of Dijkstra's algorithm to AND-OR graphs: a
+definition becomes usable once all of its inputs are determined, and costs
+the sum of theirs plus its own). Nothing is solved until the cheapest
+chain is known, then only the chain is.
+
+    derivation = search.derive(tri.get_side(), budget=1000)
+    derivation.apply()
+"""
+from __future__ import annotations
+import collections
+import heapq
+import itertools
+import typing
+
+from geometry_solver.core import cache, core, tracing
+
+Cost = typing.Callable[["core.BaseDefinition"], float]
+
+# weights of the default cost heuristic
+STEP_COST = 1.0
+SIZE_COST = 0.05
+INPUT_COST = 0.5
+SOLVE_COST = 20.0
+# per second a `sympy.solve` call is expected to take
+SOLVE_SECOND_COST = 1000.0
+EQUALITY_COST = 0.1
+
+
+def definition_cost(definition: "core.BaseDefinition") -> float:
+    """
+    Estimated cost of determining the target with `definition` once its
+    inputs are known: a unit per step, more for bigger expressions and
+    more inputs to substitute, and much more if `sympy.solve` has to be
+    called, unless an equation of the same shape was solved before. The
+    time a new solve takes is estimated from the past ones.
+    """
+    # reverse definitions aren't solved yet, their source's size stands in
+    stated = definition
+    if isinstance(definition, core.ReverseDefinition):
+        stated = definition.source
+    cost = (
+        STEP_COST
+        + SIZE_COST * tracing.expression_size(stated.expression)
+        + INPUT_COST * len(definition.depends_on)
+    )
+    if definition.needs_solve():
+        past = cache.solve_cache.cost(definition.equation, definition.target)
+        if past is None:
+            cost += SOLVE_COST + SOLVE_SECOND_COST * (cache.solve_cache.mean_cost() or 0.0)
+    return cost
+
+
+class Derivation:
+    """
+    Attributes:
+        target (core.BaseObject): The object derived.
+        steps (list[core.BaseDefinition]): Definitions to apply in order, each
+        one's inputs are given or determined by earlier steps.
+        cost (float): Estimated cost of the steps.
+        expanded (int): Objects the search determined before the target.
+    """
+
+    def __init__(
+            self,
+            target: "core.BaseObject",
+            steps: list["core.BaseDefinition"],
+            cost: float,
+            expanded: int
+    ):
+        self.target = target
+        self.steps = steps
+        self.cost = cost
+        self.expanded = expanded
+
+    def apply(self) -> typing.Any:
+        """
+        Set the values along the chain.
+
+        Returns:
+            The value of the target, None if a step has no admissible value.
+        """
+        for definition in self.steps:
+            if definition.target.is_defined():
+                continue
+            if not definition.assign():
+                return None
+        return self.target.value
+
+    def __str__(self):
+        chain = " -> ".join(str(definition.target) for definition in self.steps)
+        return f"Derivation({chain}, cost={self.cost:.2f})"
+
+
+def relevant_objects(target: "core.BaseObject") -> set["core.BaseObject"]:
+    """
+    Objects the target can be derived from: inputs of its definitions and
+    equal objects, recursively, stopping at determined objects.
+    """
+    graph = core.relation_graph(target)
+    relevant = {target}
+    stack = [target]
+    while stack:
+        obj = stack.pop()
+        if obj.is_defined():
+            continue
+        predecessors: list[core.BaseObject] = list(graph.members(obj))
+        for definition in obj._definitions or ():
+            predecessors.extend(definition.depends_on)
+        for other in predecessors:
+            if other not in relevant:
+                relevant.add(other)
+                stack.append(other)
+    return relevant
+
+
+@tracing.traced("search.derive", lambda target, *args, **kwargs: (target, None, target))
+def derive(
+        target: "core.BaseObject",
+        cost: Cost = definition_cost,
+        budget: int | None = None,
+        max_depth: int | None = None
+) -> Derivation | None:
+    """
+    Find the cheapest chain of definitions determining `target`.
+
+    Args:
+        cost (Cost): Cost of a definition on its own, must be non-negative.
+        budget (int | None): Give up after determining this many objects.
+        max_depth (int | None): Ignore chains longer than this.
+
+    Returns:
+        Derivation | None: None if the target can't be derived within the
+        limits.
+    """
+    if target.is_defined():
+        return Derivation(target, [], 0.0, 0)
+    graph = core.relation_graph(target)
+    relevant = relevant_objects(target)
+    # inputs not determined yet, per definition
+    remaining: dict[core.BaseDefinition, int] = {}
+    users: collections.defaultdict[
+        core.BaseObject, list[core.BaseDefinition]
+        ] = collections.defaultdict(list)
+    counter = itertools.count()
+    # (cost, depth, tie breaker, object, definition determining it)
+    heap: list[tuple[float, int, int, core.BaseObject, core.BaseDefinition | None]] = []
+    for obj in relevant:
+        if obj.is_defined():
+            heap.append((0.0, 0, next(counter), obj, None))
+            continue
+        for definition in obj._definitions or ():
+            remaining[definition] = len(definition.depends_on)
+            if not definition.depends_on:
+                heap.append((cost(definition), 1, next(counter), obj, definition))
+            for dependency in definition.depends_on:
+                users[dependency].append(definition)
+    heapq.heapify(heap)
+
+    best: dict[core.BaseObject, tuple[float, int, core.BaseDefinition | None]] = {}
+    expanded = 0
+    while heap:
+        obj_cost, depth, _, obj, via = heapq.heappop(heap)
+        if obj in best:
+            continue
+        best[obj] = (obj_cost, depth, via)
+        if obj is target:
+            break
+        expanded += 1
+        if budget is not None and expanded > budget:
+            return None
+        if max_depth is not None and depth >= max_depth:
+            continue
+        for member in graph.members(obj):
+            if member not in best and member in relevant:
+                heapq.heappush(heap, (
+                    obj_cost + EQUALITY_COST, depth + 1, next(counter), member,
+                    core.BaseDefinition(member, obj)
+                ))
+        for definition in users.get(obj, ()):
+            remaining[definition] -= 1
+            if remaining[definition] or definition.target in best:
+                continue
+            inputs = [best[dependency] for dependency in definition.depends_on]
+            step_depth = 1 + max(entry[1] for entry in inputs)
+            if max_depth is not None and step_depth > max_depth:
+                continue
+            heapq.heappush(heap, (
+                cost(definition) + sum(entry[0] for entry in inputs),
+                step_depth, next(counter), definition.target, definition
+            ))
+    if target not in best:
+        return None
+
+    # definitions of the chain, inputs before the objects they determine
+    steps: list[core.BaseDefinition] = []
+    visited: set[core.BaseObject] = set()
+    stack: list[tuple[core.BaseObject, bool]] = [(target, False)]
+    while stack:
+        obj, expanded_inputs = stack.pop()
+        via = best[obj][2]
+        if via is None:
+            continue
+        if expanded_inputs:
+            steps.append(via)
+            continue
+        if obj in visited:
+            continue
+        visited.add(obj)
+        stack.append((obj, True))
+        stack.extend((dependency, False) for dependency in via.depends_on)
+    return Derivation(target, steps, best[target][0], expanded)
+
+
+def solve(target: "core.BaseObject", **kwargs) -> typing.Any | None:
+    """
+    Derive `target` along the cheapest chain, see `derive` for arguments.
+
+    Returns:
+        The value of the target, None if no chain was found.
+    """
+    derivation = derive(target, **kwargs)
+    if derivation is None:
+        return None
+    return derivation.apply()
@@ -0,0 +1,238 @@
+"""
+Solving all the knowledge of a Plane at once, as one system of equations.
+
+The system is split into blocks with the block triangular decomposition:
+equations are matched to the unknowns they determine, and strongly
+connected components of the resulting dependency graph are the smallest
+sets of equations that have to be solved together. Blocks are solved in
+dependency order, each one once, with the values of earlier blocks
+substituted in. When a block has several admissible roots, the first one
+is substituted into later blocks and the others are kept as `candidates`
+of the objects.
+"""
+from __future__ import annotations
+import typing
+
+import sympy
+from sympy.solvers.solveset import NonlinearError
+
+from geometry_solver.core import cache, core, relations
+
+
+class SystemSolution:
+    """
+    Attributes:
+        values (dict[core.BaseObject, sympy.Expr]): Newly determined values.
+        blocks (int): Amount of blocks the system was split into.
+        solve_calls (int): Amount of sympy solver invocations.
+    """
+
+    def __init__(self):
+        self.values: dict[core.BaseObject, sympy.Expr] = {}
+        self.blocks = 0
+        self.solve_calls = 0
+
+    def __str__(self):
+        return (
+            f"SystemSolution({len(self.values)} values, "
+            f"{self.blocks} blocks, {self.solve_calls} solves)"
+        )
+
+
+def collect_equations(
+        objects: typing.Iterable["core.BaseObject"]
+) -> list[sympy.Expr]:
+    """
+    Equations (as expressions equal to zero) stated by definitions and
+    equality relations of `objects`. Reverse definitions are skipped, they
+    restate their source.
+    """
+    equations: list[sympy.Expr] = []
+    graphs: dict[int, relations.RelationGraph] = {}
+    for obj in objects:
+        for definition in obj._definitions or ():
+            if definition.source is None:
+                equations.append(definition.target - definition.expression)
+        graph = core.relation_graph(obj)
+        graphs.setdefault(id(graph), graph)
+    for graph in graphs.values():
+        for members in graph.classes():
+            for first, second in zip(members, members[1:]):
+                equations.append(first - second)
+    return equations
+
+
+def match(
+        unknowns_of: list[list["core.BaseObject"]]
+) -> dict[int, "core.BaseObject"]:
+    """
+    Maximum matching of equations to unknowns (Kuhn's augmenting paths).
+
+    Returns:
+        dict[int, core.BaseObject]: Equation index -> unknown it determines.
+    """
+    owner: dict[core.BaseObject, int] = {}
+    for start in range(len(unknowns_of)):
+        # iterative DFS over alternating paths
+        visited: set[core.BaseObject] = set()
+        stack = [(start, iter(unknowns_of[start]))]
+        path: list[tuple[int, core.BaseObject]] = []
+        while stack:
+            equation, candidates = stack[-1]
+            for unknown in candidates:
+                if unknown in visited:
+                    continue
+                visited.add(unknown)
+                path.append((equation, unknown))
+                if unknown not in owner:
+                    for matched_equation, matched_unknown in path:
+                        owner[matched_unknown] = matched_equation
+                    stack = []
+                    break
+                next_equation = owner[unknown]
+                stack.append((next_equation, iter(unknowns_of[next_equation])))
+                break
+            else:
+                stack.pop()
+                if path:
+                    path.pop()
+    return {equation: unknown for unknown, equation in owner.items()}
+
+
+def strongly_connected_components(
+        graph: dict[int, list[int]]
+) -> list[list[int]]:
+    """
+    Tarjan's algorithm, iterative. Components come out dependencies first:
+    a component is emitted only after every component it has edges to.
+    """
+    index: dict[int, int] = {}
+    lowlink: dict[int, int] = {}
+    on_stack: set[int] = set()
+    stack: list[int] = []
+    components: list[list[int]] = []
+    counter = 0
+    for root in graph:
+        if root in index:
+            continue
+        work = [(root, iter(graph[root]))]
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if successor not in index:
+                    index[successor] = lowlink[successor] = counter
+                    counter += 1
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(graph[successor])))
+                    break
+                if successor in on_stack:
+                    lowlink[node] = min(lowlink[node], index[successor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
+def solve_block(
+        equations: list[sympy.Expr],
+        unknowns: list["core.BaseObject"],
+        solution: SystemSolution
+) -> dict["core.BaseObject", list[sympy.Expr]]:
+    """
+    Returns:
+        dict[core.BaseObject, list[sympy.Expr]]: Admissible values of the
+        unknowns, the ones of the first root first.
+    """
+    solution.solve_calls += 1
+    if len(equations) == 1:
+        roots = [
+            root for root in cache.cached_solve(equations[0], unknowns[0])
+            if unknowns[0].admissible(root)
+        ]
+        return {unknowns[0]: roots} if roots else {}
+    try:
+        matrix, rhs = sympy.linear_eq_to_matrix(equations, unknowns)
+    except NonlinearError:
+        pass
+    else:
+        try:
+            values = matrix.LUsolve(rhs)
+        except ValueError:
+            # singular: some equations of the block are redundant
+            pass
+        else:
+            return {
+                unknown: [value] for unknown, value in zip(unknowns, values)
+                if unknown.admissible(value)
+            }
+    candidates: dict[core.BaseObject, list[sympy.Expr]] = {}
+    for root in sympy.solve(equations, unknowns, dict=True):
+        if all(unknown.admissible(value) for unknown, value in root.items()):
+            for unknown, value in root.items():
+                values_of = candidates.setdefault(unknown, [])
+                if value not in values_of:
+                    values_of.append(value)
+    return candidates
+
+
+def solve_system(objects: typing.Sequence["core.BaseObject"]) -> SystemSolution:
+    """
+    Solve definitions and equality relations of `objects` together and
+    write the determined values back.
+    """
+    solution = SystemSolution()
+    known = {obj: sympy.sympify(obj.value) for obj in objects if obj.is_defined()}
+    equations: list[sympy.Expr] = []
+    unknowns_of: list[list[core.BaseObject]] = []
+    for equation in collect_equations(objects):
+        equation = equation.xreplace(known)
+        unknowns = sorted(
+            core.get_objects_from_expression(equation), key=lambda obj: obj.uid
+        )
+        if unknowns:
+            equations.append(equation)
+            unknowns_of.append(unknowns)
+
+    matching = match(unknowns_of)
+    determined_by = {unknown: equation for equation, unknown in matching.items()}
+    graph = {
+        equation: [
+            determined_by[unknown] for unknown in unknowns_of[equation]
+            if unknown in determined_by and determined_by[unknown] != equation
+        ]
+        for equation in matching
+    }
+
+    values: dict[core.BaseObject, sympy.Expr] = {}
+    candidates: dict[core.BaseObject, list[sympy.Expr]] = {}
+    for component in strongly_connected_components(graph):
+        solution.blocks += 1
+        block = [equations[equation].xreplace(values) for equation in component]
+        block_unknowns = [matching[equation] for equation in component]
+        for unknown, roots in solve_block(block, block_unknowns, solution).items():
+            values[unknown] = roots[0]
+            candidates[unknown] = roots
+    for obj, value in values.items():
+        if not core.get_objects_from_expression(value):
+            obj.set_value(value, candidates=[
+                root for root in candidates[obj]
+                if not core.get_objects_from_expression(root)
+            ])
+            solution.values[obj] = value
+    return solution
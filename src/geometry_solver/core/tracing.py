@@ -0,0 +1,169 @@
+"""
+Opt-in tracing of the definition engine.
+
+    with tracing.trace() as tracer:
+        tri.get_side().define()
+    tracer.export_chrome("trace.json")  # open in chrome://tracing or Perfetto
+    print(tracer.summary(plane))
+
+Instrumented functions check a single module global when tracing is off,
+so the hooks stay in place in production.
+"""
+from __future__ import annotations
+import collections
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+import typing
+
+import sympy
+
+_tracer: Tracer | None = None
+
+Describe = typing.Callable[..., tuple[typing.Any, typing.Any, typing.Any]]
+
+
+class Span:
+    __slots__ = (
+        "kind", "target", "plane", "key", "expression_size", "result",
+        "start", "duration", "child_time", "thread"
+    )
+
+    def __init__(self, kind: str, target, expression, key, start: float):
+        self.kind = kind
+        self.target = target.name if target is not None else None
+        plane = getattr(target, "plane", None)
+        self.plane = plane.serial if plane is not None else None
+        self.key = key
+        self.expression_size = (
+            expression_size(expression) if expression is not None else None
+        )
+        self.result: str | None = None
+        self.start = start
+        self.duration = 0.0
+        self.child_time = 0.0
+        self.thread = threading.get_ident()
+
+    @property
+    def self_time(self) -> float:
+        return self.duration - self.child_time
+
+
+class Tracer:
+    """
+    Collects a span for every instrumented call made while it is active.
+    """
+
+    def __init__(self):
+        self.spans: list[Span] = []
+        self._open: list[Span] = []
+
+    def enter(self, kind: str, target, expression, key) -> Span:
+        span = Span(kind, target, expression, key, time.perf_counter())
+        self._open.append(span)
+        return span
+
+    def exit(self, span: Span, result):
+        span.duration = time.perf_counter() - span.start
+        span.result = None if result is None else str(result)[:200]
+        self._open.pop()
+        if self._open:
+            self._open[-1].child_time += span.duration
+        self.spans.append(span)
+
+    def chrome_events(self) -> list[dict[str, typing.Any]]:
+        pid = os.getpid()
+        return [
+            {
+                "name": f"{span.kind} {span.target}" if span.target else span.kind,
+                "cat": span.kind,
+                "ph": "X",
+                "ts": span.start * 1e6,
+                "dur": span.duration * 1e6,
+                "pid": pid,
+                "tid": span.thread,
+                "args": {
+                    "target": span.target,
+                    "plane": span.plane,
+                    "expression_size": span.expression_size,
+                    "result": span.result,
+                },
+            }
+            for span in self.spans
+        ]
+
+    def export_chrome(self, path: str):
+        with open(path, "w") as file:
+            json.dump({"traceEvents": self.chrome_events()}, file)
+
+    def summary(self, plane=None, top: int = 10) -> list[dict[str, typing.Any]]:
+        """
+        Hottest definitions by time spent in them (excluding nested
+        definitions), optionally only for objects of `plane`.
+        """
+        rows: dict[int, dict[str, typing.Any]] = {}
+        for span in self.spans:
+            if span.kind != "BaseDefinition.define":
+                continue
+            if plane is not None and span.plane != plane.serial:
+                continue
+            row = rows.get(id(span.key))
+            if row is None:
+                row = rows[id(span.key)] = {
+                    "definition": span.key.describe(),
+                    "calls": 0, "self_s": 0.0, "total_s": 0.0, "max_s": 0.0,
+                }
+            row["calls"] += 1
+            row["self_s"] += span.self_time
+            row["total_s"] += span.duration
+            row["max_s"] = max(row["max_s"], span.duration)
+        return sorted(rows.values(), key=lambda row: -row["self_s"])[:top]
+
+    def counts(self) -> collections.Counter[str]:
+        return collections.Counter(span.kind for span in self.spans)
+
+
+def expression_size(expression) -> int:
+    if not isinstance(expression, sympy.Basic):
+        return 1
+    return sum(1 for _ in sympy.preorder_traversal(expression))
+
+
+@contextlib.contextmanager
+def trace(tracer: Tracer | None = None) -> typing.Iterator[Tracer]:
+    global _tracer
+    previous = _tracer
+    _tracer = tracer if tracer is not None else Tracer()
+    try:
+        yield _tracer
+    finally:
+        _tracer = previous
+
+
+def traced(kind: str, describe: Describe):
+    """
+    Record a span for every call while tracing is on.
+
+    Args:
+        kind (str): Name of the span.
+        describe (Describe): Takes the call arguments and returns the target
+        object, the expression worked on and the key spans are grouped by.
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return function(*args, **kwargs)
+            span = tracer.enter(kind, *describe(*args, **kwargs))
+            result = None
+            try:
+                result = function(*args, **kwargs)
+                return result
+            finally:
+                tracer.exit(span, result)
+        return wrapper
+    return decorator
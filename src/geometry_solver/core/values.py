@@ -0,0 +1,351 @@
+"""
+Exact values of school geometry without sympy.
+
+Lengths are sums of rational multiples of square roots, like `8*sqrt(3)`
+or `1/2 + sqrt(2)/2`, and angles are rational numbers of degrees (so
+rational multiples of pi). `Radical` stores such a number as its
+coefficients per square-free radicand and does exact arithmetic and
+comparisons on them with `fractions.Fraction`.
+
+`evaluate` computes an expression over objects in one walk of its tree.
+Anything outside the family (a Float, a trigonometric function, a square
+root of an irrational number or of one too large to factor quickly, ...)
+makes it return None, then the caller falls back to sympy.
+"""
+from __future__ import annotations
+import fractions
+import math
+import numbers
+import typing
+
+import sympy
+
+Rational = fractions.Fraction
+
+# radicands are factored by trial division, larger ones are left to sympy
+MAX_RADICAND = 10 ** 8
+
+
+class NotRadical(ValueError):
+    """
+    The result isn't a sum of rational multiples of square roots.
+    """
+
+
+def _square_free(n: int) -> tuple[int, int]:
+    """
+    Split a positive `n` into `(k, m)` with `n == k**2 * m` and `m`
+    square-free.
+    """
+    outside, factor = 1, 2
+    while factor * factor <= n:
+        while n % (factor * factor) == 0:
+            n //= factor * factor
+            outside *= factor
+        factor += 1
+    return outside, n
+
+
+def _smallest_prime(n: int) -> int:
+    factor = 2
+    while factor * factor <= n:
+        if n % factor == 0:
+            return factor
+        factor += 1
+    return n
+
+
+class Radical:
+    """
+    Attributes:
+        terms (tuple[tuple[int, Rational], ...]): `(radicand, coefficient)`
+        pairs sorted by radicand, radicands are square-free and
+        coefficients nonzero; the rational part has radicand 1.
+    """
+    __slots__ = ("terms",)
+
+    # answers the questions asked of sympy values
+    is_number = True
+
+    def __init__(self, terms: typing.Mapping[int, Rational] | None = None):
+        self.terms = tuple(sorted(
+            (radicand, coefficient)
+            for radicand, coefficient in (terms or {}).items() if coefficient
+        ))
+
+    @classmethod
+    def rational(cls, value: Rational | int) -> Radical:
+        return cls({1: Rational(value)})
+
+    @classmethod
+    def sqrt_of(cls, value: Rational | int) -> Radical:
+        value = Rational(value)
+        if value < 0:
+            raise NotRadical(f"sqrt({value}) isn't real")
+        # sqrt(p/q) == sqrt(p*q)/q
+        product = value.numerator * value.denominator
+        if product > MAX_RADICAND:
+            raise NotRadical(f"sqrt({value}) has too large a radicand")
+        outside, radicand = _square_free(product)
+        return cls({radicand: Rational(outside, value.denominator)})
+
+    def is_rational(self) -> bool:
+        return all(radicand == 1 for radicand, _ in self.terms)
+
+    def as_rational(self) -> Rational:
+        if not self.is_rational():
+            raise NotRadical(f"{self} is irrational")
+        return self.terms[0][1] if self.terms else Rational(0)
+
+    def sign(self) -> int:
+        """
+        -1, 0 or 1, decided exactly: square roots of distinct square-free
+        numbers are linearly independent, so only the empty sum is zero and
+        approximations get precise enough to tell.
+        """
+        if not self.terms:
+            return 0
+        if self.is_rational():
+            return 1 if self.terms[0][1] > 0 else -1
+        approximate = float(self)
+        bound = 1e-9 * sum(abs(float(c)) * math.sqrt(r) for r, c in self.terms)
+        if abs(approximate) > bound:
+            return 1 if approximate > 0 else -1
+        precision = 128
+        while True:
+            scale = 1 << precision
+            # floor(sqrt(r) * scale) is off by less than one
+            total = sum(c * math.isqrt(r * scale * scale) for r, c in self.terms)
+            error = sum(abs(c) for _, c in self.terms)
+            if abs(total) > error:
+                return 1 if total > 0 else -1
+            precision *= 2
+
+    def conjugate(self, prime: int) -> Radical:
+        """
+        Flip the sign of the square roots whose radicand `prime` divides.
+        """
+        return Radical({
+            radicand: -coefficient if radicand % prime == 0 else coefficient
+            for radicand, coefficient in self.terms
+        })
+
+    def sqrt(self) -> Radical:
+        return Radical.sqrt_of(self.as_rational())
+
+    def __add__(self, other: typing.Any) -> Radical:
+        other = coerce(other)
+        if other is None:
+            return NotImplemented
+        terms = dict(self.terms)
+        for radicand, coefficient in other.terms:
+            terms[radicand] = terms.get(radicand, 0) + coefficient
+        return Radical(terms)
+
+    __radd__ = __add__
+
+    def __neg__(self) -> Radical:
+        return Radical({radicand: -c for radicand, c in self.terms})
+
+    def __sub__(self, other: typing.Any) -> Radical:
+        other = coerce(other)
+        if other is None:
+            return NotImplemented
+        return self + -other
+
+    def __rsub__(self, other: typing.Any) -> Radical:
+        return -self + other
+
+    def __mul__(self, other: typing.Any) -> Radical:
+        other = coerce(other)
+        if other is None:
+            return NotImplemented
+        terms: dict[int, Rational] = {}
+        for first, first_coefficient in self.terms:
+            for second, second_coefficient in other.terms:
+                # sqrt(a)*sqrt(b) == gcd(a, b)*sqrt(a*b/gcd(a, b)**2)
+                common = math.gcd(first, second)
+                radicand = first // common * (second // common)
+                if radicand > MAX_RADICAND:
+                    raise NotRadical(f"sqrt({radicand}) is too large a radicand")
+                terms[radicand] = (
+                    terms.get(radicand, 0)
+                    + first_coefficient * second_coefficient * common
+                )
+        return Radical(terms)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: typing.Any) -> Radical:
+        other = coerce(other)
+        if other is None:
+            return NotImplemented
+        if not other.terms:
+            raise ZeroDivisionError("division by zero")
+        numerator, denominator = self, other
+        # every conjugation removes the roots of one prime from the denominator
+        while not denominator.is_rational():
+            radicand = next(r for r, _ in denominator.terms if r != 1)
+            conjugate = denominator.conjugate(_smallest_prime(radicand))
+            numerator, denominator = numerator * conjugate, denominator * conjugate
+        return numerator * Radical.rational(1 / denominator.as_rational())
+
+    def __rtruediv__(self, other: typing.Any) -> Radical:
+        other = coerce(other)
+        if other is None:
+            return NotImplemented
+        return other / self
+
+    def __pow__(self, exponent: typing.Any) -> Radical:
+        try:
+            exponent = Rational(exponent)
+        except TypeError:
+            return NotImplemented
+        if exponent.denominator == 2:
+            return self.sqrt() ** exponent.numerator
+        if exponent.denominator != 1:
+            raise NotRadical(f"{self}**{exponent}")
+        power = int(exponent)
+        result, base = Radical.rational(1), self
+        for _ in range(abs(power)):
+            result = result * base
+        return Radical.rational(1) / result if power < 0 else result
+
+    def __abs__(self) -> Radical:
+        return -self if self.sign() < 0 else self
+
+    def _compare(self, other: typing.Any) -> int | None:
+        if isinstance(other, float) and math.isfinite(other):
+            other = from_float(other)
+        other = coerce(other)
+        if other is None:
+            return None
+        return (self - other).sign()
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if isinstance(other, sympy.Basic):
+            converted = evaluate(other, {})
+            if converted is None:
+                return self._sympy_() == other
+            other = converted
+        difference = self._compare(other)
+        if difference is None:
+            return NotImplemented
+        return difference == 0
+
+    def __hash__(self) -> int:
+        if self.is_rational():
+            return hash(self.as_rational())
+        return hash(self.terms)
+
+    def __lt__(self, other: typing.Any) -> bool:
+        difference = self._compare(other)
+        return NotImplemented if difference is None else difference < 0
+
+    def __le__(self, other: typing.Any) -> bool:
+        difference = self._compare(other)
+        return NotImplemented if difference is None else difference <= 0
+
+    def __gt__(self, other: typing.Any) -> bool:
+        difference = self._compare(other)
+        return NotImplemented if difference is None else difference > 0
+
+    def __ge__(self, other: typing.Any) -> bool:
+        difference = self._compare(other)
+        return NotImplemented if difference is None else difference >= 0
+
+    def __bool__(self) -> bool:
+        return bool(self.terms)
+
+    def __float__(self) -> float:
+        return math.fsum(float(c) * math.sqrt(r) for r, c in self.terms)
+
+    def _sympy_(self) -> sympy.Expr:
+        return sympy.Add(*(
+            sympy.Rational(c.numerator, c.denominator) * sympy.sqrt(r)
+            for r, c in self.terms
+        ))
+
+    def __str__(self) -> str:
+        return str(self._sympy_())
+
+    def __repr__(self) -> str:
+        return f"Radical({self})"
+
+
+def coerce(value: typing.Any) -> Radical | None:
+    """
+    `value` as a Radical if it is a Python rational or a Radical, None
+    otherwise.
+    """
+    if isinstance(value, Radical):
+        return value
+    if isinstance(value, numbers.Rational) and not isinstance(value, sympy.Basic):
+        return Radical.rational(Rational(value))
+    return None
+
+
+def from_float(value: float) -> Rational:
+    """
+    A finite float as the decimal it was written as, e.g. 1/10 for 0.1,
+    not the binary fraction it stores. Given values and comparisons with
+    floats both read them this way.
+    """
+    return Rational(repr(value))
+
+
+def exact(value: typing.Any) -> typing.Any:
+    """
+    A given value as a Radical if it is one, else as a sympy expression.
+    Floats are read as the decimals they were written as.
+    """
+    if isinstance(value, float) and math.isfinite(value):
+        return Radical.rational(from_float(value))
+    radical = coerce(value)
+    if radical is not None:
+        return radical
+    value = sympy.sympify(value)
+    radical = evaluate(value, {})
+    return value if radical is None else radical
+
+
+def evaluate(
+        expression: typing.Any,
+        values: typing.Mapping[sympy.Symbol, typing.Any]
+) -> Radical | None:
+    """
+    `expression` with the symbols replaced by `values`, None if it or one
+    of the values isn't a Radical.
+    """
+    try:
+        return _evaluate(expression, values)
+    except (NotRadical, ZeroDivisionError):
+        return None
+
+
+def _evaluate(expression: typing.Any, values: typing.Mapping[sympy.Symbol, typing.Any]) -> Radical:
+    radical = coerce(expression)
+    if radical is not None:
+        return radical
+    if not isinstance(expression, sympy.Basic):
+        raise NotRadical(f"{expression!r} isn't exact")
+    if expression.is_Symbol:
+        if expression not in values:
+            raise NotRadical(f"{expression} has no value")
+        return _evaluate(values[expression], values)
+    if expression.is_Rational:
+        return Radical.rational(Rational(int(expression.p), int(expression.q)))
+    if expression.is_Add:
+        result = Radical()
+        for argument in expression.args:
+            result = result + _evaluate(argument, values)
+        return result
+    if expression.is_Mul:
+        result = Radical.rational(1)
+        for argument in expression.args:
+            result = result * _evaluate(argument, values)
+        return result
+    if expression.is_Pow and expression.exp.is_Rational:
+        exponent = Rational(int(expression.exp.p), int(expression.exp.q))
+        return _evaluate(expression.base, values) ** exponent
+    raise NotRadical(f"{expression} isn't a sum of square roots")
@@ -1,5 +1,6 @@
 from geometry_solver.models import polygons, circle, basic_objects
 from geometry_solver.core import core
+from geometry_solver.definitions import rules
 import sympy
 
 # XXX: should it take edges as argument?
@@ -12,4 +13,16 @@ def circumcirle_radius_of_regular_triangle(
     return core.BaseDefinition(
         target=circumcircle,
         expression= tri.get_side()/sympy.sqrt(3)
-    )
\ No newline at end of file
+    )
+
+
+@rules.library.rule(polygons.RegularTriangle, relation="inscribed_in")
+def regular_triangle_circumradius(
+        tri: "polygons.RegularTriangle",
+        circumcircle: "circle.Circle"
+):
+    circumcircle.add_definition(
+        circumcirle_radius_of_regular_triangle(
+            circumcircle=circumcircle,
+            tri=tri
+        ))
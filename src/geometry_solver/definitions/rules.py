@@ -0,0 +1,110 @@
+"""
+Registry of geometric rules (theorems), indexed by figure type and relation.
+
+A rule declares which figures it applies to and on which relation of the
+figure it fires, e.g. "a RegularTriangle got inscribed in a circle". Figures
+report their relations to `RuleRegistry.fire`, which looks the matching rules
+up by `(type, relation)` instead of trying the whole library.
+"""
+from __future__ import annotations
+import collections
+import typing
+
+Apply = typing.Callable[..., None]
+
+
+class Rule:
+    """
+    Attributes:
+        name (str): Name of the rule, for debugging.
+        figure_types (tuple[type, ...]): Figure classes the rule applies to,
+        subclasses included.
+        relation (str): Relation the rule fires on, e.g. "created" or
+        "inscribed_in".
+        apply (Apply): Called with the figure and the relation context as
+        keyword arguments.
+    """
+    __slots__ = ("name", "figure_types", "relation", "apply")
+
+    def __init__(
+            self,
+            name: str,
+            figure_types: tuple[type, ...],
+            relation: str,
+            apply: Apply
+    ):
+        self.name = name
+        self.figure_types = figure_types
+        self.relation = relation
+        self.apply = apply
+
+    def __str__(self):
+        types = ", ".join(figure_type.__name__ for figure_type in self.figure_types)
+        return f"Rule({self.name}: {types} {self.relation})"
+
+
+class RuleRegistry:
+
+    def __init__(self):
+        self._index: collections.defaultdict[
+            tuple[type, str], list[Rule]
+            ] = collections.defaultdict(list)
+        # (concrete type, relation) -> rules of the type and its bases
+        self._resolved: dict[tuple[type, str], tuple[Rule, ...]] = {}
+
+    def add(self, rule: Rule) -> Rule:
+        for figure_type in rule.figure_types:
+            self._index[(figure_type, rule.relation)].append(rule)
+        self._resolved.clear()
+        return rule
+
+    def rule(
+            self,
+            *figure_types: type,
+            relation: str = "created"
+    ) -> typing.Callable[[Apply], Apply]:
+        """
+        Decorator registering a function as a rule.
+        """
+        def decorator(apply: Apply) -> Apply:
+            self.add(Rule(apply.__name__, figure_types, relation, apply))
+            return apply
+        return decorator
+
+    def matching(self, figure_type: type, relation: str) -> tuple[Rule, ...]:
+        key = (figure_type, relation)
+        rules = self._resolved.get(key)
+        if rules is None:
+            found: dict[int, Rule] = {}
+            for base in figure_type.__mro__:
+                for rule in self._index.get((base, relation), ()):
+                    found.setdefault(id(rule), rule)
+            rules = self._resolved[key] = tuple(found.values())
+        return rules
+
+    def fire(self, figure: typing.Any, relation: str, **context) -> int:
+        """
+        Apply every rule matching the figure's type and `relation`.
+
+        Returns:
+            int: Amount of rules applied.
+        """
+        rules = self.matching(type(figure), relation)
+        for rule in rules:
+            rule.apply(figure, **context)
+        return len(rules)
+
+    def __len__(self):
+        return len({id(rule) for rules in self._index.values() for rule in rules})
+
+
+library = RuleRegistry()
+
+
+def load_library() -> RuleRegistry:
+    """
+    The registry with the rules of `geometry_solver.definitions`.
+    """
+    # registering happens on import of the rule modules
+    from geometry_solver.definitions import definitions  # noqa: F401
+    return library
@@ -0,0 +1,249 @@
+"""
+Persistent cache of derived formulas, keyed by problem templates.
+
+Problems that only differ in their numbers share a template: the structure
+of the Plane (objects, how they are built from each other, definitions,
+equality classes, and which objects are given) with values left out. For
+a solved target the cache stores its closed form over the given objects,
+so later instances of the template substitute their numbers into it
+instead of solving anything:
+
+    formulas = FormulaCache("formulas.sqlite")
+    value = formulas.solve(tri.get_side())  # define() on a miss only
+
+The store is a sqlite file, safe to share between processes.
+"""
+from __future__ import annotations
+import ast
+import hashlib
+import json
+import os
+import typing
+
+import sympy
+
+from geometry_solver.core import core
+from geometry_solver.models import basic_objects, circle, polygons
+if typing.TYPE_CHECKING:
+    import sqlite3
+
+    from geometry_solver.plane import Plane
+
+DEFAULT_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "geometry_solver", "formulas.sqlite"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS formulas (
+    template TEXT NOT NULL,
+    target INTEGER NOT NULL,
+    formula TEXT NOT NULL,
+    PRIMARY KEY (template, target)
+)
+"""
+
+
+# what stored formulas may be built of, see `load_formula`
+_CONSTRUCTORS: dict[str, typing.Callable[..., sympy.Expr]] = {
+    "Symbol": sympy.Symbol, "Integer": sympy.Integer,
+    "Rational": sympy.Rational, "Float": sympy.Float,
+    "Add": sympy.Add, "Mul": sympy.Mul, "Pow": sympy.Pow,
+    "sin": sympy.sin, "cos": sympy.cos, "tan": sympy.tan,
+    "asin": sympy.asin, "acos": sympy.acos, "atan": sympy.atan,
+}
+_CONSTANTS = {"pi": sympy.pi, "E": sympy.E}
+
+
+def load_formula(text: str) -> sympy.Expr:
+    """
+    Rebuild a formula stored as its `sympy.srepr`. The text comes from a
+    shared file, so it is never evaluated: only calls of the constructors
+    above on literals are accepted.
+
+    Raises:
+        ValueError: If the text is anything else.
+    """
+    def build(node: ast.AST) -> typing.Any:
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, str)):
+            return node.value
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub) \
+        and isinstance(node.operand, ast.Constant) and isinstance(node.operand.value, int):
+            return -node.operand.value
+        if isinstance(node, ast.Name) and node.id in _CONSTANTS:
+            return _CONSTANTS[node.id]
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) \
+        and node.func.id in _CONSTRUCTORS \
+        and all(keyword.arg is not None for keyword in node.keywords):
+            return _CONSTRUCTORS[node.func.id](
+                *(build(argument) for argument in node.args),
+                **{keyword.arg: build(keyword.value) for keyword in node.keywords}
+            )
+        raise ValueError(f"Not a stored formula: {text!r}")
+
+    try:
+        tree = ast.parse(text, mode="eval")
+    except SyntaxError as error:
+        raise ValueError(f"Not a stored formula: {text!r}") from error
+    return build(tree.body)
+
+
+class Template:
+    """
+    Canonical structure of a Plane.
+
+    Attributes:
+        key (str): Digest of the structure, equal for Planes built the same
+        way whatever the names and values.
+        index (dict[core.BaseObject, int]): Position of every object in
+        `plane.objects`, the canonical identity of objects in formulas.
+    """
+
+    def __init__(self, plane: "Plane"):
+        self.plane = plane
+        self.index = {obj: i for i, obj in enumerate(plane.objects)}
+        description = [self.describe(obj) for obj in plane.objects]
+        classes = sorted(
+            sorted(self.index[obj] for obj in members)
+            for members in plane.relations.classes()
+        )
+        text = json.dumps([description, classes], separators=(",", ":"))
+        self.key = hashlib.sha256(text.encode()).hexdigest()
+
+    def placeholder(self, obj: core.BaseObject) -> sympy.Symbol:
+        return sympy.Symbol(f"_o{self.index[obj]}")
+
+    def describe(self, obj: core.BaseObject) -> list[typing.Any]:
+        index = self.index
+        given = obj.is_defined() and obj.derivation is None
+        description: list[typing.Any] = [type(obj).__name__, given]
+        # endpoints are ordered by name, so only their set is structural
+        if isinstance(obj, basic_objects.LineSegment):
+            description.append(sorted((index[obj.p1], index[obj.p2])))
+        elif isinstance(obj, basic_objects.Angle):
+            description.append(
+                [index[obj.p2], sorted((index[obj.p1], index[obj.p3]))]
+            )
+        elif isinstance(obj, circle.Circle):
+            description.append(
+                [index[obj.center]]
+                + [index[polygon] for polygon in obj.inscribed_polygons]
+            )
+        elif isinstance(obj, polygons.Polygon):
+            description.append([index[vertex] for vertex in obj.vertices])
+        elif isinstance(obj, basic_objects.Point):
+            description.append([
+                None if coordinate is None else index[coordinate]
+                for coordinate in (obj._x, obj._y)
+            ])
+        if obj._relations is not None:
+            description.append(sorted(
+                index[other] for other in obj._relations["contains"]
+            ))
+        # reverse definitions restate these
+        description.append([
+            sympy.srepr(self.abstract(definition.expression))
+            for definition in obj._definitions or ()
+            if definition.source is None
+        ])
+        return description
+
+    def abstract(self, expression: sympy.Expr) -> sympy.Expr:
+        return expression.xreplace({
+            obj: self.placeholder(obj)
+            for obj in core.get_objects_from_expression(expression)
+        })
+
+    def concrete(self, expression: sympy.Expr) -> sympy.Expr:
+        objects = self.plane.objects
+        return expression.xreplace({
+            symbol: objects[int(symbol.name[2:])]
+            for symbol in expression.free_symbols
+        })
+
+
+class FormulaCache:
+    """
+    Attributes:
+        path (str): sqlite file the formulas are stored in.
+        hits (int): Targets answered from the cache.
+        misses (int): Targets that had to be solved.
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path or os.environ.get(
+            "GEOMETRY_SOLVER_FORMULA_CACHE", DEFAULT_PATH
+        )
+        self.hits = 0
+        self.misses = 0
+        self._connection: sqlite3.Connection | None = None
+        self._pid: int | None = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        # connections must not cross a fork, worker processes open their own
+        if self._connection is None or self._pid != os.getpid():
+            import sqlite3
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, timeout=30)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(_SCHEMA)
+            self._pid = os.getpid()
+        return self._connection
+
+    def close(self):
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+
+    def lookup(self, target: core.BaseObject, template: Template | None = None) -> sympy.Expr | None:
+        """
+        Cached closed form of `target` over the given objects of its plane.
+        """
+        template = template or Template(target.plane)
+        row = self.connection.execute(
+            "SELECT formula FROM formulas WHERE template = ? AND target = ?",
+            (template.key, template.index[target])
+        ).fetchone()
+        if row is None:
+            return None
+        return template.concrete(load_formula(row[0]))
+
+    def store(self, target: core.BaseObject, template: Template | None = None):
+        """
+        Remember the closed form of the (defined) `target`.
+        """
+        template = template or Template(target.plane)
+        formula = sympy.srepr(template.abstract(target.closed_form()))
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO formulas VALUES (?, ?, ?)",
+                (template.key, template.index[target], formula)
+            )
+
+    def solve(
+            self,
+            target: core.BaseObject,
+            run: typing.Callable[[], typing.Any] | None = None
+    ) -> sympy.Expr | None:
+        """
+        Value of `target`: the cached formula evaluated on this plane's
+        numbers if that is admissible, else the result of `run`
+        (`target.define` by default), which is cached unless it left
+        several candidates, as the root then depends on the numbers.
+        """
+        if target.is_defined():
+            return target.value
+        # the template must describe the plane before solving adds values
+        template = Template(target.plane)
+        formula = self.lookup(target, template)
+        # the stored root was picked for other numbers
+        if formula is not None and core.BaseDefinition(target, formula).assign():
+            self.hits += 1
+            return target.value
+        self.misses += 1
+        (run or target.define)()
+        if target.is_defined() and target.candidates is None:
+            self.store(target, template)
+        return target.value
@@ -1,5 +1,13 @@
 from geometry_solver.core import core
-from geometry_solver.utils import naming, utils
+from geometry_solver.utils import naming, predicates, utils
+
+
+class Coordinate(core.BaseObject):
+    """
+    A coordinate of a point, any real number.
+    """
+    __slots__ = ()
+    assumptions = {"real": True}
 
 
 class Point(core.BaseObject):
@@ -10,7 +18,8 @@ class Point(core.BaseObject):
         x (int): The x-coordinate of the point.
         y (int): The y-coordinate of the point.
     """
-        
+    __slots__ = ("_x", "_y")
+
     def __init__(self, name: str, plane: "core.Plane", xy: tuple[int | None, int | None] | None = None):
         """
         Initializes a Point object.
@@ -20,16 +29,48 @@ class Point(core.BaseObject):
             A tuple containing the x and y coordinates of the point.
             If None, the point is considered undefined.
         """
-        assert name not in naming.existing_point_names, f"Point {name} already exists!"
-        # XXX: maybe allow it somehow?
-        assert len(name) == 1 and name.isalpha(), "Point must be named as letter"
-        naming.existing_point_names.append(name)
+        plane.point_names.take(name)
         super().__init__(name=name, plane=plane)
-        if xy is None:
-            xy = (None, None)
+        plane.add_point(self)
+        self._x: Coordinate | None = None
+        self._y: Coordinate | None = None
+        if xy is not None:
+            self._build_xy(*xy)
+
+    def _build_xy(self, x: int | None = None, y: int | None = None):
+        self.plane.journal_attribute(self, "_x")
+        self.plane.journal_attribute(self, "_y")
         xname, yname = naming.get_point_xy_name(self)
-        self.x = core.BaseObject(value=xy[0], name=xname, plane=plane)
-        self.y = core.BaseObject(value=xy[1], name=yname, plane=plane)
+        self._x = Coordinate(value=x, name=xname, plane=self.plane)
+        self._y = Coordinate(value=y, name=yname, plane=self.plane)
+
+    # coordinates are rarely needed, so they are created on first access
+    @property
+    def x(self) -> Coordinate:
+        if self._x is None:
+            self._build_xy()
+        return self._x
+
+    @property
+    def y(self) -> Coordinate:
+        if self._y is None:
+            self._build_xy()
+        return self._y
+
+    def known_xy(self) -> "predicates.Point | None":
+        """
+        Coordinates for the predicates, None unless both are known numbers:
+        exact values stay exact, others are approximated by floats.
+        """
+        from geometry_solver.core import values
+        xy = []
+        for coordinate in (self._x, self._y):
+            if coordinate is None or not coordinate.is_defined() \
+            or not coordinate.value.is_number:
+                return None
+            value = values.exact(coordinate.value)
+            xy.append(value if isinstance(value, values.Radical) else float(value))
+        return xy[0], xy[1]
 
 
 class LineSegment(core.BaseObject):
@@ -40,13 +81,16 @@ class LineSegment(core.BaseObject):
         p1 (Point): The first point of the line segment.
         p2 (Point): The second point of the line segment.
     """
+    __slots__ = ("p1", "p2", "_intersections")
+    assumptions = {"positive": True}
+
     def __init__(self, plane: "core.Plane", p1: Point, p2: Point, distance: float | None = None):
         """
         Parameters:
         p1 (Point): The first point of the line segment.
         p2 (Point): The second point of the line segment.
         """
-        if ord(p1.name) > ord(p2.name):
+        if p1.name > p2.name:
             p1, p2 = p2, p1
         self.p1 = p1
         self.p2 = p2
@@ -54,7 +98,13 @@ class LineSegment(core.BaseObject):
             name=naming.get_line_segment_name(self),
             plane=plane, 
             value=distance)
-        self.intersections: dict[LineSegment, Angle] = {}
+        self._intersections: dict[LineSegment, Angle] | None = None
+
+    @property
+    def intersections(self) -> dict["LineSegment", "Angle"]:
+        if self._intersections is None:
+            self._intersections = {}
+        return self._intersections
 
     def get_distance(self):
         """
@@ -77,13 +127,25 @@ class LineSegment(core.BaseObject):
     def end(self):
         return self.p2
 
-    def ccw(self, A: Point, B: Point, C: Point) -> bool:
-        return (C.y - A.y) * (B.x - A.x) > (B.y - A.y) * (C.x - A.x)
+    def ccw(self, A: Point, B: Point, C: Point) -> bool | None:
+        """
+        Whether `A -> B -> C` turns counterclockwise, None if a coordinate
+        isn't known.
+        """
+        points = [point.known_xy() for point in (A, B, C)]
+        if None in points:
+            return None
+        return predicates.orientation(*points) > 0
 
-    def intersects(self, other: "LineSegment") -> bool:
-        A, B = self.p1, self.p2
-        C, D = other.p1, other.p2
-        return self.ccw(A, C, D) != self.ccw(B, C, D) and self.ccw(A, B, C) != self.ccw(A, B, D)
+    def intersects(self, other: "LineSegment") -> bool | None:
+        """
+        Whether the segments have a common point, None if a coordinate
+        isn't known.
+        """
+        points = [point.known_xy() for point in (self.p1, self.p2, other.p1, other.p2)]
+        if None in points:
+            return None
+        return predicates.segments_intersect(*points)
 
 
 class Angle(core.BaseObject):
@@ -94,6 +156,10 @@ class Angle(core.BaseObject):
         line2 (LineSegment): The second line segment.
         degrees (float | None): The measure of the angle in degrees, if defined.
     """
+    __slots__ = ("p1", "p2", "p3", "degrees")
+    # in degrees, strictly between 0 and 180
+    assumptions = {"positive": True}
+    upper_bound = 180
 
     def __init__(self, plane: "core.Plane", p1: Point, p2: Point, p3: Point, degrees: float | None = None):
         """
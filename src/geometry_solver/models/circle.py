@@ -1,8 +1,16 @@
+from __future__ import annotations
+import typing
+
 from geometry_solver.core import core
-from geometry_solver.models import basic_objects, polygons
+if typing.TYPE_CHECKING:
+    from geometry_solver.models import basic_objects, polygons
 
 
 class Circle(core.BaseObject):
+    """
+    A circle, its value is the radius.
+    """
+    assumptions = {"positive": True}
 
     def __init__(
             self, 
@@ -17,5 +25,8 @@ class Circle(core.BaseObject):
         self.inscribed_polygons = inscribed_polygons if inscribed_polygons else []
     
     def inscribe(self, polygon: "polygons.Polygon"):
+        self.plane.journal(list.pop, self.inscribed_polygons)
+        self.plane.journal_attribute(polygon, "inscribed_in")
         self.inscribed_polygons.append(polygon)
-        polygon.inscribed_in = self
\ No newline at end of file
+        polygon.inscribed_in = self
+        self.plane.rules.fire(polygon, "inscribed_in", circumcircle=self)
\ No newline at end of file
@@ -1,7 +1,11 @@
+import math
+import typing
+
 from geometry_solver.core import core
 from geometry_solver.models import basic_objects, circle
 from geometry_solver.utils import utils, naming
-from geometry_solver.definitions import definitions
+if typing.TYPE_CHECKING:
+    import numpy as np
 
 
 class Polygon(core.BaseObject):
@@ -14,6 +18,14 @@ class Polygon(core.BaseObject):
         A list of points representing the vertices of the polygon.
     edges : list[basic_objects.LineSegment]
         A list of line segments representing the edges of the polygon."
+    angles : list[basic_objects.Angle]
+        Interior angles, the i-th one is at the i-th vertex.
+    perpendicular_bisectors : list[basic_objects.LineSegment]
+        Perpendicular bisectors, the i-th one is drawn to the i-th edge.
+
+    Edges, angles and bisectors are created on first access, one at a time
+    with `edge(i)`, `angle(i)` and `perpendicular_bisector(i)`, or all in
+    one pass through the list attributes above.
     """
 
     def __init__(
@@ -31,7 +43,6 @@ class Polygon(core.BaseObject):
 
         Attributes:
             vertices (list[basic_objects.Point]): The vertices of the polygon.
-            edges (list[basic_objects.LineSegment]): The edges of the polygon, created by connecting consecutive vertices.
 
         The polygon is considered defined if all its vertices are defined.
         """
@@ -42,45 +53,154 @@ class Polygon(core.BaseObject):
             name=naming.get_polygon_name(self),
             plane=plane
             )
-        self.edges: list[basic_objects.LineSegment] = []
-        for vertex1, vertex2 in zip(vertices, vertices[1:] + [vertices[0]]):
-            self.edges.append(basic_objects.LineSegment(plane, vertex1, vertex2))
-        self.angles = []
-        self.plane = plane
-        for vertex_i in range(2, len(vertices)):
-            self.angles.append(plane.angle(
-                vertices[vertex_i - 2],
-                vertices[vertex_i - 1],
-                vertices[vertex_i]
-                ))
+        self._edges: list[basic_objects.LineSegment | None] = [None] * len(vertices)
+        self._angles: list[basic_objects.Angle | None] = [None] * len(vertices)
+        self._bisectors: list[basic_objects.LineSegment | None] = (
+            [None] * len(vertices)
+        )
+        self._edge_indices: dict[frozenset[basic_objects.Point], int] | None = None
         self.is_cyclic = is_cyclic
         self.inscribed_in: circle.Circle = inscribed_in
 
         if self.inscribed_in:
             self.is_cyclic = True
             self.build_circumcircle()
-        
-        
-    def build_perpendicular_bisector(self, to_side: basic_objects.LineSegment):
-        if to_side not in self.edges:
-            raise ValueError(
-                f"{to_side} is not in {self}!")
-        start_point, end_point = naming.get_perpendicular_bisector_edge_points(object=to_side)
-        to_point = basic_objects.Point(name=start_point)
+        self.plane.rules.fire(self, "created")
+
+    def _cache(
+            self,
+            cache: list,
+            index: int,
+            obj: core.BaseObject
+        ) -> core.BaseObject:
+        cache[index] = obj
+        self.plane.journal(list.__setitem__, cache, index, None)
+        return obj
+
+    def edge(self, index: int) -> basic_objects.LineSegment:
+        """
+        Edge from the `index`-th vertex to the next one.
+        """
+        index %= len(self.vertices)
+        edge = self._edges[index]
+        if edge is None:
+            edge = self._cache(self._edges, index, self.plane.segment(
+                self.vertices[index],
+                self.vertices[(index + 1) % len(self.vertices)]
+            ))
+        return edge
+
+    def angle(self, index: int) -> basic_objects.Angle:
+        """
+        Interior angle at the `index`-th vertex.
+        """
+        index %= len(self.vertices)
+        angle = self._angles[index]
+        if angle is None:
+            angle = self._cache(self._angles, index, self.plane.angle(
+                self.vertices[index - 1],
+                self.vertices[index],
+                self.vertices[(index + 1) % len(self.vertices)]
+            ))
+        return angle
+
+    def perpendicular_bisector(self, index: int) -> basic_objects.LineSegment:
+        """
+        Perpendicular bisector drawn to the `index`-th edge from the opposite
+        vertex (odd amount of vertices) or opposite edge's middle (even).
+        """
+        index %= len(self.vertices)
+        bisector = self._bisectors[index]
+        if bisector is not None:
+            return bisector
+        n = len(self.vertices)
+        to_side = self.edge(index)
+        to_point = self.plane.midpoint(to_side)
         to_side.add_point(to_point)
-        to_side_idx = self.edges.index(to_side)
-        from_side = self.edges[to_side_idx + len(self.edges) // 2]
-        if len(self.edges) % 2 == 0:
-            from_point = basic_objects.Point(name=end_point)
+        if n % 2 == 0:
+            from_side = self.edge(index + n // 2)
+            from_point = self.plane.midpoint(from_side)
             from_side.add_point(from_point)
         else:
-            from_point = from_side.end()
-        
-        return basic_objects.LineSegment(
-            plane=self.plane,
-            p1=from_point, 
-            p2=to_point
-            )
+            from_point = self.vertices[(index + n // 2 + 1) % n]
+        return self._cache(
+            self._bisectors, index, self.plane.segment(from_point, to_point)
+        )
+
+    @property
+    def edges(self) -> list[basic_objects.LineSegment]:
+        for index, edge in enumerate(self._edges):
+            if edge is None:
+                self.edge(index)
+        return self._edges  # type: ignore[return-value]
+
+    @property
+    def angles(self) -> list[basic_objects.Angle]:
+        for index, angle in enumerate(self._angles):
+            if angle is None:
+                self.angle(index)
+        return self._angles  # type: ignore[return-value]
+
+    @property
+    def perpendicular_bisectors(self) -> list[basic_objects.LineSegment]:
+        for index, bisector in enumerate(self._bisectors):
+            if bisector is None:
+                self.perpendicular_bisector(index)
+        return self._bisectors  # type: ignore[return-value]
+
+    def edge_index(self, side: basic_objects.LineSegment) -> int:
+        if self._edge_indices is None:
+            n = len(self.vertices)
+            self._edge_indices = {
+                frozenset((self.vertices[i], self.vertices[(i + 1) % n])): i
+                for i in range(n)
+            }
+        index = self._edge_indices.get(frozenset((side.p1, side.p2)))
+        if index is None:
+            raise ValueError(
+                f"{side} is not in {self}!")
+        return index
+
+    def coordinates(self) -> "np.ndarray | None":
+        """
+        Vertex coordinates as an `(n, 2)` array, None unless all of them
+        are known numbers.
+        """
+        values = []
+        for vertex in self.vertices:
+            for coordinate in (vertex._x, vertex._y):
+                if coordinate is None or not coordinate.is_defined() \
+                or not coordinate.value.is_number:
+                    return None
+                values.append(float(coordinate.value))
+        # numpy is only needed once figures have numeric coordinates
+        import numpy as np
+        return np.array(values).reshape(-1, 2)
+
+    def centroid(self) -> tuple[float, float] | None:
+        coordinates = self.coordinates()
+        if coordinates is None:
+            return None
+        from geometry_solver.utils import batch
+        x, y = batch.centroids(coordinates)
+        return float(x), float(y)
+
+    def circumcenter(self) -> tuple[float, float] | None:
+        """
+        Center of the circle through the first three vertices, None if the
+        coordinates aren't known or the vertices are collinear.
+        """
+        coordinates = self.coordinates()
+        if coordinates is None:
+            return None
+        from geometry_solver.utils import batch
+        (x, y), radius = batch.circumcircles(coordinates[:3])
+        if not math.isfinite(radius):
+            return None
+        return float(x), float(y)
+
+    def build_perpendicular_bisector(self, to_side: basic_objects.LineSegment):
+        return self.perpendicular_bisector(self.edge_index(to_side))
 
     def build_circumcircle(
             self, 
@@ -88,12 +208,18 @@ class Polygon(core.BaseObject):
             radius = None
             ):
         # XXX: warn if already inscribed?
+        self.plane.journal_attribute(self, "is_cyclic")
+        self.plane.journal_attribute(self, "inscribed_in")
         if not check_if_possible:
             self.is_cyclic = True
         else:
+            coordinates = self.coordinates()
+            if coordinates is not None:
+                from geometry_solver.utils import batch
+                self.is_cyclic = bool(batch.are_cyclic(coordinates))
             assert self.is_cyclic, "Non-cyclic polygons cannot be inscribed."
         center = basic_objects.Point(
-            naming.get_new_point_name(),
+            self.plane.point_names.new_name(),
             plane=self.plane)
         circumcircle = circle.Circle(
             name=naming.get_circumcircle_name(self),
@@ -103,16 +229,8 @@ class Polygon(core.BaseObject):
             radius=radius
         )
         self.inscribed_in = circumcircle
+        self.plane.rules.fire(self, "inscribed_in", circumcircle=circumcircle)
         return circumcircle
-        # prev = None
-        # for to_edge in self.edges:
-        #     bisector = self.build_perpendicular_bisector(to_edge)
-        #     if prev is None:
-        #         continue
-        #     if bisector.intersects(prev):
-        #         self.is_cyclic = False
-        #         return None
-        #     prev = bisector
                     
   
 class Triangle(Polygon):
@@ -135,6 +253,16 @@ class Triangle(Polygon):
             inscribed_in=inscribed_in
             )
 
+    def incenter(self) -> tuple[float, float] | None:
+        coordinates = self.coordinates()
+        if coordinates is None:
+            return None
+        from geometry_solver.utils import batch
+        (x, y), radius = batch.incircles(coordinates)
+        if not math.isfinite(radius):
+            return None
+        return float(x), float(y)
+
 
 class RegularTriangle(Triangle):
 
@@ -149,30 +277,15 @@ class RegularTriangle(Triangle):
         if not side_length:
             return
         for edge in self.edges:
-            if not edge.is_constant():  
+            if not edge.is_defined():
                 edge.set_value(side_length)
             assert edge is None or edge.value == side_length
         self.edges[0].as_new_relation == self.edges[1]
         self.edges[1].as_new_relation == self.edges[2]
     
     def get_side(self):
-        return self.edges[0]
+        return self.edge(0)
 
-    def build_circumcircle(
-            self,
-            check_if_possible = False,
-            radius = None
-            ):
-        super().build_circumcircle(
-            check_if_possible,
-            radius=radius
-            )
-        self.inscribed_in.add_definition(
-            definitions.circumcirle_radius_of_regular_triangle(
-            circumcircle=self.inscribed_in,
-            tri=self
-        ))
-    
 
 def triangle(
         plane, 
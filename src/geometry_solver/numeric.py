@@ -0,0 +1,322 @@
+"""
+Numeric mode: embed the points of a Plane in coordinates.
+
+Constraints of the Plane (known lengths, angles in degrees, equality
+relations, definitions and points of polygons inscribed in circles) are
+turned into a residual vector over point coordinates and unknown radii,
+which is solved by Levenberg-Marquardt least squares. Any measurable
+quantity is then read off the coordinates as a float.
+
+    solution = numeric.solve(plane, target=tri.get_side(), verify=True)
+    solution.value(tri.get_side())  # 13.856...
+
+The frame is fixed by putting the first point at the origin and the
+second one on the x axis, unless some coordinates are known.
+"""
+from __future__ import annotations
+import math
+import typing
+
+import numpy as np
+import sympy
+
+from geometry_solver.core import core
+from geometry_solver.models import basic_objects, circle, polygons
+
+if typing.TYPE_CHECKING:
+    from geometry_solver.plane import Plane
+
+# vectorized over leading axes: (..., variables) -> (...)
+Measure = typing.Callable[[np.ndarray], np.ndarray]
+
+DEGREE = math.pi / 180
+
+
+class NumericModel:
+    """
+    Residual system of a Plane.
+
+    Attributes:
+        variables (int): Amount of unknowns.
+        residuals (list[Measure]): Functions that are zero when the
+        constraints hold.
+    """
+
+    def __init__(self, plane: "Plane"):
+        self.plane = plane
+        self.variables = 0
+        self.residuals: list[Measure] = []
+        self._points: dict[basic_objects.Point, tuple[Measure, Measure]] = {}
+        self._scalars: dict[core.BaseObject, Measure] = {}
+        self._coordinates: dict[core.BaseObject, tuple[basic_objects.Point, int]] = {}
+        for point in plane.points.values():
+            for axis, coordinate in enumerate((point._x, point._y)):
+                if coordinate is not None:
+                    self._coordinates[coordinate] = (point, axis)
+        self._gauge: list[basic_objects.Point] | None = None
+        if not any(obj.is_defined() for obj in self._coordinates):
+            self._gauge = []
+        self._build()
+
+    def _variable(self) -> Measure:
+        index = self.variables
+        self.variables += 1
+        return lambda x: x[..., index]
+
+    def point(self, point: basic_objects.Point) -> tuple[Measure, Measure]:
+        if point not in self._points:
+            zero: Measure = lambda x: np.zeros(x.shape[:-1])
+            if self._gauge is not None and len(self._gauge) < 2:
+                self._gauge.append(point)
+                # first point is the origin, second one lies on the x axis
+                x = zero if len(self._gauge) == 1 else self._variable()
+                self._points[point] = (x, zero)
+            else:
+                self._points[point] = (self._variable(), self._variable())
+        return self._points[point]
+
+    def measure(self, obj: core.BaseObject) -> Measure | None:
+        """
+        Numeric value of `obj` as a function of the unknowns, or None if
+        it can't be measured on coordinates.
+        """
+        if isinstance(obj, basic_objects.LineSegment):
+            return self._side(obj.p1, obj.p2)
+        if isinstance(obj, basic_objects.Angle):
+            (x1, y1), (x2, y2), (x3, y3) = (
+                self.point(obj.p1), self.point(obj.p2), self.point(obj.p3)
+            )
+
+            def degrees(x):
+                ux, uy = x1(x) - x2(x), y1(x) - y2(x)
+                vx, vy = x3(x) - x2(x), y3(x) - y2(x)
+                return np.degrees(np.arctan2(
+                    np.abs(ux * vy - uy * vx), ux * vx + uy * vy
+                ))
+            return degrees
+        if obj in self._coordinates:
+            point, axis = self._coordinates[obj]
+            return self.point(point)[axis]
+        # polygons have no numeric value of their own
+        if isinstance(obj, (basic_objects.Point, polygons.Polygon)):
+            return None
+        # circles' radii and plain quantities are unknowns of their own
+        if obj not in self._scalars:
+            self._scalars[obj] = self._variable()
+        return self._scalars[obj]
+
+    def _add(self, residual: Measure, scale: float = 1.0):
+        if scale == 1.0:
+            self.residuals.append(residual)
+        else:
+            self.residuals.append(lambda x: scale * residual(x))
+
+    def _scale(self, obj: core.BaseObject) -> float:
+        # angles are compared in radians to keep residuals comparable
+        return DEGREE if isinstance(obj, basic_objects.Angle) else 1.0
+
+    def _build(self):
+        for obj in list(self.plane.objects):
+            if obj.is_defined():
+                measure = self.measure(obj)
+                if measure is not None and obj.value.is_number:
+                    value = float(obj.value)
+                    self._add(
+                        lambda x, m=measure, v=value: m(x) - v, self._scale(obj)
+                    )
+            for definition in obj._definitions or ():
+                if definition.source is None:
+                    self._add_definition(definition)
+            if isinstance(obj, circle.Circle):
+                self._add_circle(obj)
+            if isinstance(obj, polygons.RegularTriangle):
+                self._add_regular(obj)
+        for members in self.plane.relations.classes():
+            measures = [self.measure(obj) for obj in members]
+            measures = [measure for measure in measures if measure is not None]
+            for first, second in zip(measures, measures[1:]):
+                self._add(
+                    lambda x, a=first, b=second: a(x) - b(x),
+                    self._scale(members[0])
+                )
+
+    def _add_definition(self, definition: core.BaseDefinition):
+        objects = sorted(definition.objects, key=lambda obj: obj.uid)
+        measures = [self.measure(obj) for obj in objects]
+        target = self.measure(definition.target)
+        if target is None or any(measure is None for measure in measures):
+            return
+        function = sympy.lambdify(
+            objects, definition.expression, modules="numpy", dummify=True
+        )
+        self._add(
+            lambda x: target(x) - function(*(measure(x) for measure in measures)),
+            self._scale(definition.target)
+        )
+
+    def _add_circle(self, figure: circle.Circle):
+        radius = self.measure(figure)
+        cx, cy = self.point(figure.center)
+        for polygon in figure.inscribed_polygons:
+            for vertex in polygon.vertices:
+                vx, vy = self.point(vertex)
+                self._add(
+                    lambda x, vx=vx, vy=vy: np.hypot(vx(x) - cx(x), vy(x) - cy(x))
+                    - radius(x)
+                )
+
+    def _side(self, p1: basic_objects.Point, p2: basic_objects.Point) -> Measure:
+        # edges of polygons are created lazily, measure them on the vertices
+        (x1, y1), (x2, y2) = self.point(p1), self.point(p2)
+        return lambda x: np.hypot(x1(x) - x2(x), y1(x) - y2(x))
+
+    def _add_regular(self, polygon: polygons.Polygon):
+        n = len(polygon.vertices)
+        sides = [
+            self._side(polygon.vertices[i], polygon.vertices[(i + 1) % n])
+            for i in range(n)
+        ]
+        for first, second in zip(sides, sides[1:]):
+            self._add(lambda x, a=first, b=second: a(x) - b(x))
+
+    def residual(self, x: np.ndarray) -> np.ndarray:
+        """
+        Residuals for one (`(variables,)`) or many (`(k, variables)`)
+        points of the search space, stacked along the last axis.
+        """
+        if not self.residuals:
+            return np.zeros(x.shape[:-1] + (0,))
+        return np.stack(
+            [np.broadcast_to(residual(x), x.shape[:-1]) for residual in self.residuals],
+            axis=-1
+        )
+
+
+class NumericSolution:
+    """
+    Attributes:
+        x (np.ndarray): Values of the unknowns.
+        error (float): Largest absolute residual.
+        converged (bool): Whether `error` is within tolerance.
+        verified (bool | None): Agreement with the symbolic engine, None if
+        not checked or if it couldn't determine the target.
+    """
+
+    def __init__(self, model: NumericModel, x: np.ndarray, error: float, tolerance: float):
+        self.model = model
+        self.x = x
+        self.error = error
+        self.converged = error <= tolerance
+        self.verified: bool | None = None
+
+    def value(self, obj: core.BaseObject) -> float | None:
+        measure = self.model.measure(obj)
+        # objects the model didn't know of get unknowns nothing constrains
+        if measure is None or self.model.variables > len(self.x):
+            return None
+        return float(measure(self.x))
+
+    def coordinates(self, point: basic_objects.Point) -> tuple[float, float]:
+        x, y = self.model.point(point)
+        return float(x(self.x)), float(y(self.x))
+
+
+def least_squares(
+        model: NumericModel,
+        x: np.ndarray,
+        iterations: int = 200,
+        tolerance: float = 1e-10
+) -> tuple[np.ndarray, float]:
+    """
+    Levenberg-Marquardt with a forward difference Jacobian, evaluated for
+    all perturbations in one vectorized call.
+    """
+    damping = 1e-3
+    residual = model.residual(x)
+    cost = residual @ residual
+    identity = np.eye(len(x))
+    for _ in range(iterations):
+        if cost <= tolerance ** 2:
+            break
+        step = 1e-7 * np.maximum(1.0, np.abs(x))
+        jacobian = ((model.residual(x + identity * step) - residual) / step[:, None]).T
+        gradient = jacobian.T @ residual
+        normal = jacobian.T @ jacobian
+        diagonal = np.diag(normal) + 1e-12
+        while True:
+            try:
+                delta = np.linalg.solve(normal + damping * np.diag(diagonal), -gradient)
+            except np.linalg.LinAlgError:
+                damping *= 10
+                continue
+            candidate = x + delta
+            candidate_residual = model.residual(candidate)
+            candidate_cost = candidate_residual @ candidate_residual
+            if candidate_cost < cost:
+                x, residual, cost = candidate, candidate_residual, candidate_cost
+                damping = max(damping / 3, 1e-12)
+                break
+            damping *= 4
+            if damping > 1e12:
+                return x, float(np.max(np.abs(residual)))
+        if np.max(np.abs(delta)) <= 1e-14 * (1 + np.max(np.abs(x))):
+            break
+    return x, float(np.max(np.abs(residual), initial=0.0))
+
+
+def solve(
+        plane: "Plane",
+        target: core.BaseObject | None = None,
+        verify: bool = False,
+        restarts: int = 8,
+        tolerance: float = 1e-9,
+        seed: int | None = 0
+) -> NumericSolution:
+    """
+    Find coordinates satisfying the constraints of `plane`.
+
+    Args:
+        target (core.BaseObject | None): Quantity of interest; it's added to
+        the model if nothing constrains it yet, and checked when `verify`.
+        verify (bool): Compare the target with the symbolic engine, without
+        changing the plane.
+        restarts (int): Random starting points tried before giving up.
+    """
+    model = NumericModel(plane)
+    if target is not None:
+        model.measure(target)
+    generator = np.random.default_rng(seed)
+    known_lengths = [
+        abs(float(obj.value)) for obj in plane.objects
+        if obj.is_defined() and obj.value.is_number
+        and not isinstance(obj, basic_objects.Angle)
+    ]
+    scale = max(known_lengths) if known_lengths else 1.0
+    best: tuple[np.ndarray, float] | None = None
+    for _ in range(max(restarts, 1)):
+        start = generator.uniform(-scale, scale, model.variables)
+        x, error = least_squares(model, start, tolerance=tolerance)
+        if best is None or error < best[1]:
+            best = (x, error)
+        if error <= tolerance:
+            break
+    solution = NumericSolution(model, best[0], best[1], tolerance)
+    if verify and target is not None:
+        solution.verified = verify_symbolically(plane, target, solution)
+    return solution
+
+
+def verify_symbolically(
+        plane: "Plane",
+        target: core.BaseObject,
+        solution: NumericSolution,
+        tolerance: float = 1e-6
+) -> bool | None:
+    numeric = solution.value(target)
+    with plane.fork():
+        if not target.is_defined():
+            target.define()
+        symbolic = target.value
+    if numeric is None or symbolic is None or not symbolic.is_number:
+        return None
+    return math.isclose(numeric, float(symbolic), rel_tol=tolerance, abs_tol=tolerance)
@@ -1,33 +1,304 @@
+from __future__ import annotations
+import collections
+import contextlib
 import itertools
+import typing
 
-from geometry_solver.models import basic_objects
+from geometry_solver.core import relations
+from geometry_solver.definitions import rules
+from geometry_solver.utils import naming
+# sympy and numpy are imported with the first object, not with the Plane
+if typing.TYPE_CHECKING:
+    from geometry_solver import numeric
+    from geometry_solver.core import core, system
+    from geometry_solver.models import basic_objects
+
+
+# plane serials start at 1, 0 is reserved for objects without a plane
+_plane_serials = itertools.count(1)
+
+
+class Snapshot:
+    """
+    A point in the history of a Plane that it can be restored to.
+    """
+    __slots__ = ("plane", "position")
+
+    def __init__(self, plane: "Plane", position: int):
+        self.plane = plane
+        self.position = position
 
 
 class Plane:
 
-    def __init__(self) -> None:
-        self.points: list[basic_objects.Point] = []
+    def __init__(self, registry: "rules.RuleRegistry | None" = None) -> None:
+        """
+        Args:
+            registry (rules.RuleRegistry | None): Rules applied to figures of
+            this plane. Defaults to the library in `geometry_solver.definitions`.
+        """
+        self._rules = registry
+        self.serial = next(_plane_serials)
+        self._uids = itertools.count()
+        # undo entries `(function, *args)`, kept only while snapshots exist
+        self.trail: list[tuple] | None = None
+        self._snapshots = 0
+        self.objects: list[core.BaseObject] = []
+        # reverse index: object -> definitions that read it
+        self.dependents: collections.defaultdict[
+            core.BaseObject, list[core.BaseDefinition]
+            ] = collections.defaultdict(list)
+        # used as an ordered set
+        self.dirty_definitions: dict[core.BaseDefinition, None] = {}
+        # called with every object whose value was set
+        self.value_listeners: list[typing.Callable[[core.BaseObject], None]] = []
+        self.relations = relations.RelationGraph(self)
+        # canonical keys make lookups O(1) and creation idempotent:
+        # segments by unordered endpoints, angles by vertex + unordered ends
+        self.points: dict[str, basic_objects.Point] = {}
+        self.point_names = naming.PointNames(self)
+        self.segments: dict[
+            frozenset[basic_objects.Point], basic_objects.LineSegment
+            ] = {}
         self.angles: dict[
             tuple[
-                "basic_objects.Point",
-                "basic_objects.Point",
-                "basic_objects.Point"
+                basic_objects.Point,
+                frozenset[basic_objects.Point]
                 ],
             basic_objects.Angle
             ] = {}
-    
+        self.midpoints: dict[
+            basic_objects.LineSegment, basic_objects.Point
+            ] = {}
+
+    @property
+    def rules(self) -> rules.RuleRegistry:
+        if self._rules is None:
+            self._rules = rules.load_library()
+        return self._rules
+
+    def allocate_uid(self) -> tuple[int, int]:
+        return (self.serial, next(self._uids))
+
+    def add_object(self, obj: "core.BaseObject"):
+        self.objects.append(obj)
+        self.journal(list.pop, self.objects)
+
+    def index_definition(self, definition: "core.BaseDefinition"):
+        for obj in definition.depends_on:
+            dependents = self.dependents[obj]
+            dependents.append(definition)
+            self.journal(list.pop, dependents)
+        self.mark_definition_dirty(definition)
+
+    def mark_definition_dirty(self, definition: "core.BaseDefinition"):
+        if definition not in self.dirty_definitions:
+            self.dirty_definitions[definition] = None
+            self.journal(dict.pop, self.dirty_definitions, definition)
+
+    def value_changed(self, obj: "core.BaseObject"):
+        self.mark_dirty(obj)
+        for listener in self.value_listeners:
+            listener(obj)
+
+    def mark_dirty(self, obj: "core.BaseObject"):
+        """
+        Mark definitions that read `obj` as affected by its new value.
+        """
+        for definition in self.dependents.get(obj, ()):
+            definition.set_dirty(True)
+            self.mark_definition_dirty(definition)
+
+    def add_point(self, point: "basic_objects.Point"):
+        self.points[point.name] = point
+        self.journal(dict.pop, self.points, point.name)
+
+    def point(self, name: str) -> "basic_objects.Point":
+        """
+        Get the point named `name`, creating it if it doesn't exist yet.
+        """
+        if name in self.points:
+            return self.points[name]
+        from geometry_solver.models import basic_objects
+        return basic_objects.Point(name, self)
+
+    def segment(
+            self,
+            p1: "basic_objects.Point",
+            p2: "basic_objects.Point",
+            distance: float | None = None
+            ) -> "basic_objects.LineSegment":
+        """
+        Get the segment between `p1` and `p2` in any order, creating it
+        if it doesn't exist yet.
+        """
+        key = frozenset((p1, p2))
+        segment = self.segments.get(key)
+        if segment is None:
+            from geometry_solver.models import basic_objects
+            segment = basic_objects.LineSegment(self, p1, p2, distance)
+            self.segments[key] = segment
+            self.journal(dict.pop, self.segments, key)
+        elif distance is not None and not segment.is_defined():
+            segment.set_value(distance)
+        return segment
+
+    def midpoint(
+            self,
+            segment: "basic_objects.LineSegment"
+            ) -> "basic_objects.Point":
+        """
+        Get the middle point of `segment`, creating it if it doesn't exist yet.
+        """
+        point = self.midpoints.get(segment)
+        if point is None:
+            from geometry_solver.models import basic_objects
+            point = basic_objects.Point(self.point_names.new_name(), self)
+            self.midpoints[segment] = point
+            self.journal(dict.pop, self.midpoints, segment)
+        return point
+
     def angle(
             self,
             p1: "basic_objects.Point",
-            p2: "basic_objects.Point", 
+            p2: "basic_objects.Point",
             p3: "basic_objects.Point",
             degrees: float | None = None
-            ):
-        for points_perm in itertools.permutations((p1,p2,p3)):
-
-            if points_perm in self.angles:
-                return self.angles[(points_perm)] # type: ignore[index]
-                    
-        self.angles[(p1, p2, p3)] = basic_objects.Angle(
-                self, p1, p2, p3, degrees
-            )
\ No newline at end of file
+            ) -> "basic_objects.Angle":
+        """
+        Get the angle `p1p2p3` with vertex `p2`, creating it if it doesn't
+        exist yet. `p1p2p3` and `p3p2p1` are the same angle.
+        """
+        key = (p2, frozenset((p1, p3)))
+        angle = self.angles.get(key)
+        if angle is None:
+            from geometry_solver.models import basic_objects
+            angle = basic_objects.Angle(self, p1, p2, p3, degrees)
+            self.angles[key] = angle
+            self.journal(dict.pop, self.angles, key)
+        elif degrees is not None and not angle.is_defined():
+            angle.set_value(degrees)
+        return angle
+
+    def propagate(self) -> list["core.BaseObject"]:
+        """
+        Alternative to the recursive `BaseObject.define`: push known values
+        forward through definitions until nothing changes.
+
+        Only definitions marked dirty by `BaseObject.set_value` (or newly
+        added ones) are looked at, and each of them is re-checked once per
+        change of its inputs, so the cost grows with the number of affected
+        definitions and not with the depth of the definition chains.
+
+        Returns:
+            list[core.BaseObject]: Objects defined by this call, in the order
+            they were determined.
+        """
+        from geometry_solver.core import core
+
+        defined: list[core.BaseObject] = []
+        while self.dirty_definitions:
+            definition, _ = self.dirty_definitions.popitem()
+            self.journal(dict.__setitem__, self.dirty_definitions, definition, None)
+            target = definition.target
+            # self-referencing definitions need solving, not substitution
+            if target.is_defined() or target in definition.objects:
+                continue
+            if not definition.is_constant():
+                continue
+            if definition.assign():
+                defined.append(target)
+        return defined
+
+    def find_intersections(
+            self
+    ) -> list[tuple["basic_objects.Point", list["basic_objects.LineSegment"]]]:
+        """
+        Intersect all segments with known endpoints in one sweep, see
+        `intersections.find_intersections`.
+        """
+        from geometry_solver.utils import intersections
+        return intersections.find_intersections(self)
+
+    def solve_all(self) -> "system.SystemSolution":
+        """
+        Alternative to defining objects one by one: solve every definition,
+        equality relation and known value of the Plane as one system,
+        split into blocks that are solved once each.
+        """
+        from geometry_solver.core import system
+        return system.solve_system(self.objects)
+
+    def solve_numeric(
+            self,
+            target: "core.BaseObject | None" = None,
+            verify: bool = False,
+            **kwargs
+    ) -> "numeric.NumericSolution":
+        """
+        Embed the points in coordinates by least squares instead of solving
+        symbolically, see `numeric.solve`.
+        """
+        from geometry_solver import numeric
+        return numeric.solve(self, target, verify=verify, **kwargs)
+
+    def journal(self, undo: typing.Callable, *args):
+        """
+        Remember how to undo a change, if there is a snapshot to restore.
+        """
+        if self.trail is not None:
+            self.trail.append((undo, *args))
+
+    def journal_attribute(self, obj: typing.Any, attribute: str):
+        """
+        Remember the current value of `obj.attribute` before changing it.
+        """
+        if self.trail is not None:
+            self.trail.append((setattr, obj, attribute, getattr(obj, attribute)))
+
+    def snapshot(self) -> Snapshot:
+        """
+        Start recording changes so the Plane can be restored to this state.
+
+        Nothing is copied up front: every change made afterwards journals
+        how to undo itself, so a snapshot costs memory proportional to the
+        amount of changes, not to the size of the Plane. Snapshots nest and
+        can be restored any number of times; `release` them when done.
+        """
+        if self.trail is None:
+            self.trail = []
+        self._snapshots += 1
+        return Snapshot(self, len(self.trail))
+
+    def restore(self, snapshot: Snapshot):
+        """
+        Undo every change made since `snapshot` was taken.
+        """
+        if snapshot.plane is not self:
+            raise ValueError("Snapshot belongs to another plane")
+        if self.trail is None or len(self.trail) < snapshot.position:
+            raise ValueError("Snapshot is no longer valid")
+        while len(self.trail) > snapshot.position:
+            undo, *args = self.trail.pop()
+            undo(*args)
+
+    def release(self, snapshot: Snapshot):
+        """
+        Stop keeping history for `snapshot`. Changes made since are kept.
+        """
+        self._snapshots -= 1
+        if self._snapshots == 0:
+            self.trail = None
+
+    @contextlib.contextmanager
+    def fork(self) -> typing.Iterator["Plane"]:
+        """
+        Branch for trying a hypothesis: everything done to the Plane inside
+        the `with` block is rolled back when it exits.
+        """
+        snapshot = self.snapshot()
+        try:
+            yield self
+        finally:
+            self.restore(snapshot)
+            self.release(snapshot)
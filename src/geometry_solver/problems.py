@@ -0,0 +1,210 @@
+"""
+Building and solving problems described as plain JSON specs.
+
+A spec lists figures, known quantities and the target quantity:
+
+    {
+        "id": "mvp",
+        "figures": [
+            {"type": "RegularTriangle", "vertices": ["a", "b", "c"]},
+            {"type": "Circle", "circumscribes": ["a", "b", "c"], "radius": 8}
+        ],
+        "known": [{"segment": ["a", "b"], "value": "8*sqrt(3)"}],
+        "target": {"segment": ["a", "b"]}
+    }
+
+Quantities are referenced as `{"segment": [p1, p2]}`,
+`{"angle": [p1, vertex, p2]}` or `{"circle": [vertices of the polygon
+it circumscribes]}`. Values are numbers or strings of arithmetic on
+numbers, `sqrt` and `pi`; specs may come from untrusted files, so the
+strings are never evaluated.
+"""
+from __future__ import annotations
+import ast
+import operator
+import time
+import typing
+
+import sympy
+
+from geometry_solver.core import core, search, values
+from geometry_solver.models import circle, polygons
+from geometry_solver.formulas import FormulaCache
+from geometry_solver.plane import Plane
+
+POLYGON_TYPES: dict[str, type[polygons.Polygon]] = {
+    "Polygon": polygons.Polygon,
+    "Triangle": polygons.Triangle,
+    "RegularTriangle": polygons.RegularTriangle,
+}
+
+ENGINES = ("define", "propagate", "search")
+
+_OPERATORS: dict[type[ast.AST], typing.Callable[..., typing.Any]] = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: operator.truediv, ast.Pow: operator.pow,
+    ast.USub: operator.neg, ast.UAdd: operator.pos,
+}
+_FUNCTIONS = {"sqrt": sympy.sqrt}
+_CONSTANTS = {"pi": sympy.pi}
+MAX_EXPONENT = 64
+
+
+class Problem:
+    """
+    A Plane built from a spec, with access to its figures by vertex names.
+    """
+
+    def __init__(self, spec: dict[str, typing.Any]):
+        self.spec = spec
+        self.plane = Plane()
+        self.polygons: dict[tuple[str, ...], polygons.Polygon] = {}
+        self.circles: dict[tuple[str, ...], circle.Circle] = {}
+        for figure in spec.get("figures", []):
+            self.add_figure(figure)
+        for known in spec.get("known", []):
+            self.quantity(known).set_value(parse_value(known["value"]))
+        self.target = self.quantity(spec["target"])
+
+    def add_figure(self, figure: dict[str, typing.Any]):
+        kind = figure["type"]
+        if kind in POLYGON_TYPES:
+            vertices = [self.plane.point(name) for name in figure["vertices"]]
+            kwargs = {}
+            if kind == "Polygon":
+                kwargs["is_cyclic"] = figure.get("is_cyclic")
+            if "side_length" in figure:
+                kwargs["side_length"] = parse_value(figure["side_length"])
+            self.polygons[tuple(figure["vertices"])] = POLYGON_TYPES[kind](
+                self.plane, vertices, **kwargs
+            )
+        elif kind == "Circle":
+            radius = figure.get("radius")
+            if radius is not None:
+                radius = parse_value(radius)
+            if "circumscribes" in figure:
+                key = tuple(figure["circumscribes"])
+                polygon = self.polygons[key]
+                polygon.build_circumcircle(radius=radius)
+                self.circles[key] = polygon.inscribed_in
+            else:
+                center = self.plane.point(figure["center"])
+                self.circles[(figure["center"],)] = circle.Circle(
+                    name=figure.get("name", f"o{center.name}"),
+                    plane=self.plane,
+                    center=center,
+                    radius=radius
+                )
+        else:
+            raise ValueError(f"Unknown figure type: {kind}")
+
+    def quantity(self, ref: dict[str, typing.Any]) -> core.BaseObject:
+        if "segment" in ref:
+            p1, p2 = (self.plane.point(name) for name in ref["segment"])
+            return self.plane.segment(p1, p2)
+        if "angle" in ref:
+            p1, p2, p3 = (self.plane.point(name) for name in ref["angle"])
+            return self.plane.angle(p1, p2, p3)
+        if "circle" in ref:
+            return self.circles[tuple(ref["circle"])]
+        raise ValueError(f"Unknown quantity: {ref}")
+
+    def solve(
+            self,
+            engine: str = "define",
+            formulas: FormulaCache | None = None
+    ) -> sympy.Expr | None:
+        """
+        Args:
+            formulas (FormulaCache | None): Cache to look the target's
+            formula up in before solving, and to store it in after.
+        """
+        if formulas is not None:
+            return formulas.solve(self.target, lambda: self.run(engine))
+        self.run(engine)
+        return self.target.value
+
+    def run(self, engine: str):
+        if engine == "propagate":
+            self.plane.propagate()
+        elif engine == "define":
+            if not self.target.is_defined():
+                self.target.define()
+        elif engine == "search":
+            search.solve(self.target)
+        else:
+            raise ValueError(f"Unknown engine: {engine}")
+
+
+def parse_value(value: typing.Any) -> typing.Any:
+    """
+    A value of a spec, exact.
+
+    Raises:
+        ValueError: If it isn't a number or a string of arithmetic on
+        numbers, `sqrt` and `pi`.
+    """
+    if isinstance(value, str):
+        value = _parse_expression(value)
+    elif isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"Not a value: {value!r}")
+    return values.exact(value)
+
+
+def _parse_expression(text: str) -> sympy.Expr:
+    def build(node: ast.AST) -> sympy.Expr:
+        if isinstance(node, ast.Constant) and not isinstance(node.value, bool):
+            if isinstance(node.value, int):
+                return sympy.Integer(node.value)
+            if isinstance(node.value, float):
+                fraction = values.from_float(node.value)
+                return sympy.Rational(fraction.numerator, fraction.denominator)
+        if isinstance(node, ast.BinOp) and type(node.op) in _OPERATORS:
+            left, right = build(node.left), build(node.right)
+            # keep 9**9**9 from taking forever
+            if isinstance(node.op, ast.Pow) \
+            and not (right.is_Rational and abs(right.p) <= MAX_EXPONENT):
+                raise ValueError(f"Exponent too large in {text!r}")
+            return _OPERATORS[type(node.op)](left, right)
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _OPERATORS:
+            return _OPERATORS[type(node.op)](build(node.operand))
+        if isinstance(node, ast.Name) and node.id in _CONSTANTS:
+            return _CONSTANTS[node.id]
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) \
+        and node.func.id in _FUNCTIONS and len(node.args) == 1 and not node.keywords:
+            return _FUNCTIONS[node.func.id](build(node.args[0]))
+        raise ValueError(f"Not a value: {text!r}")
+
+    try:
+        tree = ast.parse(text, mode="eval")
+    except SyntaxError as error:
+        raise ValueError(f"Not a value: {text!r}") from error
+    return build(tree.body)
+
+
+def solve_spec(
+        spec: dict[str, typing.Any],
+        engine: str = "define",
+        formulas: FormulaCache | None = None
+) -> dict[str, typing.Any]:
+    """
+    Solve a single spec. Never raises: errors are reported in the result.
+
+    Returns:
+        dict: `id`, `value` (as a string), `numeric` (float or None),
+        `elapsed_ms` and `error`.
+    """
+    result: dict[str, typing.Any] = {
+        "id": spec.get("id"), "value": None, "numeric": None, "error": None
+    }
+    start = time.perf_counter()
+    try:
+        value = Problem(spec).solve(engine, formulas)
+        if value is not None:
+            result["value"] = str(value)
+            if value.is_number:
+                result["numeric"] = float(value)
+    except Exception as error:
+        result["error"] = f"{type(error).__name__}: {error}"
+    result["elapsed_ms"] = (time.perf_counter() - start) * 1000
+    return result
@@ -0,0 +1,127 @@
+"""
+Vectorized constructions over many figures at once.
+
+Figures are given by coordinates of their vertices: an array of shape
+`(..., n, 2)` holds any amount of n-gons, `(..., 3, 2)` of triangles.
+Every kernel handles the whole array in one pass, e.g.
+
+    triangles = np.random.rand(10 ** 6, 3, 2)
+    centers, radii = batch.circumcircles(triangles)
+
+Degenerate figures (collinear vertices) get NaN instead of raising.
+"""
+from __future__ import annotations
+
+import numpy as np
+import numpy.typing as npt
+
+
+def _as_polygons(polygons: npt.ArrayLike, vertices: int | None = None) -> np.ndarray:
+    polygons = np.asarray(polygons, dtype=float)
+    if polygons.ndim < 2 or polygons.shape[-1] != 2:
+        raise ValueError(
+            f"Expected vertex coordinates of shape (..., n, 2), got {polygons.shape}"
+        )
+    if vertices is not None and polygons.shape[-2] != vertices:
+        raise ValueError(
+            f"Expected {vertices} vertices, got {polygons.shape[-2]}"
+        )
+    return polygons
+
+
+def circumcircles(triangles: npt.ArrayLike) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Circumcenters `(..., 2)` and
+        circumradii `(...)`.
+    """
+    triangles = _as_polygons(triangles, 3)
+    a = triangles[..., 0, :]
+    bx, by = np.moveaxis(triangles[..., 1, :] - a, -1, 0)
+    cx, cy = np.moveaxis(triangles[..., 2, :] - a, -1, 0)
+    b2 = bx * bx + by * by
+    c2 = cx * cx + cy * cy
+    d = 2 * (bx * cy - by * cx)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ux = np.where(d != 0, (cy * b2 - by * c2) / d, np.nan)
+        uy = np.where(d != 0, (bx * c2 - cx * b2) / d, np.nan)
+    return a + np.stack((ux, uy), axis=-1), np.hypot(ux, uy)
+
+
+def circumcenters(triangles: npt.ArrayLike) -> np.ndarray:
+    return circumcircles(triangles)[0]
+
+
+def circumradii(triangles: npt.ArrayLike) -> np.ndarray:
+    return circumcircles(triangles)[1]
+
+
+def incircles(triangles: npt.ArrayLike) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Incenters `(..., 2)` and inradii
+        `(...)`.
+    """
+    triangles = _as_polygons(triangles, 3)
+    # side lengths opposite to each vertex
+    sides = np.linalg.norm(
+        np.roll(triangles, -1, axis=-2) - np.roll(triangles, 1, axis=-2), axis=-1
+    )
+    perimeter = sides.sum(axis=-1)
+    area = np.abs(signed_areas(triangles))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        centers = (sides[..., None] * triangles).sum(axis=-2) / perimeter[..., None]
+        radii = 2 * area / perimeter
+    degenerate = area == 0
+    return (
+        np.where(degenerate[..., None], np.nan, centers),
+        np.where(degenerate, np.nan, radii)
+    )
+
+
+def incenters(triangles: npt.ArrayLike) -> np.ndarray:
+    return incircles(triangles)[0]
+
+
+def signed_areas(polygons: npt.ArrayLike) -> np.ndarray:
+    """
+    Shoelace areas, positive for counterclockwise vertices.
+    """
+    polygons = _as_polygons(polygons)
+    x, y = polygons[..., 0], polygons[..., 1]
+    cross = x * np.roll(y, -1, axis=-1) - np.roll(x, -1, axis=-1) * y
+    return cross.sum(axis=-1) / 2
+
+
+def centroids(polygons: npt.ArrayLike) -> np.ndarray:
+    """
+    Centroids of the polygons' areas; for degenerate polygons the mean of
+    the vertices.
+    """
+    polygons = _as_polygons(polygons)
+    x, y = polygons[..., 0], polygons[..., 1]
+    next_x, next_y = np.roll(x, -1, axis=-1), np.roll(y, -1, axis=-1)
+    cross = x * next_y - next_x * y
+    area = cross.sum(axis=-1) / 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        centers = np.stack((
+            ((x + next_x) * cross).sum(axis=-1),
+            ((y + next_y) * cross).sum(axis=-1),
+        ), axis=-1) / (6 * area[..., None])
+    return np.where((area == 0)[..., None], polygons.mean(axis=-2), centers)
+
+
+def are_cyclic(polygons: npt.ArrayLike, tolerance: float = 1e-9) -> np.ndarray:
+    """
+    Whether all vertices of each polygon lie on one circle, up to a
+    relative `tolerance`. Polygons with collinear first three vertices
+    are not cyclic.
+    """
+    polygons = _as_polygons(polygons)
+    if polygons.shape[-2] < 3:
+        raise ValueError("Polygons must have at least 3 vertices")
+    centers, radii = circumcircles(polygons[..., :3, :])
+    distances = np.linalg.norm(polygons - centers[..., None, :], axis=-1)
+    with np.errstate(invalid="ignore"):
+        on_circle = np.abs(distances - radii[..., None]) <= tolerance * radii[..., None]
+    return on_circle.all(axis=-1) & np.isfinite(radii)
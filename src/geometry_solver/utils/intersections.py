@@ -0,0 +1,190 @@
+"""
+All intersections of a set of segments with a sweep line (Bentley-Ottmann).
+
+A vertical line sweeps the plane from left to right, stopping at endpoints
+and at the crossings found so far. The segments it cuts are kept ordered
+from bottom to top, and only segments that become neighbours in that order
+are tested against each other, so n segments with k intersection points
+take O((n + k) log n) tests instead of testing every pair. Event points
+are computed exactly, the tests use the filtered predicates.
+
+    for point, labels in intersections({"ab": (a, b), "cd": (c, d)}):
+        ...
+"""
+from __future__ import annotations
+import bisect
+import heapq
+import typing
+
+from geometry_solver.utils import predicates
+if typing.TYPE_CHECKING:
+    from geometry_solver.models import basic_objects
+    from geometry_solver.plane import Plane
+
+Label = typing.TypeVar("Label")
+
+
+class _Segment:
+    __slots__ = ("label", "left", "right", "vertical", "slope")
+
+    def __init__(self, label: typing.Any, left: predicates.Point, right: predicates.Point):
+        self.label = label
+        self.left = left
+        self.right = right
+        self.vertical = left[0] == right[0]
+        self.slope = None if self.vertical else (right[1] - left[1]) / (right[0] - left[0])
+
+    def y_at(self, point: predicates.Point) -> typing.Any:
+        """
+        Height of the segment on the sweep line through `point`; a vertical
+        segment is taken at the height of `point` clamped to its ends.
+        """
+        x, y = point
+        if self.vertical:
+            return min(max(y, self.left[1]), self.right[1])
+        if x == self.left[0]:
+            return self.left[1]
+        if x == self.right[0]:
+            return self.right[1]
+        return self.left[1] + self.slope * (x - self.left[0])
+
+    def order_after(self) -> tuple[bool, typing.Any]:
+        # order of segments through one point, right after it
+        return (True, 0) if self.vertical else (False, self.slope)
+
+
+def _crossing(first: _Segment, second: _Segment) -> predicates.Point | None:
+    if not predicates.segments_intersect(first.left, first.right, second.left, second.right):
+        return None
+    (ax, ay), (bx, by) = first.left, first.right
+    (cx, cy), (dx, dy) = second.left, second.right
+    rx, ry, sx, sy = bx - ax, by - ay, dx - cx, dy - cy
+    denominator = rx * sy - ry * sx
+    # collinear overlaps have no single crossing, their endpoints are events
+    if denominator == 0:
+        return None
+    t = ((cx - ax) * sy - (cy - ay) * sx) / denominator
+    return (ax + t * rx, ay + t * ry)
+
+
+def intersections(
+        segments: typing.Mapping[Label, tuple[predicates.Point, predicates.Point]]
+) -> list[tuple[predicates.Point, list[Label]]]:
+    """
+    Points where two or more of the closed `segments` meet, shared
+    endpoints included, in sweep order.
+
+    Args:
+        segments: Label -> endpoints. Coordinates are numbers or Radicals,
+        zero-length segments are ignored.
+
+    Returns:
+        list[tuple[Point, list]]: Every point, exact, with the labels of
+        the segments through it.
+    """
+    starts: dict[predicates.Point, list[_Segment]] = {}
+    events: list[predicates.Point] = []
+    queued: set[predicates.Point] = set()
+    for label, (first, second) in segments.items():
+        first = tuple(predicates.exact(v) for v in first)
+        second = tuple(predicates.exact(v) for v in second)
+        if first == second:
+            continue
+        left, right = min(first, second), max(first, second)
+        starts.setdefault(left, []).append(_Segment(label, left, right))
+        for point in (left, right):
+            if point not in queued:
+                queued.add(point)
+                events.append(point)
+    heapq.heapify(events)
+
+    def schedule(first: _Segment, second: _Segment, current: predicates.Point):
+        point = _crossing(first, second)
+        if point is not None and point > current and point not in queued:
+            queued.add(point)
+            heapq.heappush(events, point)
+
+    found: list[tuple[predicates.Point, list[typing.Any]]] = []
+    status: list[_Segment] = []
+    while events:
+        point = heapq.heappop(events)
+        height = point[1]
+        # segments through the point are a contiguous block of the status
+        low = bisect.bisect_left(status, height, key=lambda s: s.y_at(point))
+        high = bisect.bisect_right(status, height, key=lambda s: s.y_at(point), lo=low)
+        through = status[low:high]
+        starting = starts.pop(point, [])
+        if len(through) + len(starting) > 1:
+            found.append((point, [s.label for s in through + starting]))
+        continuing = [s for s in through if s.right != point] + starting
+        continuing.sort(key=_Segment.order_after)
+        status[low:high] = continuing
+        end = low + len(continuing)
+        if low > 0 and low < len(status):
+            schedule(status[low - 1], status[low], point)
+        if continuing and end < len(status):
+            schedule(status[end - 1], status[end], point)
+    return found
+
+
+def find_intersections(
+        plane: "Plane"
+) -> list[tuple["basic_objects.Point", list["basic_objects.LineSegment"]]]:
+    """
+    Intersect the segments of `plane` whose endpoints have known
+    coordinates. Crossings away from known points get new points, and
+    every two segments meeting at a point that isn't collinear get their
+    angle there recorded in `LineSegment.intersections`.
+
+    Returns:
+        list[tuple[Point, list[LineSegment]]]: The points and the segments
+        through them.
+    """
+    from geometry_solver.models import basic_objects
+    located: dict[predicates.Point, basic_objects.Point] = {}
+    for point in plane.points.values():
+        xy = point.known_xy()
+        if xy is not None:
+            located.setdefault(tuple(predicates.exact(v) for v in xy), point)
+    endpoints = {
+        segment: (segment.p1.known_xy(), segment.p2.known_xy())
+        for segment in plane.segments.values()
+    }
+    segments = {
+        segment: ends for segment, ends in endpoints.items() if None not in ends
+    }
+
+    result = []
+    for xy, through in intersections(segments):
+        point = located.get(xy)
+        if point is None:
+            point = basic_objects.Point(plane.point_names.new_name(), plane, xy)
+            located[xy] = point
+        for segment in through:
+            if point not in (segment.p1, segment.p2) and point not in segment:
+                segment.add_point(point)
+        for i, first in enumerate(through):
+            for second in through[i + 1:]:
+                _record_angle(plane, point, first, second)
+        result.append((point, through))
+    return result
+
+
+def _record_angle(
+        plane: "Plane",
+        vertex: "basic_objects.Point",
+        first: "basic_objects.LineSegment",
+        second: "basic_objects.LineSegment"
+):
+    if second in first.intersections:
+        return
+    side = first.p2 if first.p1 is vertex else first.p1
+    other_side = second.p2 if second.p1 is vertex else second.p1
+    if predicates.orientation(side.known_xy(), vertex.known_xy(), other_side.known_xy()) == 0:
+        return
+    angle = plane.angle(side, vertex, other_side)
+    for segment, other in ((first, second), (second, first)):
+        if segment._intersections is None:
+            plane.journal_attribute(segment, "_intersections")
+        segment.intersections[other] = angle
+        plane.journal(dict.pop, segment.intersections, other)
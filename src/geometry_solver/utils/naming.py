@@ -1,20 +1,67 @@
-from geometry_solver.models import basic_objects, polygons
-from geometry_solver.core import core
+from __future__ import annotations
+import typing
+if typing.TYPE_CHECKING:
+    from geometry_solver.models import basic_objects, polygons
+    from geometry_solver.plane import Plane
 
-existing_point_names: list[str] = []
+import string
 
-def get_new_point_name():
-       # XXX: avoid sorting each time
-       existing_point_names.sort()
-       last_name = existing_point_names[-1]
-       # TODO: handle exhaustment of alphabet
-       return chr(ord(last_name[-1]) + 1)
+
+class PointNames:
+    """
+    Point namespace of a single Plane.
+
+    New names are generated from a counter as a, b, ..., z, aa, ab, ...,
+    skipping names that were taken explicitly, so allocation is O(1)
+    amortized and never runs out.
+    """
+
+    def __init__(self, plane: "Plane | None" = None):
+        self.plane = plane
+        self.taken: set[str] = set()
+        self._counter = 0
+
+    def take(self, name: str):
+        assert name not in self.taken, f"Point {name} already exists!"
+        assert is_valid_point_name(name), \
+            "Point must be named as letters, optionally followed by digits"
+        self.taken.add(name)
+        if self.plane is not None:
+            self.plane.journal(set.discard, self.taken, name)
+
+    def new_name(self) -> str:
+        if self.plane is not None:
+            self.plane.journal_attribute(self, "_counter")
+        name = counter_to_name(self._counter)
+        while name in self.taken:
+            self._counter += 1
+            name = counter_to_name(self._counter)
+        self._counter += 1
+        return name
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.taken
+
+
+def counter_to_name(counter: int) -> str:
+    # bijective base 26: 0 -> a, 25 -> z, 26 -> aa, ...
+    name = ""
+    counter += 1
+    while counter:
+        counter, remainder = divmod(counter - 1, 26)
+        name = string.ascii_lowercase[remainder] + name
+    return name
+
+
+def is_valid_point_name(name: str) -> bool:
+    letters = name.rstrip(string.digits)
+    return bool(letters) and letters.isalpha() and name.isascii()
 
 def get_line_segment_name(line_segment: "basic_objects.LineSegment"):
-       return f"{line_segment.start()}{line_segment.end()}"
+       return line_segment.start().name + line_segment.end().name
 
 def get_angle_name(angle: "basic_objects.Angle"):
-       return f"{angle.p1}{angle.p2}{angle.p3}"
+       return angle.p1.name + angle.p2.name + angle.p3.name
 
 def get_point_xy_name(point: "basic_objects.Point"):
         return point.name + "x", point.name + "y"
@@ -22,8 +69,5 @@ def get_point_xy_name(point: "basic_objects.Point"):
 def get_polygon_name(polygon: "polygons.Polygon"):
         return ''.join([vertex.name for vertex in polygon.vertices])
 
-def get_perpendicular_bisector_edge_points(edge_to: "basic_objects.LineSegment"):
-        return f"pb{edge_to.name}s", f"pb{edge_to.name}e"
-
 def get_circumcircle_name(polygon: "polygons.Polygon"):
     return f"o{polygon.name}"
\ No newline at end of file
@@ -0,0 +1,150 @@
+"""
+Exact geometric predicates with a floating-point filter.
+
+The sign of a determinant is computed in floats first and trusted when it
+exceeds the bound on the rounding error of that computation (Shewchuk's
+static filters). Only near-degenerate inputs are evaluated again exactly,
+on Fractions, or on Radicals for exact values with square roots.
+
+The bounds assume the floats are the inputs. Fractions and big integers
+are rounded once on conversion, which the orientation filter accounts
+for with a wider bound; Radicals, whose float values may have lost
+everything to cancellation, are always evaluated exactly, as are inputs
+of `incircle` that aren't floats already.
+
+    orientation(a, b, c)  # 1: counterclockwise, -1: clockwise, 0: collinear
+"""
+from __future__ import annotations
+import fractions
+import typing
+
+Coordinate = typing.Any  # int, float, Fraction or values.Radical
+Point = tuple[Coordinate, Coordinate]
+
+_EPSILON = 2.0 ** -53
+_ORIENTATION_BOUND = (3.0 + 16.0 * _EPSILON) * _EPSILON
+_INCIRCLE_BOUND = (10.0 + 96.0 * _EPSILON) * _EPSILON
+# rounding every coordinate once, on top of the computation (about 6.2)
+_CONVERSION_BOUND = 8.0 * _EPSILON
+# integers up to this are floats exactly
+_EXACT_INTEGER = 2 ** 53
+
+
+def _as_floats(values: typing.Iterable[Coordinate]) -> tuple[list[float], bool] | None:
+    """
+    The values as floats and whether that is exact, None if some value
+    (a Radical) isn't rounded with a small relative error.
+    """
+    floats = []
+    exact_floats = True
+    for value in values:
+        if isinstance(value, float):
+            floats.append(value)
+        elif isinstance(value, int):
+            floats.append(float(value))
+            exact_floats = exact_floats and abs(value) <= _EXACT_INTEGER
+        elif isinstance(value, fractions.Fraction):
+            floats.append(float(value))
+            exact_floats = exact_floats and value.denominator == 1 \
+                and abs(value) <= _EXACT_INTEGER
+        else:
+            return None
+    return floats, exact_floats
+
+
+def _sign(value: typing.Any) -> int:
+    if hasattr(value, "sign"):
+        return value.sign()
+    return (value > 0) - (value < 0)
+
+
+def exact(value: Coordinate) -> Coordinate:
+    """
+    `value` in a type with exact arithmetic: floats become the binary
+    fractions they store.
+    """
+    from geometry_solver.core import values
+    if isinstance(value, values.Radical):
+        return value
+    return fractions.Fraction(value)
+
+
+def orientation(a: Point, b: Point, c: Point) -> int:
+    """
+    Sign of the turn `a -> b -> c`: 1 if counterclockwise, -1 if
+    clockwise, 0 if the points are collinear.
+    """
+    approximation = _as_floats((*a, *b, *c))
+    if approximation is not None:
+        (ax, ay, bx, by, cx, cy), exact_floats = approximation
+        left = (ax - cx) * (by - cy)
+        right = (ay - cy) * (bx - cx)
+        determinant = left - right
+        bound = _ORIENTATION_BOUND * (abs(left) + abs(right))
+        if not exact_floats:
+            bound += _CONVERSION_BOUND * (
+                (abs(ax) + abs(cx)) * (abs(by) + abs(cy))
+                + (abs(ay) + abs(cy)) * (abs(bx) + abs(cx))
+            )
+        if abs(determinant) > bound:
+            return 1 if determinant > 0 else -1
+    ax, ay, bx, by, cx, cy = (exact(v) for v in (*a, *b, *c))
+    return _sign((ax - cx) * (by - cy) - (ay - cy) * (bx - cx))
+
+
+def incircle(a: Point, b: Point, c: Point, d: Point) -> int:
+    """
+    1 if `d` is inside the circle through `a`, `b`, `c` (given
+    counterclockwise), -1 if outside, 0 if on it.
+    """
+    approximation = _as_floats((*a, *b, *c, *d))
+    if approximation is not None and approximation[1]:
+        determinant, permanent = _incircle(approximation[0], float_abs=True)
+        if abs(determinant) > _INCIRCLE_BOUND * permanent:
+            return 1 if determinant > 0 else -1
+    determinant, _ = _incircle([exact(v) for v in (*a, *b, *c, *d)], float_abs=False)
+    return _sign(determinant)
+
+
+def _incircle(values: list[typing.Any], float_abs: bool) -> tuple[typing.Any, float]:
+    ax, ay, bx, by, cx, cy, dx, dy = values
+    adx, ady, bdx, bdy, cdx, cdy = ax - dx, ay - dy, bx - dx, by - dy, cx - dx, cy - dy
+    alift = adx * adx + ady * ady
+    blift = bdx * bdx + bdy * bdy
+    clift = cdx * cdx + cdy * cdy
+    bc, cb = bdx * cdy, cdx * bdy
+    ca, ac = cdx * ady, adx * cdy
+    ab, ba = adx * bdy, bdx * ady
+    determinant = alift * (bc - cb) + blift * (ca - ac) + clift * (ab - ba)
+    permanent = 0.0
+    if float_abs:
+        permanent = (
+            (abs(bc) + abs(cb)) * alift
+            + (abs(ca) + abs(ac)) * blift
+            + (abs(ab) + abs(ba)) * clift
+        )
+    return determinant, permanent
+
+
+def on_segment(p: Point, a: Point, b: Point) -> bool:
+    """
+    Whether `p`, collinear with `a` and `b`, lies between them.
+    """
+    px, py, ax, ay, bx, by = (exact(v) for v in (*p, *a, *b))
+    return min(ax, bx) <= px <= max(ax, bx) and min(ay, by) <= py <= max(ay, by)
+
+
+def segments_intersect(a: Point, b: Point, c: Point, d: Point) -> bool:
+    """
+    Whether the closed segments `ab` and `cd` have a common point.
+    """
+    first, second = orientation(a, b, c), orientation(a, b, d)
+    third, fourth = orientation(c, d, a), orientation(c, d, b)
+    if first != second and third != fourth:
+        return True
+    return (
+        (first == 0 and on_segment(c, a, b))
+        or (second == 0 and on_segment(d, a, b))
+        or (third == 0 and on_segment(a, c, d))
+        or (fourth == 0 and on_segment(b, c, d))
+    )
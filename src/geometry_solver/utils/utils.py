@@ -1,6 +1,7 @@
-from geometry_solver.models import basic_objects, polygons
-from geometry_solver.core import core
-import sympy
+from __future__ import annotations
+import typing
+if typing.TYPE_CHECKING:
+    from geometry_solver.models import basic_objects
 
 
 def get_distance(p1: "basic_objects.Point", p2: "basic_objects.Point"):
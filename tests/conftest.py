@@ -0,0 +1,21 @@
+import pytest
+
+from geometry_solver.models import polygons
+from geometry_solver.plane import Plane
+
+
+@pytest.fixture
+def make_triangle():
+    """
+    Factory of regular triangles `abc` on new Planes, inscribed in a
+    circle of `radius` unless that is None.
+    """
+    def make(radius=8):
+        plane = Plane()
+        tri = polygons.RegularTriangle(
+            plane, [plane.point("a"), plane.point("b"), plane.point("c")]
+        )
+        if radius is not None:
+            tri.build_circumcircle(radius=radius)
+        return plane, tri
+    return make
@@ -0,0 +1,50 @@
+import asyncio
+import time
+
+import sympy
+
+from geometry_solver import aio
+
+
+def test_solve_async_sets_values_in_caller(make_triangle):
+    plane, tri = make_triangle()
+    result = asyncio.run(aio.solve_async(plane, tri.get_side(), timeout=30))
+    assert result.solved and not result.timed_out and result.error is None
+    assert result.determined == {tri.get_side(): tri.get_side().value}
+    assert tri.get_side().derivation is tri.get_side().definitions[0]
+
+
+def test_deadline_returns_partial_results(make_triangle):
+    plane, tri = make_triangle()
+    first, second = tri.edges[1], tri.edges[2]
+
+    def stuck(plane, target):
+        first.set_value(sympy.Integer(1))
+        time.sleep(60)
+        second.set_value(sympy.Integer(2))
+
+    start = time.perf_counter()
+    result = asyncio.run(aio.solve_async(plane, second, timeout=1, engine=stuck))
+    assert time.perf_counter() - start < 10
+    assert result.timed_out and not result.solved
+    assert result.determined == {first: 1} and first.value == 1
+
+
+def test_cancellation_kills_worker(make_triangle):
+    plane, tri = make_triangle()
+
+    async def main():
+        task = asyncio.ensure_future(aio.solve_async(
+            plane, tri.get_side(), engine=lambda plane, target: time.sleep(60)
+        ))
+        await asyncio.sleep(0.5)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            return True
+        return False
+
+    start = time.perf_counter()
+    assert asyncio.run(main())
+    assert time.perf_counter() - start < 10
@@ -0,0 +1,43 @@
+import numpy as np
+
+from geometry_solver.models import basic_objects, polygons
+from geometry_solver.plane import Plane
+from geometry_solver.utils import batch
+
+
+def test_kernels_on_right_triangles():
+    # legs 3, 4 scaled by k: hypotenuse 5k, inradius k
+    k = np.arange(1, 1001, dtype=float)
+    triangles = np.zeros((1000, 3, 2))
+    triangles[:, 1, 0] = 4 * k
+    triangles[:, 2, 1] = 3 * k
+    centers, radii = batch.circumcircles(triangles)
+    assert np.allclose(centers, np.stack((2 * k, 1.5 * k), axis=-1))
+    assert np.allclose(radii, 2.5 * k)
+    incenters, inradii = batch.incircles(triangles)
+    assert np.allclose(incenters, np.stack((k, k), axis=-1))
+    assert np.allclose(inradii, k)
+    assert np.allclose(batch.centroids(triangles), triangles.mean(axis=1))
+    degenerate = batch.circumradii([[0, 0], [1, 1], [2, 2]])
+    assert np.isnan(degenerate)
+
+
+def test_are_cyclic():
+    angles = np.array([0, 1, 2.5, 4])
+    square = np.stack((np.cos(angles), np.sin(angles)), axis=-1)
+    kite = square.copy()
+    kite[3] *= 1.5
+    assert batch.are_cyclic(np.stack((square, kite))).tolist() == [True, False]
+
+
+def test_polygon_uses_coordinates():
+    plane = Plane()
+    a = basic_objects.Point("a", plane, (0, 0))
+    b = basic_objects.Point("b", plane, (4, 0))
+    c = basic_objects.Point("c", plane, (0, 3))
+    tri = polygons.Triangle(plane, [a, b, c])
+    assert tri.circumcenter() == (2.0, 1.5)
+    assert tri.incenter() == (1.0, 1.0)
+    tri.build_circumcircle(check_if_possible=True)
+    assert tri.is_cyclic
+    assert polygons.Triangle(plane, [plane.point("d"), a, b]).centroid() is None
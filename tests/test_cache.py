@@ -0,0 +1,25 @@
+import sympy
+
+from geometry_solver.core.cache import SolveCache
+
+
+def test_structurally_equal_equations_share_entry():
+    cache = SolveCache()
+    r1, a1, r2, a2 = sympy.symbols("r1 a1 r2 a2")
+    first = cache.solve(sympy.Eq(r1, a1 / sympy.sqrt(3)), a1)
+    second = cache.solve(sympy.Eq(r2, a2 / sympy.sqrt(3)), a2)
+    assert first == [sympy.sqrt(3) * r1]
+    assert second == [sympy.sqrt(3) * r2]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_lru_eviction_and_disabling():
+    cache = SolveCache(maxsize=1)
+    x, y = sympy.symbols("x y")
+    cache.solve(sympy.Eq(x, 2 * y), y)
+    cache.solve(sympy.Eq(x, 3 * y), y)
+    cache.solve(sympy.Eq(x, 2 * y), y)
+    assert len(cache) == 1 and cache.misses == 3
+    cache.enabled = False
+    assert cache.solve(sympy.Eq(x, 3 * y), y) == [x / 3]
+    assert cache.misses == 3
@@ -0,0 +1,29 @@
+import json
+
+from geometry_solver import cli, problems
+
+MVP = {
+    "figures": [
+        {"type": "RegularTriangle", "vertices": ["a", "b", "c"]},
+        {"type": "Circle", "circumscribes": ["a", "b", "c"], "radius": 8},
+    ],
+    "target": {"segment": ["a", "b"]},
+}
+
+
+def test_results_keep_input_order():
+    lines = [json.dumps(dict(MVP, id=i)) for i in range(4)] + ["{oops"]
+    results = list(cli.solve_lines(lines, jobs=2))
+    assert [result["id"] for result in results] == [0, 1, 2, 3, None]
+    assert all(abs(result["numeric"] - 8 * 3 ** 0.5) < 1e-9 for result in results[:4])
+    assert results[-1]["error"].startswith("JSONDecodeError")
+
+
+def test_values_are_parsed_not_evaluated(tmp_path):
+    marker = tmp_path / "marker"
+    spec = dict(MVP, figures=[MVP["figures"][0], dict(MVP["figures"][1], radius="4*sqrt(4)")])
+    assert abs(problems.solve_spec(spec)["numeric"] - 8 * 3 ** 0.5) < 1e-9
+    for radius in (f"__import__('pathlib').Path({str(marker)!r}).touch()", "9**9**9", "x + 1"):
+        spec["figures"][1]["radius"] = radius
+        assert problems.solve_spec(spec)["error"].startswith("ValueError")
+    assert not marker.exists()
@@ -0,0 +1,30 @@
+import numpy as np
+import sympy
+
+from geometry_solver.core.core import BaseDefinition, BaseObject
+from geometry_solver.models import polygons
+from geometry_solver.plane import Plane
+
+
+def test_side_from_circumradius_kernel():
+    plane = Plane()
+    tri = polygons.RegularTriangle(
+        plane, [plane.point("a"), plane.point("b"), plane.point("c")]
+    )
+    tri.build_circumcircle(radius=8)
+    kernel = tri.get_side().compile()
+    assert kernel.inputs == [tri.inscribed_in]
+    radii = np.linspace(1, 10, 1000)
+    assert np.allclose(kernel(radii), np.sqrt(3) * radii)
+    assert np.allclose(kernel(oabc=radii), kernel(radii))
+
+
+def test_closed_form_through_chain():
+    plane = Plane()
+    x, y, z = (BaseObject(name, plane) for name in "xyz")
+    y.add_definition(BaseDefinition(y, 2 * x), reverse_definitions=False)
+    z.add_definition(BaseDefinition(z, y + 1), reverse_definitions=False)
+    x.set_value(sympy.Integer(3))
+    plane.propagate()
+    assert z.closed_form() == 2 * x + 1
+    assert z.derivation.compile()([0, 1]).tolist() == [1.0, 3.0]
@@ -1,4 +1,4 @@
-from geometry_solver.core.core import is_expression_constant
+from geometry_solver.core.core import BaseDefinition, BaseObject, is_expression_constant
 from geometry_solver.models import polygons, basic_objects
 from geometry_solver.plane import Plane
 
@@ -13,3 +13,13 @@ def test_radius_to_regular_triangle_side():
     )
     tri.build_circumcircle(radius=8)
     assert is_expression_constant(tri.get_side().define())
+
+
+def test_define_chain_without_plane():
+    a = BaseObject("a", None, value=2)
+    b = BaseObject("b", None)
+    c = BaseObject("c", None)
+    b.add_definition(BaseDefinition(b, a + 1))
+    c.add_definition(BaseDefinition(c, 2 * b))
+    c.define()
+    assert b.value == 3 and c.value == 6
@@ -0,0 +1,57 @@
+import sympy
+
+from geometry_solver.core import cache, core
+from geometry_solver.plane import Plane
+
+
+def test_inadmissible_roots_are_dropped():
+    plane = Plane()
+    a, b, c = (plane.point(name) for name in "abc")
+    side = plane.segment(a, b)
+    area = core.BaseObject("S", plane, value=16)
+    area.add_definition(core.BaseDefinition(area, side ** 2))
+    # -sqrt(S) is only ruled out once S is known
+    side.define()
+    assert float(side.value) == 4 and side.candidates is None
+
+    # roots 30 and 200, an angle is less than 180 degrees
+    angle = plane.angle(a, b, c)
+    angle.add_definition(
+        core.BaseDefinition(angle, (angle ** 2 + 6000) / 230),
+        reverse_definitions=False
+    )
+    angle.define()
+    assert angle.value == 30 and angle.candidates is None
+
+
+def test_candidates_are_carried_forward():
+    plane = Plane()
+    x, y = core.BaseObject("x", plane), core.BaseObject("y", plane)
+    x.add_definition(core.BaseDefinition(x, (x ** 2 + 6) / 5), reverse_definitions=False)
+    y.add_definition(core.BaseDefinition(y, x + 1), reverse_definitions=False)
+    y.define()
+    assert x.value == 2 and x.candidates == (2, 3)
+    assert y.value == 3 and y.candidates == (3, 4)
+
+
+def test_placeholders_keep_assumptions():
+    plane = Plane()
+    side = plane.segment(plane.point("a"), plane.point("b"))
+    plain = core.BaseObject("x", plane)
+    assert cache.canonicalize(side ** 2, side)[0] != cache.canonicalize(plain ** 2, plain)[0]
+
+
+def test_closed_form_follows_the_admissible_root():
+    plane = Plane()
+    a, b, c = (plane.point(name) for name in "abc")
+    k = core.BaseObject("k", plane, value=-1000)
+    angle = plane.angle(a, b, c)
+    # roots 50 -+ sqrt(2500 - k), the first one is negative for k = -1000
+    angle.add_definition(
+        core.BaseDefinition(angle, (angle ** 2 + k) / 100),
+        reverse_definitions=False
+    )
+    angle.define()
+    assert abs(float(angle.value) - 109.16079783099616) < 1e-9
+    assert angle.closed_form() == 50 + sympy.sqrt(2500 - k)
+    assert abs(float(angle.compile()(-1000)) - float(angle.value)) < 1e-9
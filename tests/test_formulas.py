@@ -0,0 +1,74 @@
+import pytest
+import sympy
+
+from geometry_solver import problems
+from geometry_solver.core.core import BaseDefinition, BaseObject
+from geometry_solver.formulas import FormulaCache, Template, load_formula
+from geometry_solver.plane import Plane
+
+
+def spec(names, radius):
+    return {
+        "figures": [
+            {"type": "RegularTriangle", "vertices": names},
+            {"type": "Circle", "circumscribes": names, "radius": radius},
+        ],
+        "target": {"segment": names[:2]},
+    }
+
+
+def test_same_template_reuses_formula(tmp_path):
+    path = str(tmp_path / "formulas.sqlite")
+    formulas = FormulaCache(path)
+    first = problems.Problem(spec(["a", "b", "c"], 8))
+    assert abs(first.solve(formulas=formulas) - 8 * sympy.sqrt(3)) < 1e-9
+    assert (formulas.hits, formulas.misses) == (0, 1)
+
+    # another process, other names and numbers
+    second = problems.Problem(spec(["p", "q", "r"], 5))
+    shared = FormulaCache(path)
+    assert abs(shared.solve(second.target) - 5 * sympy.sqrt(3)) < 1e-9
+    assert (shared.hits, shared.misses) == (1, 0)
+    assert second.target.closed_form() == sympy.sqrt(3) * second.circles[("p", "q", "r")]
+
+
+def test_template_depends_on_what_is_given():
+    with_radius = problems.Problem(spec(["a", "b", "c"], 8))
+    without = spec(["a", "b", "c"], 8)
+    del without["figures"][1]["radius"]
+    assert Template(with_radius.plane).key != Template(problems.Problem(without).plane).key
+    assert Template(with_radius.plane).key == Template(problems.Problem(spec(["x", "y", "z"], 1)).plane).key
+
+
+def test_stored_formulas_are_not_evaluated():
+    x = sympy.Symbol("_o3")
+    formula = 8 * sympy.sqrt(3) * x / 2 + sympy.Float(1.5) - sympy.cos(sympy.pi * x)
+    assert load_formula(sympy.srepr(formula)) == formula
+    for text in ("__import__('os').system('true')", "Symbol.__class__", "Add(*[])"):
+        with pytest.raises(ValueError):
+            load_formula(text)
+
+
+def quadratic_angle(k):
+    plane = Plane()
+    angle = plane.angle(*(plane.point(name) for name in "abc"))
+    given = BaseObject("k", plane, value=k)
+    angle.add_definition(BaseDefinition(angle, (angle ** 2 + given) / 100))
+    return angle
+
+
+def test_cached_roots_must_stay_admissible(tmp_path):
+    formulas = FormulaCache(str(tmp_path / "formulas.sqlite"))
+    # 20 and 80 both fit: which one is meant depends on the numbers
+    assert formulas.solve(quadratic_angle(1600)) == 20
+    assert formulas.solve(quadratic_angle(1600)) == 20
+    assert (formulas.hits, formulas.misses) == (0, 2)
+
+    # only 50 + 10*sqrt(35) fits and is stored
+    assert abs(float(formulas.solve(quadratic_angle(-1000))) - 109.16) < 0.01
+    assert abs(float(formulas.solve(quadratic_angle(-1000))) - 109.16) < 0.01
+    assert (formulas.hits, formulas.misses) == (1, 3)
+    # here it is 186 > 180, and the other root is negative
+    angle = quadratic_angle(-16000)
+    assert formulas.solve(angle) is None and not angle.is_defined()
+    assert (formulas.hits, formulas.misses) == (1, 4)
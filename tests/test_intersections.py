@@ -0,0 +1,67 @@
+import fractions
+import itertools
+import random
+
+from geometry_solver.core.values import Radical
+from geometry_solver.models import basic_objects
+from geometry_solver.plane import Plane
+from geometry_solver.utils import intersections, predicates
+
+
+def test_predicates_are_exact():
+    # rounding makes the float determinant of these collinear points nonzero
+    assert predicates.orientation((0.5, 0.5), (12.0, 12.0), (24.0, 24.0)) == 0
+    assert predicates.orientation((0.5, 0.5), (12.0, 12.0), (24.0, 24.000000000000004)) == 1
+    root = Radical.sqrt_of(3)
+    assert predicates.orientation((0, 0), (1, root), (2, 2 * root)) == 0
+    assert predicates.incircle((0, 0), (2, 0), (0, 2), (2, 2)) == 0
+    assert predicates.incircle((0, 0), (2, 0), (0, 2), (1, 1)) == 1
+
+
+def test_predicates_on_rounded_inputs():
+    # exactly collinear, but rounding the coordinates to floats bends the line
+    big, third = 10 ** 8, fractions.Fraction(1, 3)
+    points = [(big + third * i, third * i) for i in (1, 2, 3)]
+    assert predicates.orientation(*points) == 0
+    root = Radical.sqrt_of(2)
+    assert predicates.orientation(*[(big + root * i, root * i) for i in (1, 2, 3)]) == 0
+    circle = [(big + x, y) for x, y in [(0, 0), (third, 0), (0, third), (third, third)]]
+    assert predicates.incircle(*circle) == 0
+
+
+def test_sweep_matches_pairwise_tests():
+    generator = random.Random(0)
+    segments = {
+        i: tuple((generator.randint(0, 20), generator.randint(0, 20)) for _ in range(2))
+        for i in range(60)
+    }
+    segments = {i: ends for i, ends in segments.items() if ends[0] != ends[1]}
+    pairs = set()
+    for point, labels in intersections.intersections(segments):
+        pairs.update(itertools.combinations(sorted(labels), 2))
+    expected = {
+        (i, j) for i, j in itertools.combinations(sorted(segments), 2)
+        if predicates.segments_intersect(*segments[i], *segments[j])
+    }
+    # collinear overlaps only meet at the endpoints they share
+    assert pairs <= expected
+    assert all(
+        predicates.orientation(*segments[i], segments[j][0]) == 0
+        and predicates.orientation(*segments[i], segments[j][1]) == 0
+        for i, j in expected - pairs
+    )
+
+
+def test_plane_intersections():
+    plane = Plane()
+    a, b, c, d = (
+        basic_objects.Point(name, plane, xy) for name, xy
+        in zip("abcd", [(0, 0), (2, 0), (2, 2), (0, 2)])
+    )
+    ac, bd, ab = plane.segment(a, c), plane.segment(b, d), plane.segment(a, b)
+    assert ac.intersects(bd) and ab.ccw(a, b, d)
+    found = {tuple(sorted(s.name for s in through)) for _, through in plane.find_intersections()}
+    assert ("ab", "bd") in found and ("ab", "ac") in found and ("ac", "bd") in found
+    center = ac.intersections[bd].p2
+    assert center.known_xy() == (1, 1) and center in ac
+    assert ab.intersects(plane.segment(plane.point("q"), c)) is None
@@ -0,0 +1,33 @@
+import math
+
+from geometry_solver.plane import Plane
+
+
+def test_regular_triangle_side_numeric(make_triangle):
+    plane, tri = make_triangle()
+    solution = plane.solve_numeric(tri.get_side(), verify=True)
+    assert solution.converged
+    assert math.isclose(solution.value(tri.get_side()), 8 * math.sqrt(3), rel_tol=1e-7)
+    assert math.isclose(solution.value(tri.angle(0)), 60, rel_tol=1e-7)
+    assert solution.verified
+    # verification doesn't touch the plane
+    assert not tri.get_side().is_defined()
+
+
+def test_verify_repeatedly_then_define(make_triangle):
+    plane, tri = make_triangle()
+    for _ in range(2):
+        assert plane.solve_numeric(tri.get_side(), verify=True).verified
+    assert tri.get_side().define() is not None
+    assert math.isclose(float(tri.get_side().value), 8 * math.sqrt(3))
+
+
+def test_lengths_and_angle():
+    plane = Plane()
+    a, b, c = plane.point("a"), plane.point("b"), plane.point("c")
+    plane.segment(a, b, 3)
+    plane.segment(b, c, 4)
+    plane.angle(a, b, c, 90)
+    solution = plane.solve_numeric(plane.segment(a, c))
+    assert solution.converged
+    assert math.isclose(solution.value(plane.segment(a, c)), 5, rel_tol=1e-7)
@@ -0,0 +1,75 @@
+from geometry_solver.core.core import BaseObject
+from geometry_solver.models import polygons
+from geometry_solver.plane import Plane
+
+
+def test_primitives_are_interned():
+    plane = Plane()
+    p, q, r, s = (plane.point(name) for name in "pqrs")
+    assert plane.point("p") is p
+    assert plane.segment(p, q) is plane.segment(q, p)
+    angle = plane.angle(p, q, r)
+    assert angle is not None
+    assert plane.angle(r, q, p) is angle
+    assert plane.angle(q, p, r) is not angle
+
+    first = polygons.Triangle(plane, [p, q, r])
+    second = polygons.Triangle(plane, [q, r, s])
+    assert first.edges[1] is second.edges[0]
+    assert None not in first.angles
+    assert len(plane.segments) == 5
+
+
+def test_objects_are_compact_and_distinct():
+    first, second = Plane(), Plane()
+    x1, x2 = BaseObject("x", first), BaseObject("x", second)
+    assert x1 != x2 and hash(x1) != hash(x2)
+    assert str(x1 + x2) == "x + x"
+    assert not hasattr(x1, "__dict__")
+    assert x1._relations is None and x1._definitions is None
+    p, q = first.point("p"), first.point("q")
+    segment, angle = first.segment(q, p), first.angle(p, q, first.point("r"))
+    assert (segment.name, angle.name) == ("pq", "pqr")
+    assert segment.is_positive and angle.is_positive and x1.is_positive is None
+    assert segment != first.segment(p, first.point("r")) and segment.is_Symbol
+
+
+def test_point_names_are_per_plane_and_unbounded():
+    first, second = Plane(), Plane()
+    assert first.point("a") is not second.point("a")
+    names = [first.point_names.new_name() for _ in range(30)]
+    assert names[:2] == ["b", "c"] and names[-1] == "ae"
+    first.point("A1")
+    tri = polygons.RegularTriangle(
+        second, [second.point("a"), second.point("b"), second.point("c")]
+    )
+    tri.build_circumcircle()
+    assert tri.inscribed_in.center.name == "d"
+
+
+def test_polygon_parts_are_created_on_demand():
+    plane = Plane()
+    vertices = [plane.point(plane.point_names.new_name()) for _ in range(1000)]
+    polygon = polygons.Polygon(plane, vertices)
+    assert plane.segments == {} and plane.angles == {}
+    assert polygon.edge(-1) is plane.segment(vertices[0], vertices[-1])
+    assert polygon.angle(0) is plane.angle(vertices[1], vertices[0], vertices[-1])
+    assert len(plane.segments) == 1 and len(plane.angles) == 1
+    assert len(polygon.edges) == len(polygon.angles) == 1000
+    assert len(plane.segments) == 1000
+
+
+def test_perpendicular_bisectors():
+    plane = Plane()
+    tri = polygons.Triangle(plane, [plane.point(name) for name in "abc"])
+    bisector = tri.build_perpendicular_bisector(tri.edge(0))
+    assert bisector is tri.perpendicular_bisector(0)
+    assert {bisector.p1, bisector.p2} == {
+        plane.point("c"), plane.midpoint(tri.edge(0))
+    }
+    square = polygons.Polygon(plane, [plane.point(name) for name in "pqrs"])
+    bisector = square.perpendicular_bisector(1)
+    assert {bisector.p1, bisector.p2} == {
+        plane.midpoint(square.edge(1)), plane.midpoint(square.edge(3))
+    }
+    assert len(square.perpendicular_bisectors) == 4
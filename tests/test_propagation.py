@@ -0,0 +1,37 @@
+import sympy
+
+from geometry_solver.core.core import BaseDefinition, BaseObject
+from geometry_solver.plane import Plane
+
+
+def test_propagate_long_chain():
+    plane = Plane()
+    chain = [BaseObject(f"q{i}", plane) for i in range(2000)]
+    for prev, cur in zip(chain, chain[1:]):
+        cur.add_definition(
+            BaseDefinition(target=cur, expression=prev + 1),
+            reverse_definitions=False
+        )
+    chain[0].set_value(sympy.Integer(0))
+    defined = plane.propagate()
+    assert len(defined) == len(chain) - 1
+    assert chain[-1].value == len(chain) - 1
+    assert plane.propagate() == []
+
+
+def test_set_value_marks_only_readers_dirty():
+    plane = Plane()
+    a, b, c, d = (BaseObject(name, plane) for name in "abcd")
+    from_a = BaseDefinition(target=b, expression=2 * a)
+    from_c = BaseDefinition(target=d, expression=c + 1)
+    b.add_definition(from_a, reverse_definitions=False)
+    d.add_definition(from_c, reverse_definitions=False)
+    assert plane.dependents[a] == [from_a]
+    plane.propagate()
+    from_a.dirty = from_c.dirty = False
+
+    a.set_value(sympy.Integer(3))
+    assert from_a.dirty and not from_c.dirty
+    assert list(plane.dirty_definitions) == [from_a]
+    assert plane.propagate() == [b]
+    assert b.value == 6
@@ -0,0 +1,45 @@
+import pytest
+
+from geometry_solver.core import core
+from geometry_solver.plane import Plane
+
+
+def make_objects(plane, n):
+    return [core.BaseObject(f"x{i}", plane) for i in range(n)]
+
+
+def test_order_is_transitive_through_equality_classes():
+    plane = Plane()
+    a, b, c, d, e = make_objects(plane, 5)
+    a.as_new_relation < b
+    b.as_new_relation <= c
+    c.as_new_relation == d
+    e.as_new_relation >= d
+    assert (a < e) is True and (e > a) is True and (e <= a) is False
+    assert (b <= e) is True and (b < e) is None
+    assert (c <= d) is True and (c < d) is False
+    assert (a < a) is False
+    assert plane.relations.members(d) in ([c, d], [d, c])
+    with pytest.raises(ValueError):
+        e.as_new_relation < a
+    with pytest.raises(ValueError):
+        a.as_new_relation == c
+
+
+def test_long_chain_and_rollback():
+    plane = Plane()
+    objects = make_objects(plane, 3000)
+    for first, second in zip(objects, objects[1:]):
+        first.as_new_relation < second
+    assert (objects[0] < objects[-1]) is True
+    u, v = make_objects(plane, 2)
+    with plane.fork():
+        extra = core.BaseObject("y", plane)
+        objects[-1].as_new_relation < extra
+        assert (objects[0] < extra) is True
+        u.as_new_relation == v
+        v.as_new_relation < objects[0]
+        assert (u < objects[-1]) is True
+    assert (u < objects[-1]) is None and (u >= v) is None
+    assert (objects[0] < objects[-1]) is True
+    assert plane.relations.members(u) == [u]
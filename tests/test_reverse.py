@@ -0,0 +1,41 @@
+import sympy
+
+from geometry_solver.core import cache, core, search
+from geometry_solver.models import polygons
+from geometry_solver.plane import Plane
+
+
+def test_building_solves_nothing(monkeypatch):
+    calls = []
+    solve = sympy.solve
+    monkeypatch.setattr(sympy, "solve", lambda *args, **kwargs: calls.append(args) or solve(*args, **kwargs))
+    cache.solve_cache.clear()
+    plane = Plane()
+    tri = polygons.RegularTriangle(plane, [plane.point(name) for name in "abc"])
+    tri.build_circumcircle(radius=8)
+    assert not calls
+    tri.get_side().define()
+    assert abs(float(tri.get_side().value) ** 2 - 192) < 1e-9
+
+
+def test_reverse_definition_is_solved_once():
+    plane = Plane()
+    x, y = core.BaseObject("x", plane), core.BaseObject("y", plane, value=10)
+    y.add_definition(core.BaseDefinition(y, 2 * x + 4))
+    reverse = x.definitions[0]
+    assert isinstance(reverse, core.ReverseDefinition)
+    assert reverse.depends_on == {y} and reverse._solutions is None
+    x.define()
+    assert float(x.value) == 3 and reverse.solutions() is reverse.solutions()
+
+
+def test_solved_reverse_definition_is_cheaper():
+    plane = Plane()
+    x, y = core.BaseObject("x", plane), core.BaseObject("y", plane, value=10)
+    y.add_definition(core.BaseDefinition(y, x ** 3 + 4))
+    reverse = x.definitions[0]
+    cache.solve_cache.clear()
+    unsolved = search.definition_cost(reverse)
+    reverse.solutions()
+    assert cache.solve_cache.cost(reverse.equation, x) is not None
+    assert search.definition_cost(reverse) < unsolved
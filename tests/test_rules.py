@@ -0,0 +1,38 @@
+from geometry_solver.definitions import rules
+from geometry_solver.models import polygons
+from geometry_solver.plane import Plane
+
+
+def test_rules_are_matched_by_type_and_relation():
+    registry = rules.RuleRegistry()
+    fired = []
+
+    @registry.rule(polygons.Triangle, relation="created")
+    def any_triangle(figure):
+        fired.append(("triangle", figure.name))
+
+    @registry.rule(polygons.RegularTriangle, relation="inscribed_in")
+    def regular_inscribed(figure, circumcircle):
+        fired.append(("inscribed", circumcircle.name))
+
+    assert registry.matching(polygons.Polygon, "created") == ()
+    assert [rule.name for rule in registry.matching(
+        polygons.RegularTriangle, "created"
+    )] == ["any_triangle"]
+
+    plane = Plane(registry)
+    points = [plane.point(name) for name in "abcd"]
+    polygons.Polygon(plane, points)
+    tri = polygons.RegularTriangle(plane, points[:3])
+    tri.build_circumcircle()
+    assert fired == [("triangle", "abc"), ("inscribed", "oabc")]
+
+
+def test_library_defines_regular_triangle_circumradius():
+    plane = Plane()
+    tri = polygons.RegularTriangle(
+        plane, [plane.point("a"), plane.point("b"), plane.point("c")]
+    )
+    tri.build_circumcircle()
+    [definition] = tri.inscribed_in.definitions
+    assert definition.depends_on == {tri.get_side()}
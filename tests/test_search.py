@@ -0,0 +1,82 @@
+import itertools
+import types
+
+import sympy
+
+from geometry_solver.core import cache, core, search
+from geometry_solver.plane import Plane
+
+
+def count_solves(monkeypatch):
+    calls = []
+    solve = sympy.solve
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return solve(*args, **kwargs)
+
+    monkeypatch.setattr(sympy, "solve", counting)
+    cache.solve_cache.clear()
+    return calls
+
+
+def make_plane(length):
+    """
+    `target` is defined first through a long chain from `start`, then
+    directly through the given `shortcut`.
+    """
+    plane = Plane()
+    start = core.BaseObject("s", plane, value=2)
+    chain = [start]
+    for i in range(length):
+        link = core.BaseObject(f"l{i}", plane)
+        link.add_definition(core.BaseDefinition(link, chain[-1] + i), reverse_definitions=False)
+        chain.append(link)
+    shortcut = core.BaseObject("h", plane, value=5)
+    target = core.BaseObject("t", plane)
+    target.add_definition(core.BaseDefinition(target, chain[-1] * 3), reverse_definitions=False)
+    target.add_definition(core.BaseDefinition(target, shortcut ** 2), reverse_definitions=False)
+    return plane, target, chain
+
+
+def test_search_takes_cheap_path(monkeypatch):
+    plane, target, chain = make_plane(30)
+    calls = count_solves(monkeypatch)
+    derivation = search.derive(target)
+    assert not calls
+    assert [step.target for step in derivation.steps] == [target]
+    assert float(derivation.apply()) == 25 and target.derivation is target.definitions[1]
+    assert not chain[-1].is_defined()
+
+    # define() follows the first definition through the whole chain
+    plane, target, chain = make_plane(30)
+    target.define()
+    assert chain[-1].is_defined() and target.derivation is target.definitions[0]
+
+
+def test_limits_and_equalities():
+    plane, target, chain = make_plane(5)
+    target.definitions.pop()
+    assert search.derive(target, max_depth=3) is None
+    assert search.derive(target, budget=2) is None
+    derivation = search.derive(target)
+    assert [step.target for step in derivation.steps] == chain[1:] + [target]
+
+    other = core.BaseObject("o", plane)
+    other.as_new_relation == target
+    assert float(search.solve(other)) == (2 + 0 + 1 + 2 + 3 + 4) * 3
+
+
+def test_past_solve_times_raise_the_estimate(monkeypatch):
+    plane = Plane()
+    x, y = core.BaseObject("x", plane), core.BaseObject("y", plane, value=2)
+    definition = core.BaseDefinition(x, x ** 2 - y)
+    cache.solve_cache.clear()
+    fresh = search.definition_cost(definition)
+    # every solve takes half a second
+    clock = itertools.count(0.0, 0.5)
+    monkeypatch.setattr(cache, "time", types.SimpleNamespace(perf_counter=lambda: next(clock)))
+    cache.cached_solve(x ** 3 - y, x)
+    assert search.definition_cost(definition) == fresh + 0.5 * search.SOLVE_SECOND_COST
+    cache.cached_solve(definition.equation, x)
+    assert search.definition_cost(definition) < fresh
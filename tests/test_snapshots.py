@@ -0,0 +1,47 @@
+import sympy
+
+
+def test_fork_rolls_back_construction_and_values(make_triangle):
+    plane, tri = make_triangle(radius=None)
+    objects = list(plane.objects)
+    with plane.fork():
+        tri.build_circumcircle(radius=8)
+        tri.edges[0].as_new_relation == tri.edges[1]
+        assert tri.get_side().define() is not None
+        assert len(plane.trail) > 0
+    assert plane.objects == objects and plane.trail is None
+    assert tri.inscribed_in is None and not tri.get_side().is_defined()
+    assert tri.get_side().definitions == [] and tri.edges[1]._relations is None
+    assert "d" not in plane.points
+
+    # the same hypothesis gives the same result after a rollback
+    tri.build_circumcircle(radius=8)
+    assert tri.inscribed_in.center.name == "d"
+    assert tri.get_side().define() is not None
+
+
+def test_restore_same_snapshot_repeatedly(make_triangle):
+    plane, tri = make_triangle(radius=None)
+    tri.build_circumcircle()
+    side, radius = tri.get_side(), tri.inscribed_in
+    snapshot = plane.snapshot()
+    for value in (3, 6):
+        radius.set_value(sympy.Integer(value))
+        plane.propagate()
+        assert side.value == value * sympy.sqrt(3)
+        plane.restore(snapshot)
+        assert not side.is_defined() and not radius.is_defined()
+    plane.release(snapshot)
+    radius.set_value(sympy.Integer(1))
+    assert plane.propagate() == [side]
+
+
+def test_define_in_consecutive_forks(make_triangle):
+    plane, tri = make_triangle(radius=None)
+    radius = tri.build_circumcircle()
+    for value in (3, 6):
+        with plane.fork():
+            radius.set_value(value)
+            assert tri.get_side().define() is not None
+            assert tri.get_side().value == value * sympy.sqrt(3)
+    assert all(definition.dirty for definition in tri.get_side().definitions)
@@ -0,0 +1,71 @@
+import ast
+import os
+import subprocess
+import sys
+
+import geometry_solver
+
+SOURCE = os.path.dirname(geometry_solver.__file__)
+
+
+def module_imports(path):
+    """
+    Modules imported when the module at `path` is imported: top level
+    statements only, `if typing.TYPE_CHECKING` blocks excluded.
+    """
+    tree = ast.parse(open(path).read())
+    statements = list(tree.body)
+    while statements:
+        node = statements.pop()
+        if isinstance(node, ast.If) and "TYPE_CHECKING" not in ast.unparse(node.test):
+            statements.extend(node.body + node.orelse)
+        elif isinstance(node, ast.Import):
+            yield from (alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            for alias in node.names:
+                yield f"{node.module}.{alias.name}"
+                yield node.module
+
+
+def test_import_graph_is_acyclic():
+    graph = {}
+    for directory, _, files in os.walk(SOURCE):
+        for file in files:
+            if not file.endswith(".py"):
+                continue
+            path = os.path.join(directory, file)
+            name = os.path.relpath(path, os.path.dirname(SOURCE))[:-3].replace(os.sep, ".")
+            name = name.removesuffix(".__init__")
+            graph[name] = set(module_imports(path))
+    for name in graph:
+        graph[name] = {other for other in graph[name] if other in graph and other != name}
+    visiting, done = set(), set()
+
+    def visit(name, path):
+        assert name not in visiting, f"import cycle: {' -> '.join(path + [name])}"
+        if name in done:
+            return
+        visiting.add(name)
+        for other in graph[name]:
+            visit(other, path + [name])
+        visiting.discard(name)
+        done.add(name)
+
+    for name in graph:
+        visit(name, [])
+
+
+def test_plane_does_not_load_heavy_dependencies():
+    code = (
+        "import sys, geometry_solver\n"
+        "plane = geometry_solver.Plane()\n"
+        "assert 'sympy' not in sys.modules and 'numpy' not in sys.modules\n"
+        "assert plane.point('a') is geometry_solver.Plane.point(plane, 'a')\n"
+        "assert 'sympy' in sys.modules and 'numpy' not in sys.modules\n"
+        "assert set(geometry_solver.__all__) <= set(dir(geometry_solver))\n"
+        "assert geometry_solver.RegularTriangle.__name__ == 'RegularTriangle'\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code], check=True,
+        env=dict(os.environ, PYTHONPATH=os.path.dirname(SOURCE))
+    )
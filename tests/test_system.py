@@ -0,0 +1,52 @@
+import sympy
+
+from geometry_solver.core.core import BaseDefinition, BaseObject
+from geometry_solver.models import polygons
+from geometry_solver.plane import Plane
+
+
+def test_simultaneous_definitions_form_one_block():
+    plane = Plane()
+    x, y, z = (BaseObject(name, plane) for name in "xyz")
+    # neither definition can be evaluated on its own
+    x.add_definition(BaseDefinition(x, 3 - y), reverse_definitions=False)
+    y.add_definition(BaseDefinition(y, x - 1), reverse_definitions=False)
+    z.add_definition(BaseDefinition(z, x * y), reverse_definitions=False)
+    solution = plane.solve_all()
+    assert (x.value, y.value, z.value) == (2, 1, 2)
+    assert solution.blocks == 2
+
+
+def test_regular_triangle_side_and_equal_edges():
+    plane = Plane()
+    tri = polygons.RegularTriangle(
+        plane, [plane.point("a"), plane.point("b"), plane.point("c")]
+    )
+    tri.edges[0].as_new_relation == tri.edges[1]
+    tri.build_circumcircle(radius=8)
+    plane.solve_all()
+    assert abs(tri.edges[1].value - 8 * sympy.sqrt(3)) < 1e-9
+
+
+def test_other_roots_are_kept_as_candidates():
+    plane = Plane()
+    x, y, z = (BaseObject(name, plane) for name in "xyz")
+    x.add_definition(BaseDefinition(x, (x ** 2 + 6) / 5), reverse_definitions=False)
+    # y and z only together: y + z = 5, y * z = 6
+    y.add_definition(BaseDefinition(y, 5 - z), reverse_definitions=False)
+    z.add_definition(BaseDefinition(z, 6 / y), reverse_definitions=False)
+    plane.solve_all()
+    assert x.value == 2 and x.candidates == (2, 3)
+    assert set(y.candidates) == {2, 3} and y.value == y.candidates[0]
+
+
+def test_linear_blocks_respect_the_domain():
+    plane = Plane()
+    a, b, c, d = (plane.point(name) for name in "abcd")
+    x, y = plane.segment(a, b), plane.segment(c, d)
+    # x + y = 1, x - y = 3: y would be -1
+    x.add_definition(BaseDefinition(x, 1 - y), reverse_definitions=False)
+    y.add_definition(BaseDefinition(y, x - 3), reverse_definitions=False)
+    solution = plane.solve_all()
+    assert x.value == 2 and not y.is_defined()
+    assert y not in solution.values
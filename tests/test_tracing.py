@@ -0,0 +1,43 @@
+import json
+
+from geometry_solver.core import core, tracing
+from geometry_solver.models import polygons
+from geometry_solver.plane import Plane
+
+
+def test_trace_define(tmp_path):
+    plane = Plane()
+    tri = polygons.RegularTriangle(
+        plane, [plane.point("a"), plane.point("b"), plane.point("c")]
+    )
+    tri.build_circumcircle(radius=8)
+    with tracing.trace() as tracer:
+        tri.get_side().define()
+    counts = tracer.counts()
+    assert counts["BaseObject.define"] == 1
+    assert counts["BaseDefinition.define"] == 1
+    assert counts["expression_as_constant"] == 1
+
+    [row] = tracer.summary(plane)
+    assert row["calls"] == 1 and row["definition"].startswith("ab = ")
+    assert tracer.summary(Plane()) == []
+
+    path = tmp_path / "trace.json"
+    tracer.export_chrome(str(path))
+    events = json.loads(path.read_text())["traceEvents"]
+    assert {event["ph"] for event in events} == {"X"}
+    # tracing is off outside of the context
+    tri.get_side().define()
+    assert len(tracer.spans) == len(events)
+
+
+def test_trace_definition_without_admissible_root():
+    plane = Plane()
+    a, b, c, d = (plane.point(name) for name in "abcd")
+    x, y = plane.segment(a, b), plane.segment(c, d)
+    x.add_definition(core.BaseDefinition(x, -y))
+    [reverse] = y.definitions
+    with tracing.trace() as tracer:
+        assert y.define() is None
+    assert reverse.solved_expression() is None
+    assert tracer.summary(plane)[0]["definition"] == "cd = solve(ab = -cd)"
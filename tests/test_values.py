@@ -0,0 +1,51 @@
+import time
+
+import pytest
+import sympy
+
+from geometry_solver.core import core, values
+from geometry_solver.core.values import Radical
+from geometry_solver.models import polygons
+from geometry_solver.plane import Plane
+
+
+def test_radical_arithmetic_is_exact():
+    a = Radical.sqrt_of(2) + Radical.sqrt_of(3) + 1
+    assert (1 / a) * a == 1
+    assert Radical.sqrt_of(2) * Radical.sqrt_of(6) == 2 * Radical.sqrt_of(3)
+    assert Radical.sqrt_of(12) ** 2 == 12 and Radical.sqrt_of(sympy.Rational(1, 4)) == sympy.Rational(1, 2)
+    assert 4.14 < a < 4.15 and a == 1 + sympy.sqrt(2) + sympy.sqrt(3)
+    assert (Radical.sqrt_of(2) - Radical.sqrt_of(2)).sign() == 0
+
+
+def test_evaluate_falls_back_to_sympy():
+    x = sympy.Symbol("x")
+    assert values.evaluate(x ** 2 / 2 + sympy.sqrt(3) * x, {x: Radical.sqrt_of(3)}) == sympy.Rational(9, 2)
+    assert values.evaluate(sympy.sin(x), {x: Radical.rational(30)}) is None
+    assert values.evaluate(x * 2, {x: sympy.Float(0.5)}) is None
+
+
+def test_given_values_stay_exact():
+    plane = Plane()
+    side = core.BaseObject("a", plane, value=8 * sympy.sqrt(3))
+    half = core.BaseObject("h", plane, value=0.5)
+    height = core.BaseObject("t", plane)
+    height.add_definition(core.BaseDefinition(height, side * sympy.sqrt(3) * half))
+    height.define()
+    assert isinstance(height.value, Radical) and height.value == 12
+
+
+def test_float_lengths_read_as_written():
+    plane = Plane()
+    tri = polygons.RegularTriangle(plane, [plane.point(name) for name in "abc"], side_length=0.1)
+    assert tri.get_side().value == 0.1 and tri.get_side().value == sympy.Rational(1, 10)
+    assert Radical.rational(values.from_float(0.3)) < 0.30000000000000004
+
+
+def test_float_radicands_fall_back_quickly():
+    start = time.perf_counter()
+    for value in (2.718281828459045, 3.141592653589793):
+        with pytest.raises(values.NotRadical):
+            Radical.sqrt_of(values.from_float(value))
+        assert values.evaluate(sympy.sqrt(sympy.Symbol("x")), {sympy.Symbol("x"): values.exact(value)}) is None
+    assert time.perf_counter() - start < 1